@@ -2,7 +2,8 @@
 
 Warum diese Datei?
 - In Blender wird oft wiederholt "Run Script" gedrückt.
-- Damit Änderungen in Modulen sofort aktiv sind, laden wir die Module per importlib.reload neu.
+- Damit Änderungen in Modulen sofort aktiv sind, laden wir geänderte Module (und Module, die sie
+  importieren) per importlib.reload neu; nur davon betroffene Builder werden neu gebaut.
 - Zusätzlich stellen wir sicher, dass der Projektordner in ``sys.path`` liegt,
   damit ``scene_project`` sowohl aus der GUI als auch per CLI zuverlässig importiert wird.
 """
@@ -45,8 +46,8 @@ def _ensure_project_root_in_syspath() -> Path:
     return project_root
 
 
-def _read_scene_name_from_argv(default: str = "forest") -> str:
-    """Liest den gewünschten Szenennamen aus Blender/Python-Argumenten.
+def _read_arg_from_argv(name: str, default: str | None = None) -> str | None:
+    """Liest den Wert einer Option ``--<name>`` aus Blender/Python-Argumenten.
 
     Unterstützte Formen:
     - blender ... --python run_in_blender.py -- --scene city
@@ -58,30 +59,87 @@ def _read_scene_name_from_argv(default: str = "forest") -> str:
         return default
 
     user_args = argv[argv.index("--") + 1 :]
+    option = f"--{name}"
     for idx, arg in enumerate(user_args):
-        if arg == "--scene" and idx + 1 < len(user_args):
-            return user_args[idx + 1].strip().lower()
-        if arg.startswith("--scene="):
-            return arg.split("=", 1)[1].strip().lower()
+        if arg == option and idx + 1 < len(user_args):
+            return user_args[idx + 1].strip()
+        if arg.startswith(f"{option}="):
+            return arg.split("=", 1)[1].strip()
 
     return default
 
 
+def _has_flag_in_argv(name: str) -> bool:
+    """Prüft, ob ein Schalter ``--<name>`` hinter ``--`` übergeben wurde."""
+    argv = sys.argv
+    return "--" in argv and f"--{name}" in argv[argv.index("--") + 1 :]
+
+
+def _read_scene_name_from_argv(default: str = "forest") -> str:
+    """Liest den gewünschten Szenennamen (``--scene``) aus Blender/Python-Argumenten."""
+    return _read_arg_from_argv("scene", default).lower()
+
+
 _ensure_project_root_in_syspath()
 
-import scene_project.camera as camera
-import scene_project.config as config
-import scene_project.lights as lights
-import scene_project.main as main
-import scene_project.materials as materials
-import scene_project.objects as objects
+if "scene_project.progressive" in sys.modules:
+    # Erneutes "Run Script" während eines progressiven Builds: den alten Build vor dem Neuladen beenden.
+    sys.modules["scene_project.progressive"].cancel_build()
 
-# Module in kontrollierter Reihenfolge neu laden (Dependencies zuerst)
-for module in (materials, objects, lights, camera, config, main):
-    importlib.reload(module)
+import scene_project.hot_reload as hot_reload
 
-selected_scene = _read_scene_name_from_argv(default="forest")
-print(f"[run_in_blender] Selected scene: {selected_scene}")
+# Nur geänderte Module und ihre Importeure neu laden (Dependencies zuerst, siehe hot_reload).
+importlib.reload(hot_reload)
+reloaded = hot_reload.reload_changed()
 
-# Szene bauen
-main.build_scene(config.SceneConfig(scene_name=selected_scene))
+import bpy
+
+import scene_project.batch_render as batch_render
+import scene_project.benchmark as benchmark
+import scene_project.build_client as build_client
+import scene_project.build_server as build_server
+import scene_project.config as config
+import scene_project.main as main
+import scene_project.progressive as progressive
+import scene_project.sweep as sweep
+
+if reloaded.changed:
+    print(f"[run_in_blender] Geändert: {', '.join(reloaded.changed)}; neu geladen: {', '.join(reloaded.reloaded)}")
+
+worker_job = _read_arg_from_argv("worker")
+if worker_job:
+    # Hintergrund-Prozess von ``parallel``: nur die Builder des Jobs bauen und als .blend ablegen.
+    main.build_scene_part(worker_job)
+elif _read_arg_from_argv("sweep-worker"):
+    # Hintergrund-Prozess von ``sweep``: Varianten bauen, als .blend speichern, optional rendern.
+    sweep.run_job(_read_arg_from_argv("sweep-worker"))
+elif _has_flag_in_argv("serve"):
+    # Langlebiger Build-Server: Befehle per scene_project.build_client, bis "shutdown" kommt.
+    build_server.serve(port=int(_read_arg_from_argv("port", str(build_client.DEFAULT_PORT))))
+elif _has_flag_in_argv("benchmark"):
+    # Skalierungs-Benchmark mit bpy; übrige Argumente wie bei ``python -m scene_project.benchmark``.
+    user_args = [arg for arg in sys.argv[sys.argv.index("--") + 1 :] if arg != "--benchmark"]
+    benchmark.main(["--mode", "bpy", *user_args])
+elif _has_flag_in_argv("batch"):
+    # Batch-Render-Queue: Manifest-Varianten mit einer geladenen Szene rendern (``--batch manifest.json``).
+    user_args = [arg for arg in sys.argv[sys.argv.index("--") + 1 :] if arg != "--batch"]
+    batch_render.main(user_args)
+elif _has_flag_in_argv("sweep"):
+    # Parameter-Sweep: Varianten aus einer Spec in parallelen Blender-Prozessen (``--sweep spec.json``).
+    user_args = [arg for arg in sys.argv[sys.argv.index("--") + 1 :] if arg != "--sweep"]
+    sweep.main(user_args)
+else:
+    selected_scene = _read_scene_name_from_argv(default="forest")
+    workers = int(_read_arg_from_argv("workers", "0"))
+    print(f"[run_in_blender] Selected scene: {selected_scene}")
+
+    # Szene bauen; Builder mit geändertem Code unabhängig von der Config neu.
+    scene_config = config.SceneConfig(scene_name=selected_scene, parallel_workers=workers)
+    rebuild = main.code_affected_builders(scene_config, reloaded.changed)
+    if reloaded.changed:
+        print(f"[run_in_blender] Betroffene Builder: {', '.join(rebuild) or 'keine'}")
+    if bpy.app.background:
+        main.build_scene(scene_config, rebuild=rebuild)
+    else:
+        # In der Oberfläche zeitgeteilt bauen: UI bleibt bedienbar, Objekte erscheinen nach und nach.
+        progressive.start_build(scene_config, rebuild=rebuild)
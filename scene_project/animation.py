@@ -0,0 +1,72 @@
+"""Bulk-Keyframes für Objekt-Animationen.
+
+Statt ``keyframe_insert`` pro Frame und Objekt (Millionen Python-Aufrufe bei hunderten
+Drohnen und 600 Frames) bekommt jeder Kanal seine Keyframes in einem Rutsch:
+``keyframe_points.add(n)`` und ein ``foreach_set`` für Frames und Werte. Die Bahnen selbst
+kommen aus ``scene_project.flight``.
+"""
+
+from __future__ import annotations
+
+import bpy
+import numpy as np
+
+from scene_project.datablocks import tag_generated
+from scene_project.flight import decimate, drone_paths
+from scene_project.profiler import profiled
+
+# Index von "LINEAR" im Interpolations-Enum der Keyframes (foreach_set erwartet Enum-Indizes).
+_LINEAR = bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items.find("LINEAR")
+
+
+def _location_fcurve(action, obj, index: int):
+    if hasattr(action, "fcurve_ensure_for_datablock"):
+        # Ab Blender 4.4 (geschichtete Actions) hängen F-Curves an Slots.
+        return action.fcurve_ensure_for_datablock(obj, "location", index=index)
+    return action.fcurves.new("location", index=index)
+
+
+def write_location_keys(obj, frames: np.ndarray, positions: np.ndarray, tolerance: float = 0.0) -> int:
+    """Setzt ``positions`` ``(n, 3)`` zu ``frames`` ``(n,)`` als lineare Location-Keyframes.
+
+    Pro Kanal werden die Keyframes mit ``tolerance`` ausgedünnt (siehe ``flight.decimate``).
+
+    Returns:
+        Anzahl geschriebener Keyframes (alle Kanäle).
+    """
+    obj.animation_data_create()
+    action = tag_generated(bpy.data.actions.new(f"{obj.name}_Flight"))
+    obj.animation_data.action = action
+
+    written = 0
+    for index in range(3):
+        keep = decimate(positions[:, index], tolerance)
+        co = np.column_stack((frames[keep], positions[keep, index])).astype(np.float32)
+        fcurve = _location_fcurve(action, obj, index)
+        fcurve.keyframe_points.add(len(keep))
+        fcurve.keyframe_points.foreach_set("co", co.ravel())
+        fcurve.keyframe_points.foreach_set("interpolation", np.full(len(keep), _LINEAR, dtype=np.int32))
+        fcurve.update()
+        written += len(keep)
+    return written
+
+
+@profiled
+def animate_drones(
+    objects,
+    ring_radius: float,
+    frames: int = 600,
+    laps: int = 1,
+    seed: int = 23,
+    clearance: float = 0.8,
+    tolerance: float = 0.01,
+) -> dict[str, int]:
+    """Lässt ``objects`` in Höhenbändern um den Skyway-Ring fliegen (Frames ``1 … frames + 1``)."""
+    objects = sorted(objects, key=lambda obj: obj.name)
+    if not objects:
+        return {"drones": 0, "bands": 0, "keyframes": 0, "samples": 0}
+
+    paths, bands = drone_paths(len(objects), ring_radius, frames, laps=laps, seed=seed, clearance=clearance)
+    frame_numbers = np.arange(1, frames + 2, dtype=np.float64)
+    keyframes = sum(write_location_keys(obj, frame_numbers, path, tolerance) for obj, path in zip(objects, paths))
+    return {"drones": len(objects), "bands": bands, "keyframes": keyframes, "samples": paths.size}
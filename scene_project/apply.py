@@ -0,0 +1,166 @@
+"""Materialisiert einen ``ScenePlan`` in Blender."""
+
+from __future__ import annotations
+
+from collections import Counter
+
+import numpy as np
+
+from scene_project.datablocks import ensure_collection
+from scene_project.geometry import (
+    add_primitive,
+    build_primitive_mesh,
+    get_geometry_backend,
+    get_prototype_mesh,
+    link_object,
+)
+from scene_project.instancing import add_point_instances
+from scene_project.materials import assign_material, resolve_material
+from scene_project.plan import ScenePlan
+from scene_project.profiler import section
+
+# Objekte pro Schritt von ``iter_apply_plan``: klein genug für ein Frame-Budget von ~16 ms.
+APPLY_BATCH = 32
+
+
+def _instance_groups(plan: ScenePlan, materials: list, instance_collections) -> dict[tuple, np.ndarray]:
+    """Indizes geteilter Primitives in ``instance_collections``, gruppiert nach (Collection, Primitive, Material)."""
+    shared = np.array([spec.shared for spec in plan.primitives.values], dtype=bool)
+    wanted = np.array([name in instance_collections for name in plan.collections.values], dtype=bool)
+    prim_ids = np.frombuffer(plan.primitive_ids, dtype=np.uint32)
+    collection_ids = np.frombuffer(plan.collection_ids, dtype=np.uint32)
+    mask = shared[prim_ids] & wanted[collection_ids]
+    if not mask.any():
+        return {}
+
+    # Varianten mit demselben aufgelösten Material (Modus ``attributes``) teilen sich ein Instanz-Objekt.
+    canonical: dict[str, int] = {}
+    material_keys = np.array(
+        [canonical.setdefault(mat.name, mat_id) for mat_id, mat in enumerate(materials)] + [ScenePlan.NO_MATERIAL],
+        dtype=np.int64,
+    )
+    mat_ids = np.frombuffer(plan.material_ids, dtype=np.int32)
+    indices = np.flatnonzero(mask)
+    keys = np.column_stack((collection_ids[indices], prim_ids[indices], material_keys[mat_ids[indices]]))
+    unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+    order = np.argsort(inverse.ravel(), kind="stable")
+    bounds = np.cumsum(np.bincount(inverse.ravel(), minlength=len(unique)))[:-1]
+    groups = {tuple(int(v) for v in key): group for key, group in zip(unique, np.split(indices[order], bounds))}
+    # Nach erstem Vorkommen sortiert: Namen hängen nicht von Tabellen-IDs ab (seriell = parallel).
+    return dict(sorted(groups.items(), key=lambda item: item[1][0]))
+
+
+def _point_attributes(plan: ScenePlan, members: np.ndarray, attributes: list) -> dict[str, np.ndarray]:
+    """Werte der Varianten-Attribute pro Punkt (Material-Modus ``attributes``)."""
+    mat_ids = np.frombuffer(plan.material_ids, dtype=np.int32)[members]
+    per_material = {mat_id: attributes[mat_id] for mat_id in np.unique(mat_ids) if mat_id >= 0 and attributes[mat_id]}
+    if not per_material:
+        return {}
+    keys = next(iter(per_material.values())).keys()
+    return {key: np.array([per_material[mat_id][key] for mat_id in mat_ids], dtype=np.float32) for key in keys}
+
+
+def apply_plan(plan: ScenePlan, collection=None, instance_collections=()) -> list:
+    """Erzeugt alle Objekte des Plans am Stück (siehe ``iter_apply_plan``)."""
+    created = []
+    for _ in iter_apply_plan(plan, collection, instance_collections, created):
+        pass
+    return created
+
+
+def iter_apply_plan(plan: ScenePlan, collection=None, instance_collections=(), created: list | None = None):
+    """Erzeugt alle Objekte des Plans schrittweise in Plan-Reihenfolge.
+
+    Nach je ``APPLY_BATCH`` Objekten (und nach jedem Instanz-Objekt) liefert der Generator die
+    Zahl der bisher erzeugten Plan-Objekte, damit zeitgeteilte Builds dazwischen pausieren können.
+
+    Materialien, Collections und Prototyp-Meshes werden vorab einmal pro Tabelleneintrag
+    aufgelöst; die Schleife über die Objekte legt danach nur noch Objekte an (im Material-Modus
+    ``attributes`` samt den Farb-/Stärke-Attributen ihrer Variante).
+
+    Im Geometrie-Backend ``instances`` werden geteilte Primitives in ``instance_collections``
+    nicht als Einzelobjekte angelegt, sondern als Punkt-Instanzen (siehe ``scene_project.instancing``);
+    diese Instanz-Objekte folgen in der Rückgabe auf die Einzelobjekte.
+
+    Args:
+        plan: Der anzuwendende Plan.
+        collection: Optionale Ziel-Collection für alle Objekte (statt der Plan-Collections).
+        instance_collections: Collection-Namen, deren Props instanziert werden dürfen.
+        created: Optionale Liste, an die die erzeugten Objekte angehängt werden.
+    """
+    # Abschnitte enden vor jedem ``yield``: Pausen zeitgeteilter Builds zählen nicht mit.
+    with section("apply.resolve"):
+        resolved = [resolve_material(spec.factory, spec.name, **dict(spec.params)) for spec in plan.materials.values]
+        materials = [mat for mat, _ in resolved]
+        attributes = [attrs for _, attrs in resolved]
+        collections = [collection or ensure_collection(name) for name in plan.collections.values]
+
+        backend = get_geometry_backend()
+        use_data = backend in ("data", "instances")
+        groups = _instance_groups(plan, materials, instance_collections) if backend == "instances" else {}
+        instanced = np.zeros(len(plan), dtype=bool)
+        for members in groups.values():
+            instanced[members] = True
+
+        prototypes = {}
+        if use_data:
+            for prim_id, count in Counter(plan.primitive_ids).items():
+                spec = plan.primitives[prim_id]
+                if spec.shared:
+                    prototypes[prim_id] = get_prototype_mesh(spec.kind, instances=count, **dict(spec.params))
+
+    created = [] if created is None else created
+    done = 0
+    indices = np.flatnonzero(~instanced).tolist()
+    for start in range(0, len(indices), APPLY_BATCH):
+        batch = indices[start : start + APPLY_BATCH]
+        with section("apply.objects", datablocks=False):
+            for index in batch:
+                prim_id = plan.primitive_ids[index]
+                spec = plan.primitives[prim_id]
+                name = plan.name(index)
+                location, rotation, scale = plan.transform(index)
+                target = collections[plan.collection_ids[index]]
+
+                if use_data:
+                    mesh = prototypes.get(prim_id) or build_primitive_mesh(spec.kind, name, **dict(spec.params))
+                    obj = link_object(name, mesh, location=location, rotation=rotation, scale=scale, collection=target)
+                else:
+                    obj = add_primitive(
+                        spec.kind,
+                        name,
+                        location=location,
+                        rotation=rotation,
+                        scale=scale,
+                        collection=target,
+                        **dict(spec.params),
+                    )
+
+                mat_id = plan.material_ids[index]
+                if mat_id != ScenePlan.NO_MATERIAL:
+                    assign_material(obj, materials[mat_id])
+                    for key, value in (attributes[mat_id] or {}).items():
+                        obj[key] = value
+                created.append(obj)
+        done += len(batch)
+        yield done
+
+    transforms = plan.transform_array()
+    serials: Counter = Counter()
+    for (collection_id, prim_id, mat_key), members in groups.items():
+        target = collections[collection_id]
+        serials[target.name] += 1
+        created.append(
+            add_point_instances(
+                f"{target.name}_Instances_{serials[target.name]:02d}",
+                prototypes[prim_id],
+                materials[mat_key] if mat_key != ScenePlan.NO_MATERIAL else None,
+                target,
+                transforms[members, 0:3],
+                transforms[members, 3:6],
+                transforms[members, 6:9],
+                attributes=_point_attributes(plan, members, attributes),
+            )
+        )
+        done += len(members)
+        yield done
@@ -0,0 +1,177 @@
+"""Batch-Render-Queue: viele Varianten in einem Blender-Prozess rendern.
+
+Ein Manifest (JSON) beschreibt Basis-Überschreibungen und Varianten::
+
+    {
+      "scene": "city",
+      "overrides": {"render_profile": "preview"},
+      "output_dir": "renders/lookdev",
+      "variants": [
+        {"name": "seed1", "overrides": {"scene_seed": 1}},
+        {"name": "seed1_cam_b", "overrides": {"scene_seed": 1, "city_camera_location": [0, -30, 12]}},
+        {"name": "seed1_neon", "overrides": {"scene_seed": 1}, "materials": {"M_Holo_Panel": {"Strength": 30}}}
+      ]
+    }
+
+Die Szene bleibt zwischen den Renderings im Speicher. Varianten werden nach den Feldern
+gruppiert, die Builder der Szene neu bauen (``main.rebuild_fields``); Felder, die die Szene
+gar nicht liest, trennen keine Gruppen. Pro Gruppe läuft ein inkrementeller Build, danach
+ändern sich nur Sonne, Kamera und Render-Profil (``SceneBuilder.update``) sowie
+Material-Inputs (nach dem Rendern zurückgesetzt).
+
+Start::
+
+    blender --background --factory-startup --python run_in_blender.py -- --batch lookdev.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import bpy
+
+from scene_project.config import SceneConfig
+from scene_project.main import build_scene, rebuild_fields, scene_builders
+from scene_project.render import render_still
+
+REPORT_FILE = "batch_report.json"
+
+
+def load_manifest(path: str | Path) -> dict:
+    """Liest und prüft ein Manifest; Varianten ohne Namen heißen ``variant_000``, ``variant_001``, ..."""
+    path = Path(path)
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    variants = manifest.get("variants")
+    if not variants:
+        raise ValueError(f"Manifest '{path}' enthält keine Varianten")
+
+    names = set()
+    for index, variant in enumerate(variants):
+        name = variant.setdefault("name", f"variant_{index:03d}")
+        if name in names:
+            raise ValueError(f"Doppelter Varianten-Name '{name}' in '{path}'")
+        names.add(name)
+    output_dir = Path(manifest.get("output_dir") or path.stem)
+    manifest["output_dir"] = str(output_dir if output_dir.is_absolute() else path.parent / output_dir)
+    return manifest
+
+
+def variant_config(manifest: dict, variant: dict) -> SceneConfig:
+    overrides = {**manifest.get("overrides", {}), **variant.get("overrides", {})}
+    cfg = SceneConfig.from_overrides(manifest.get("scene") or "forest", overrides)
+    # Die Queue lebt davon, dass Folge-Builds nur Geändertes anfassen.
+    return replace(cfg, incremental_build=True)
+
+
+def group_variants(manifest: dict) -> list[list[tuple[dict, SceneConfig]]]:
+    """Varianten mit gleichen Neubau-Feldern zusammenfassen (Reihenfolge des ersten Auftretens)."""
+    groups: dict[str, list] = {}
+    for variant in manifest["variants"]:
+        cfg = variant_config(manifest, variant)
+        values = cfg.to_dict()
+        # Auch die Builder selbst zählen: im Kachel-Modus hängen die geladenen Kacheln an der Kamera.
+        builders = [builder.name for builder in scene_builders(cfg)]
+        rebuild = {name: values[name] for name in rebuild_fields(cfg)}
+        key = json.dumps({"scene": values["scene_name"], "builders": builders, **rebuild}, sort_keys=True)
+        groups.setdefault(key, []).append((variant, cfg))
+    return list(groups.values())
+
+
+def apply_material_params(params: dict) -> list[tuple]:
+    """Setzt Node-Inputs (``{"Material": {"Input": wert}}``) und liefert die alten Werte zum Zurücksetzen.
+
+    Gesetzt wird jeder unverbundene Input dieses Namens im Node-Tree des Materials.
+    """
+    saved = []
+    for material_name, inputs in params.items():
+        mat = bpy.data.materials.get(material_name)
+        if mat is None or not mat.use_nodes:
+            raise ValueError(f"Unbekanntes Material '{material_name}'. Erlaubt: Node-Materialien der Szene")
+        if mat.library is not None:
+            raise ValueError(f"Material '{material_name}' ist verlinkt (build_cache_mode='link') und schreibgeschützt")
+        for input_name, value in inputs.items():
+            sockets = [
+                socket
+                for node in mat.node_tree.nodes
+                if (socket := node.inputs.get(input_name)) is not None and not socket.is_linked
+            ]
+            if not sockets:
+                raise ValueError(f"Unbekannter Material-Input '{input_name}' an '{material_name}'")
+            for socket in sockets:
+                old = socket.default_value
+                old = tuple(old) if hasattr(old, "__len__") else old
+                if isinstance(value, (list, tuple)):
+                    # RGB ohne Alpha ergänzen.
+                    value = tuple(value) + (1.0,) * (len(old) - len(value))
+                saved.append((socket, old))
+                socket.default_value = value
+    return saved
+
+
+def restore_material_params(saved: list[tuple]):
+    for socket, old in reversed(saved):
+        socket.default_value = old
+
+
+def render_batch(manifest: dict) -> dict:
+    """Rendert alle Varianten nach ``output_dir`` und schreibt ``batch_report.json``."""
+    output_dir = Path(manifest["output_dir"]).resolve()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    groups = group_variants(manifest)
+    total = sum(len(group) for group in groups)
+    print(f"[scene_project] Batch: {total} Varianten in {len(groups)} Gruppen (Neubau nur zwischen Gruppen).")
+
+    renders = []
+    started = time.perf_counter()
+    for group_index, group in enumerate(groups):
+        for variant, cfg in group:
+            build_started = time.perf_counter()
+            build_scene(cfg)
+            build_seconds = time.perf_counter() - build_started
+
+            saved = apply_material_params(variant.get("materials", {}))
+            try:
+                render = render_still(output_dir / f"{variant['name']}.png")
+            finally:
+                restore_material_params(saved)
+            renders.append(
+                {"name": variant["name"], "group": group_index, "build_seconds": build_seconds, **render}
+            )
+            print(f"[scene_project] Batch {len(renders)}/{total}: {variant['name']}.", flush=True)
+
+    wall = time.perf_counter() - started
+    report = {
+        "scene": manifest.get("scene") or "forest",
+        "blender": bpy.app.version_string,
+        "groups": len(groups),
+        "renders": renders,
+        "wall_seconds": wall,
+        "build_seconds": sum(render["build_seconds"] for render in renders),
+        "render_seconds": sum(render["render_seconds"] for render in renders),
+        "renders_per_minute": 60.0 * len(renders) / max(wall, 1e-9),
+    }
+    path = output_dir / REPORT_FILE
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(
+        f"[scene_project] Batch fertig: {len(renders)} Renderings in {wall:.1f} s "
+        f"({report['renders_per_minute']:.1f}/min; Build {report['build_seconds']:.1f} s, "
+        f"Render {report['render_seconds']:.1f} s) -> {path}"
+    )
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Batch-Render-Queue aus einem Varianten-Manifest.")
+    parser.add_argument("manifest", help="Manifest-JSON mit 'variants'")
+    parser.add_argument("--output-dir", default=None, help="überschreibt 'output_dir' aus dem Manifest")
+    args = parser.parse_args(argv)
+
+    manifest = load_manifest(args.manifest)
+    if args.output_dir:
+        manifest["output_dir"] = args.output_dir
+    render_batch(manifest)
+    return 0
@@ -0,0 +1,238 @@
+"""Skalierungs-Benchmark für die Szenen-Builder.
+
+Sweep über ``tree_count``, ``rock_count`` und ``bush_count`` (10 … 10⁵) sowie
+``city_grid_size`` (4 … 128). Pro Punkt werden Laufzeit, Speicher und Datablock-Zahlen
+gemessen und als JSON gespeichert; ``--compare`` meldet Regressionen gegenüber einer Baseline.
+
+Zwei Modi:
+
+- ``plan``: nur die Platzierungslogik (``layout.plan_scene``), ohne Blender
+- ``bpy``: kompletter ``build_scene``-Lauf mit Blenders ``bpy`` im Hintergrund
+
+Damit große Prop-Zahlen nicht nur die Poisson-Disk-Abweisung messen, wächst die Fläche
+(``tree_area_half_extent``, ``ground_size``) mit der Wurzel der Prop-Zahl; die Dichte bleibt gleich.
+
+Beispiele::
+
+    python -m scene_project.benchmark --output benchmarks/plan.json
+    python -m scene_project.benchmark --compare benchmarks/plan.json --threshold 0.2
+    blender --background --factory-startup --python run_in_blender.py -- --benchmark --output benchmarks/bpy.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import NamedTuple
+
+from scene_project.config import SceneConfig
+from scene_project.layout import plan_scene
+
+MODES = ("plan", "bpy")
+FOREST_FIELDS = ("tree_count", "rock_count", "bush_count")
+PROP_COUNTS = (10, 100, 1_000, 10_000, 100_000)
+CITY_GRID_SIZES = (4, 8, 16, 32, 64, 128)
+# Laufzeit-Regressionen unterhalb dieser absoluten Differenz sind Messrauschen.
+MIN_SECONDS_DELTA = 0.005
+
+
+class BenchmarkPoint(NamedTuple):
+    id: str
+    scene: str
+    field: str
+    value: int
+    config: SceneConfig
+
+
+def _forest_config(field: str, count: int) -> SceneConfig:
+    base = SceneConfig(scene_name="forest")
+    props = sum(count if name == field else getattr(base, name) for name in FOREST_FIELDS)
+    scale = math.sqrt(max(props / sum(getattr(base, name) for name in FOREST_FIELDS), 1.0))
+    return replace(
+        base,
+        **{field: count},
+        tree_area_half_extent=base.tree_area_half_extent * scale,
+        ground_size=base.ground_size * scale,
+    )
+
+
+def sweep_points(scenes=("forest", "city"), max_count: int = PROP_COUNTS[-1], max_grid: int = CITY_GRID_SIZES[-1]):
+    """Alle Messpunkte des Sweeps (Forest: je Feld einzeln, übrige Felder auf Standardwerten)."""
+    points = []
+    if "forest" in scenes:
+        for field in FOREST_FIELDS:
+            for count in PROP_COUNTS:
+                if count <= max_count:
+                    cfg = _forest_config(field, count)
+                    points.append(BenchmarkPoint(f"forest:{field}={count}", "forest", field, count, cfg))
+    if "city" in scenes:
+        for grid in CITY_GRID_SIZES:
+            if grid <= max_grid:
+                cfg = SceneConfig(scene_name="city", city_grid_size=grid)
+                points.append(BenchmarkPoint(f"city:city_grid_size={grid}", "city", "city_grid_size", grid, cfg))
+    return points
+
+
+def _rss_bytes() -> int:
+    """Aktueller Resident Set Size des Prozesses (Linux), sonst der bisherige Höchstwert."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _measure_plan(cfg: SceneConfig, repeat: int) -> dict:
+    seconds = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        plan = plan_scene(cfg)
+        seconds.append(time.perf_counter() - started)
+
+    # Speicher in einem eigenen Lauf: tracemalloc würde die Zeitmessung verfälschen.
+    tracemalloc.start()
+    plan_scene(cfg)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "seconds": min(seconds),
+        "memory_bytes": peak,
+        "counts": {
+            "objects": len(plan),
+            "primitives": len(plan.primitives),
+            "materials": len(plan.materials),
+            "collections": len(plan.collections),
+        },
+        "digest": plan.digest(),
+    }
+
+
+def _measure_bpy(cfg: SceneConfig, repeat: int) -> dict:
+    # Erst hier importieren: der plan-Modus läuft ohne Blender.
+    from scene_project.main import build_scene
+    from scene_project.objects import clear_scene
+    from scene_project.profiler import count_datablocks
+
+    cfg = replace(cfg, incremental_build=False, build_cache=False, profile=False)
+    seconds, growth = [], []
+    for _ in range(repeat):
+        clear_scene(keep_caches=False)
+        # Zuwachs des Prozess-RSS durch diesen Build: Blenders C-Speicher sieht tracemalloc nicht,
+        # und der absolute RSS enthält alles, was frühere Punkte angesammelt haben.
+        before = _rss_bytes()
+        started = time.perf_counter()
+        build_scene(cfg)
+        seconds.append(time.perf_counter() - started)
+        growth.append(max(_rss_bytes() - before, 0))
+    return {"seconds": min(seconds), "memory_bytes": max(growth), "counts": count_datablocks()}
+
+
+def run_sweep(points, mode: str = "plan", repeat: int = 1) -> dict:
+    """Misst alle Punkte und liefert das JSON-fähige Ergebnis (Baseline-Format)."""
+    if mode not in MODES:
+        supported = ", ".join(MODES)
+        raise ValueError(f"Unbekannter Benchmark-Modus '{mode}'. Erlaubt: {supported}")
+    measure = _measure_bpy if mode == "bpy" else _measure_plan
+
+    results = []
+    for point in points:
+        result = {"id": point.id, "scene": point.scene, "field": point.field, "value": point.value}
+        result.update(measure(point.config, max(1, repeat)))
+        results.append(result)
+        print(
+            f"[scene_project] Benchmark {point.id}: {result['seconds']:.4f} s, "
+            f"{result['memory_bytes'] / 2**20:.1f} MB, {result['counts']['objects']} Objekte.",
+            flush=True,
+        )
+
+    blender = None
+    if mode == "bpy":
+        import bpy
+
+        blender = bpy.app.version_string
+    return {
+        "mode": mode,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "blender": blender,
+        "points": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = 0.2) -> list[dict]:
+    """Punktweiser Vergleich mit einer Baseline.
+
+    Gemeldet werden Zeit/Speicher über ``1 + threshold`` mal Baseline sowie geänderte
+    Zählwerte (andere Objekt-/Datablock-Zahlen deuten auf geändertes Verhalten).
+    """
+    if current["mode"] != baseline["mode"]:
+        raise ValueError(f"Baseline-Modus '{baseline['mode']}' passt nicht zu '{current['mode']}'")
+    reference = {point["id"]: point for point in baseline["points"]}
+    findings = []
+    for point in current["points"]:
+        ref = reference.get(point["id"])
+        if ref is None:
+            continue
+        for metric in ("seconds", "memory_bytes"):
+            old, new = ref.get(metric), point.get(metric)
+            if not old or new is None or new <= old * (1.0 + threshold):
+                continue
+            if metric == "seconds" and new - old < MIN_SECONDS_DELTA:
+                continue
+            findings.append({"id": point["id"], "metric": metric, "baseline": old, "current": new, "ratio": new / old})
+        if ref.get("counts") != point.get("counts"):
+            findings.append(
+                {"id": point["id"], "metric": "counts", "baseline": ref.get("counts"), "current": point.get("counts")}
+            )
+    return findings
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Skalierungs-Benchmark der scene_project-Builder.")
+    parser.add_argument("--mode", choices=MODES, default="plan", help="plan: ohne Blender, bpy: kompletter Build")
+    parser.add_argument("--scenes", nargs="+", choices=("forest", "city"), default=["forest", "city"])
+    parser.add_argument("--max-count", type=int, default=PROP_COUNTS[-1], help="größte Prop-Zahl im Forest-Sweep")
+    parser.add_argument("--max-grid", type=int, default=CITY_GRID_SIZES[-1], help="größtes City-Raster")
+    parser.add_argument("--repeat", type=int, default=1, help="Wiederholungen pro Punkt (Minimum zählt)")
+    parser.add_argument("--output", default=None, help="Ergebnis als JSON schreiben (Baseline)")
+    parser.add_argument("--compare", default=None, help="Baseline-JSON zum Vergleich")
+    parser.add_argument("--threshold", type=float, default=0.2, help="erlaubte Verschlechterung (0.2 = +20 %%)")
+    args = parser.parse_args(argv)
+
+    results = run_sweep(sweep_points(args.scenes, args.max_count, args.max_grid), args.mode, args.repeat)
+    if args.output:
+        path = Path(args.output)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"[scene_project] Benchmark gespeichert: {path}")
+    if not args.compare:
+        return 0
+
+    baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+    findings = compare(results, baseline, args.threshold)
+    for finding in findings:
+        if finding["metric"] == "counts":
+            print(f"[scene_project] GEÄNDERT {finding['id']}: {finding['baseline']} -> {finding['current']}")
+        else:
+            print(
+                f"[scene_project] REGRESSION {finding['id']} {finding['metric']}: "
+                f"{finding['baseline']:.4g} -> {finding['current']:.4g} ({finding['ratio'] - 1.0:+.0%})"
+            )
+    print(f"[scene_project] Vergleich mit {args.compare}: {len(findings)} Abweichungen.")
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
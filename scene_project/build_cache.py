@@ -0,0 +1,185 @@
+"""Inhaltsadressierter Build-Cache für generierte ``.blend``-Bibliotheken – ohne ``bpy``.
+
+Der Schlüssel eines Eintrags ist ein SHA-256 über die relevanten ``SceneConfig``-Werte eines
+Builders und den Quelltext aller ``scene_project``-Module. Ändert sich Config oder Code, ändert
+sich der Schlüssel; alte Einträge werden nie gelesen und fallen per LRU aus dem Cache.
+Das Schreiben/Anhängen der Collections selbst übernimmt ``scene_project.datablocks``.
+
+Invalidieren bzw. Statistik ohne Blender::
+
+    python -m scene_project.build_cache --invalidate
+    python -m scene_project.build_cache --stats
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Callable
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+CACHE_DIR_ENV = "SCENE_PROJECT_CACHE_DIR"
+ENTRY_SUFFIX = ".blend"
+# "link": Objekte aus dem Cache linken (schnell); "append": lokal kopieren (editierbar, eigenständige .blend)
+CACHE_MODES = ("link", "append")
+_STATS_FILE = "stats.json"
+_COUNTERS = ("hits", "misses", "writes", "evictions")
+
+
+def default_cache_dir() -> Path:
+    """Cache-Ordner aus ``$SCENE_PROJECT_CACHE_DIR``, sonst ``.scene_cache`` im Projektordner."""
+    configured = os.environ.get(CACHE_DIR_ENV)
+    return Path(configured) if configured else PACKAGE_DIR.parent / ".scene_cache"
+
+
+def source_digest(package_dir: Path = PACKAGE_DIR) -> str:
+    """SHA-256 über Namen und Inhalt aller ``*.py``-Module des Pakets."""
+    h = hashlib.sha256()
+    for path in sorted(package_dir.glob("*.py")):
+        h.update(path.name.encode("utf-8"))
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+class BuildCache:
+    """Verzeichnis mit ``<key>.blend``-Einträgen, begrenzt auf ``max_bytes`` (LRU über mtime)."""
+
+    def __init__(self, directory: str | Path | None = None, max_bytes: int = 512 * 1024 * 1024):
+        self.directory = Path(directory) if directory else default_cache_dir()
+        self.max_bytes = int(max_bytes)
+        self.counters = dict.fromkeys(_COUNTERS, 0)
+        self._source = None
+
+    def key(self, payload: dict) -> str:
+        """Schlüssel für ``payload`` (JSON-fähig) plus Quelltext-Digest des Pakets."""
+        if self._source is None:
+            self._source = source_digest()
+        h = hashlib.sha256(self._source.encode("utf-8"))
+        h.update(json.dumps(payload, sort_keys=True).encode("utf-8"))
+        return h.hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}{ENTRY_SUFFIX}"
+
+    def lookup(self, key: str) -> Path | None:
+        """Pfad des Eintrags oder ``None``; ein Treffer wird als zuletzt benutzt markiert."""
+        path = self.path(key)
+        if not path.is_file():
+            self.counters["misses"] += 1
+            return None
+        os.utime(path)
+        self.counters["hits"] += 1
+        return path
+
+    def store(self, key: str, write: Callable[[Path], None], evict: bool = True) -> Path:
+        """Schreibt einen Eintrag über ``write(tmp_path)`` atomar und hält danach das Größenlimit ein.
+
+        ``evict=False`` lässt das Limit unberührt – für parallele Worker, deren Teile der
+        Hauptprozess noch linken muss; er ruft ``evict`` danach selbst auf.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(key)
+        tmp = path.with_name(f"{key}.{os.getpid()}.tmp{ENTRY_SUFFIX}")
+        try:
+            write(tmp)
+            os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        self.counters["writes"] += 1
+        if evict:
+            self.evict()
+        return path
+
+    def _entries(self) -> list[tuple[os.stat_result, Path]]:
+        if not self.directory.is_dir():
+            return []
+        entries = []
+        for path in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+            if ".tmp" not in path.name:
+                entries.append((path.stat(), path))
+        return entries
+
+    def evict(self) -> int:
+        """Löscht die am längsten nicht benutzten Einträge, bis ``max_bytes`` eingehalten ist."""
+        entries = sorted(self._entries(), key=lambda entry: entry[0].st_mtime)
+        total = sum(stat.st_size for stat, _ in entries)
+        evicted = 0
+        for stat, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            evicted += 1
+        self.counters["evictions"] += evicted
+        return evicted
+
+    def invalidate(self) -> int:
+        """Löscht alle Einträge und die gespeicherte Statistik; liefert die Anzahl gelöschter Einträge."""
+        entries = self._entries()
+        for _, path in entries:
+            path.unlink(missing_ok=True)
+        (self.directory / _STATS_FILE).unlink(missing_ok=True)
+        self.counters = dict.fromkeys(_COUNTERS, 0)
+        return len(entries)
+
+    def _load_totals(self) -> dict[str, int]:
+        try:
+            return json.loads((self.directory / _STATS_FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return dict.fromkeys(_COUNTERS, 0)
+
+    def flush(self):
+        """Addiert die Zähler dieses Laufs zur Gesamtstatistik im Cache-Ordner."""
+        if not any(self.counters.values()):
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        totals = self._load_totals()
+        for name, count in self.counters.items():
+            totals[name] = totals.get(name, 0) + count
+        (self.directory / _STATS_FILE).write_text(json.dumps(totals, indent=2), encoding="utf-8")
+        self.counters = dict.fromkeys(_COUNTERS, 0)
+
+    def stats(self) -> dict:
+        """Einträge, Belegung und Zähler (dieser Lauf bzw. gesamt)."""
+        entries = self._entries()
+        totals = self._load_totals()
+        return {
+            "directory": str(self.directory),
+            "entries": len(entries),
+            "bytes": sum(stat.st_size for stat, _ in entries),
+            "max_bytes": self.max_bytes,
+            "run": dict(self.counters),
+            "total": {name: totals.get(name, 0) + self.counters[name] for name in _COUNTERS},
+        }
+
+    def report(self) -> str:
+        stats = self.stats()
+        run = stats["run"]
+        return (
+            f"{run['hits']} Hits, {run['misses']} Misses, {run['writes']} geschrieben, "
+            f"{run['evictions']} verdrängt; {stats['entries']} Einträge "
+            f"({stats['bytes'] / 2**20:.1f} / {stats['max_bytes'] / 2**20:.0f} MB)"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build-Cache von scene_project verwalten.")
+    parser.add_argument("--dir", default=None, help=f"Cache-Ordner (Standard: ${CACHE_DIR_ENV} oder .scene_cache)")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--invalidate", action="store_true", help="alle Einträge löschen")
+    action.add_argument("--stats", action="store_true", help="Statistik ausgeben")
+    args = parser.parse_args(argv)
+
+    cache = BuildCache(args.dir)
+    if args.invalidate:
+        print(f"[scene_project] Build-Cache: {cache.invalidate()} Einträge in {cache.directory} gelöscht.")
+    else:
+        print(json.dumps(cache.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
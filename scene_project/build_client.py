@@ -0,0 +1,81 @@
+"""Client für den Build-Server (``scene_project.build_server``) – ohne ``bpy``.
+
+Protokoll: pro Verbindung eine Anfrage und eine Antwort, jeweils eine JSON-Zeile.
+Anfrage: ``{"command": "build" | "render" | "ping" | "stats" | "shutdown", "scene": ...,
+"overrides": {...}, "output": ...}``; Antwort: ``{"ok": true, ...}`` bzw. ``{"ok": false, "error": ...}``.
+
+Beispiel (Server läuft über ``run_in_blender.py -- --serve``)::
+
+    python -m scene_project.build_client build --scene city --set city_drone_count=60 --output /tmp/city.blend
+    python -m scene_project.build_client render --scene city --output /tmp/city.png
+    python -m scene_project.build_client shutdown
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import socket
+import sys
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+COMMANDS = ("build", "render", "ping", "stats", "shutdown")
+
+
+def send_message(conn: socket.socket, message: dict):
+    conn.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def read_message(conn: socket.socket) -> dict:
+    with conn.makefile("r", encoding="utf-8") as stream:
+        line = stream.readline()
+    if not line:
+        raise ConnectionError("Verbindung ohne Nachricht geschlossen")
+    return json.loads(line)
+
+
+def request(message: dict, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, timeout: float | None = None) -> dict:
+    """Schickt eine Anfrage an den Build-Server und wartet auf die Antwort (``timeout=None``: unbegrenzt)."""
+    with socket.create_connection((host, port), timeout=5.0) as conn:
+        conn.settimeout(timeout)
+        send_message(conn, message)
+        return read_message(conn)
+
+
+def parse_overrides(items) -> dict:
+    """``["feld=wert", ...]`` -> dict; Werte werden als JSON gelesen, sonst als Text übernommen."""
+    overrides = {}
+    for item in items or ():
+        field, sep, raw = item.partition("=")
+        if not sep:
+            raise ValueError(f"Ungültige Überschreibung '{item}'. Erwartet: feld=wert")
+        try:
+            overrides[field.strip()] = json.loads(raw)
+        except ValueError:
+            overrides[field.strip()] = raw
+    return overrides
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Befehle an den scene_project-Build-Server schicken.")
+    parser.add_argument("command", choices=COMMANDS)
+    parser.add_argument("--scene", default=None, help="Szenenname (forest, city)")
+    parser.add_argument("--set", action="append", metavar="FELD=WERT", help="SceneConfig-Feld überschreiben")
+    parser.add_argument("--output", default=None, help="Zielpfad (.blend bei build, Bild bei render)")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args(argv)
+
+    message = {"command": args.command, "overrides": parse_overrides(args.set)}
+    if args.scene:
+        message["scene"] = args.scene
+    if args.output:
+        message["output"] = args.output
+    response = request(message, host=args.host, port=args.port)
+    print(json.dumps(response, indent=2))
+    return 0 if response.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""Langlebiger Build-Server: ein Blender-Prozess, viele Builds.
+
+Jeder CLI-Lauf zahlt Blender-Start und Python-Imports, bevor die erste Geometrie entsteht.
+``serve`` hält einen Blender-Prozess offen und nimmt Befehle als JSON über einen lokalen
+Socket an (Protokoll und Client in ``scene_project.build_client``). Zwischen den Befehlen
+bleiben Module, Materialien, Prototyp-Meshes und die Config des letzten Builds erhalten,
+sodass Folge-Builds inkrementell laufen.
+
+Start::
+
+    blender --background --factory-startup --python run_in_blender.py -- --serve --port 8765
+
+Die Befehle laufen nacheinander im Hauptthread (``bpy`` ist nicht threadsicher).
+"""
+
+from __future__ import annotations
+
+import socket
+import time
+import traceback
+from dataclasses import replace
+from pathlib import Path
+
+import bpy
+
+from scene_project.build_client import COMMANDS, DEFAULT_HOST, DEFAULT_PORT, read_message, send_message
+from scene_project.config import SceneConfig
+from scene_project.geometry import prototype_stats
+from scene_project.main import build_scene
+from scene_project.materials import material_cache_stats
+from scene_project.profiler import SUMMARY_FILE, default_summary_dir
+from scene_project.render import apply_render_profile, render_still
+
+
+def request_config(message: dict) -> SceneConfig:
+    """``SceneConfig`` aus Szenenname und Überschreibungen einer Anfrage."""
+    return SceneConfig.from_overrides(message.get("scene") or "forest", message.get("overrides"))
+
+
+class BuildServer:
+    """Verarbeitet Anfragen und führt eine kleine Statistik über die Lebensdauer des Prozesses."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.build_seconds = 0.0
+
+    def handle(self, message: dict) -> dict:
+        command = message.get("command")
+        if command not in COMMANDS:
+            supported = ", ".join(COMMANDS)
+            raise ValueError(f"Unbekannter Befehl '{command}'. Erlaubt: {supported}")
+        if command == "ping":
+            return {"blender": bpy.app.version_string}
+        if command == "stats":
+            return self.stats()
+        if command == "shutdown":
+            return {"shutdown": True}
+
+        output = message.get("output")
+        if command == "render" and not output:
+            raise ValueError("Render-Befehl ohne 'output'-Pfad")
+        cfg = request_config(message)
+        if cfg.profile and output and not cfg.profile_dir:
+            # scene_summary.json neben die Ausgabe legen.
+            cfg = replace(cfg, profile_dir=str(Path(output).resolve().parent))
+        result = self.build(cfg)
+        if cfg.profile:
+            result["summary"] = str(Path(cfg.profile_dir or default_summary_dir()).resolve() / SUMMARY_FILE)
+        if output:
+            path = Path(output).resolve()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            started = time.perf_counter()
+            if command == "render":
+                profile = apply_render_profile(cfg.render_profile) if cfg.render_profile else {}
+                result["render"] = {**profile, **render_still(path)}
+            else:
+                # copy=True: die Sitzung des Servers bleibt ungespeichert und ohne Dateipfad.
+                bpy.ops.wm.save_as_mainfile(filepath=str(path), copy=True)
+            result["output"] = str(path)
+            result["output_seconds"] = time.perf_counter() - started
+        return result
+
+    def build(self, cfg: SceneConfig) -> dict:
+        started = time.perf_counter()
+        build_scene(cfg)
+        seconds = time.perf_counter() - started
+        self.build_seconds += seconds
+        return {"scene": cfg.scene_name, "objects": len(bpy.context.scene.objects), "build_seconds": seconds}
+
+    def stats(self) -> dict:
+        return {
+            "uptime_seconds": time.perf_counter() - self.started,
+            "requests": self.requests,
+            "build_seconds": self.build_seconds,
+            "objects": len(bpy.context.scene.objects),
+            "prototypes": prototype_stats(),
+            "materials": material_cache_stats(),
+        }
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, max_requests: int | None = None):
+    """Nimmt Anfragen an, bis ``shutdown`` kommt (oder ``max_requests`` erreicht ist).
+
+    Fehler eines Befehls gehen als ``{"ok": false, "error": ...}`` an den Client; der Server läuft weiter.
+    """
+    server = BuildServer()
+    with socket.create_server((host, port)) as listener:
+        host, port = listener.getsockname()[:2]
+        print(f"[scene_project] Build-Server lauscht auf {host}:{port}.", flush=True)
+        while max_requests is None or server.requests < max_requests:
+            conn, _ = listener.accept()
+            with conn:
+                server.requests += 1
+                message = {}
+                try:
+                    message = read_message(conn)
+                    response = {"ok": True, **server.handle(message)}
+                except Exception as exc:
+                    error = f"{type(exc).__name__}: {exc}"
+                    response = {"ok": False, "error": error, "traceback": traceback.format_exc()}
+                print(f"[scene_project] Build-Server: {message.get('command')} -> ok={response['ok']}.", flush=True)
+                send_message(conn, response)
+            if response.get("shutdown"):
+                break
+    print(f"[scene_project] Build-Server beendet ({server.requests} Anfragen).", flush=True)
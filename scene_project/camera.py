@@ -2,15 +2,47 @@
 
 import bpy
 
+from scene_project.datablocks import tag_generated
+
 
 def setup_camera(
     location: tuple[float, float, float] = (12.0, -14.0, 10.0),
     rotation_euler: tuple[float, float, float] = (1.0, 0.0, 0.75),
+    lens: float = 50.0,
+    clip_start: float = 0.1,
+    clip_end: float = 100.0,
+    resolution: tuple[int, int] | None = None,
 ):
-    """Erzeugt eine Kamera und setzt sie als aktive Kamera der Szene."""
+    """Erzeugt eine Kamera und setzt sie als aktive Kamera der Szene.
+
+    Lens, Clipping und Auflösung werden explizit gesetzt, damit das gerenderte Bild
+    exakt dem Frustum entspricht, gegen das vorher gecullt wurde.
+    """
     bpy.ops.object.camera_add(location=location, rotation=rotation_euler)
     cam = bpy.context.active_object
     cam.name = "MainCamera"
+    tag_generated(cam.data)
+    return update_camera(cam, location, rotation_euler, lens, clip_start, clip_end, resolution)
+
+
+def update_camera(
+    cam,
+    location: tuple[float, float, float],
+    rotation_euler: tuple[float, float, float],
+    lens: float,
+    clip_start: float,
+    clip_end: float,
+    resolution: tuple[int, int] | None = None,
+):
+    """Setzt Transform, Optik und Auflösung einer vorhandenen Kamera (ohne Neuaufbau)."""
+    cam.location = location
+    cam.rotation_euler = rotation_euler
+    cam.data.lens = lens
+    cam.data.clip_start = clip_start
+    cam.data.clip_end = clip_end
 
-    bpy.context.scene.camera = cam
+    scene = bpy.context.scene
+    if resolution is not None:
+        scene.render.resolution_x, scene.render.resolution_y = resolution
+    scene.camera = cam
     return cam
@@ -3,7 +3,9 @@
 Alle Werte können pro Iteration verändert werden, ohne die Kernlogik umzubauen.
 """
 
-from dataclasses import dataclass
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, fields
 
 
 @dataclass
@@ -17,6 +19,11 @@ class SceneConfig:
     rock_count: int = 16
     bush_count: int = 24
     pond_radius: float = 2.4
+    # Poisson-Disk-Mindestabstände pro Prop-Klasse (0 = rein zufällig verteilt)
+    tree_min_spacing: float = 1.2
+    rock_min_spacing: float = 0.6
+    bush_min_spacing: float = 0.7
+    scatter_avoid_pond: bool = True
 
     # City-Setup
     city_grid_size: int = 8
@@ -27,8 +34,90 @@ class SceneConfig:
     city_drone_count: int = 22
     city_ring_radius: float = 9.5
     city_spire_height: float = 15.0
+    city_drone_min_spacing: float = 0.8
+    # Sperrflächen für Drohnen: "towers", "roads", "spire"
+    city_drone_exclusions: tuple[str, ...] = ("towers", "spire")
+    # Gekachelte City für sehr große Raster: eigene Collection und eigener Seed pro Kachel
+    city_tiled: bool = False
+    city_tile_size: int = 8
+    # Nur Kacheln im Radius (XY, Welt-Einheiten) um die Kamera laden bzw. sichtbar lassen; 0 = alle
+    city_tile_load_radius: float = 0.0
+    city_tile_exclude_radius: float = 0.0
+    # Statische City-Geometrie nach dem Build zu einem Mesh pro Material zusammenführen
+    city_bake_static: bool = False
+    # Drohnen-Flug um den Skyway-Ring (Frames 1 … city_drone_frames, Schleife; siehe scene_project.flight)
+    city_drone_flight: bool = False
+    city_drone_frames: int = 600
+    city_drone_laps: int = 1
+    # Max. Abweichung der ausgedünnten Keyframe-Kurven in Welt-Einheiten (0 = Keyframe auf jedem Frame)
+    city_drone_keyframe_tolerance: float = 0.01
 
     # Shared scene settings
+    # Basis-Seed; jeder Builder leitet daraus seinen eigenen Zufalls-Stream ab
+    scene_seed: int = 42
     sun_energy: float = 3.5
     camera_location: tuple[float, float, float] = (12.0, -14.0, 10.0)
     camera_rotation_euler: tuple[float, float, float] = (1.0, 0.0, 0.75)
+    city_camera_location: tuple[float, float, float] = (20.0, -22.0, 14.0)
+    city_camera_rotation_euler: tuple[float, float, float] = (1.08, 0.0, 0.8)
+    camera_lens: float = 50.0
+    camera_clip_start: float = 0.1
+    camera_clip_end: float = 100.0
+    render_resolution: tuple[int, int] = (1920, 1080)
+    # Render-Profil: "preview" (CPU, Sekunden), "review", "final" (siehe scene_project.render);
+    # leer = Render-Einstellungen der Szene unverändert lassen
+    render_profile: str = ""
+
+    # Frustum-Culling: Objekte außerhalb der Kamera (+ Margin) gar nicht erst erzeugen
+    cull_to_camera: bool = False
+    cull_margin: float = 1.0
+
+    # LOD: Bildschirmgröße (Anteil der halben Bildhöhe) ab der Stufe 0, 1, ... gilt
+    lod_enabled: bool = False
+    lod_screen_thresholds: tuple[float, ...] = (0.05, 0.015)
+
+    # Plan-Builder auf so viele Hintergrund-Prozesse verteilen (0/1 = seriell im aktuellen Prozess)
+    parallel_workers: int = 0
+
+    # Build-Profil als scene_summary.json (""= neben der .blend bzw. Arbeitsverzeichnis), optional cProfile-Dump
+    profile: bool = False
+    profile_dir: str = ""
+    profile_cprofile: bool = False
+
+    # Build-Backend: "data" (bpy.data/bmesh, schnell), "ops" (bpy.ops, Referenz) oder "instances"
+    # (wie "data", gestreute Props als Geometry-Nodes-Punkt-Instanzen, siehe scene_project.instancing)
+    geometry_backend: str = "data"
+    # "materials": ein Material pro Farbvariante; "attributes": ein Material pro Familie (Window, Emission),
+    # Farbe/Stärke als Custom Properties am Objekt (siehe scene_project.materials)
+    material_mode: str = "materials"
+    # Beim Aufräumen gültige Prototyp-Meshes und gecachte Materialien behalten
+    keep_caches_on_clear: bool = True
+    # Nur Builder neu bauen, deren Config-Felder sich seit dem letzten Build geändert haben
+    incremental_build: bool = True
+    # Builder-Ergebnisse als .blend cachen (Schlüssel: Config-Felder + Quelltext); "" = Standard-Ordner
+    build_cache: bool = False
+    build_cache_dir: str = ""
+    build_cache_max_mb: float = 512.0
+    # "link" (schnell, Objekte schreibgeschützt) oder "append" (lokale Kopie)
+    build_cache_mode: str = "link"
+
+    def to_dict(self) -> dict:
+        """JSON-fähige Darstellung (Tupel werden zu Listen)."""
+        return {key: list(value) if isinstance(value, tuple) else value for key, value in asdict(self).items()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> SceneConfig:
+        """Gegenstück zu ``to_dict``; unbekannte Felder (ältere/neuere Configs) werden ignoriert."""
+        known = {field.name for field in fields(cls)}
+        values = {key: value for key, value in data.items() if key in known}
+        return cls(**{key: tuple(value) if isinstance(value, list) else value for key, value in values.items()})
+
+    @classmethod
+    def from_overrides(cls, scene_name: str = "forest", overrides: dict | None = None) -> SceneConfig:
+        """Standard-Config der Szene mit Überschreibungen (z. B. aus JSON); unbekannte Felder sind Fehler."""
+        overrides = overrides or {}
+        known = {field.name for field in fields(cls)}
+        for name in overrides:
+            if name not in known:
+                raise ValueError(f"Unbekanntes Config-Feld '{name}'. Erlaubt: Felder von SceneConfig")
+        return cls.from_dict({**cls(scene_name=scene_name).to_dict(), **overrides})
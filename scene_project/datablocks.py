@@ -0,0 +1,210 @@
+"""Hilfsfunktionen für Blender-Datablocks (IDs).
+
+Alles, was das Projekt selbst anlegt (Meshes, Materialien, Lichter, Kameras,
+Node-Groups, Actions), wird mit ``GENERATED_PROP`` markiert. So kann ``purge_generated_orphans``
+verwaiste Reste früherer Builds entfernen, ohne fremde Daten der ``.blend`` anzufassen.
+"""
+
+import os
+
+import bpy
+
+GENERATED_PROP = "sp_generated"
+
+# Reihenfolge ist wichtig: Meshes halten Materialien, Materialien halten Node-Groups.
+_PURGE_ORDER = ("actions", "meshes", "lights", "cameras", "materials", "node_groups")
+
+
+def is_alive(id_block) -> bool:
+    """Prüft, ob ein gemerkter Datablock noch existiert (nicht entfernt wurde)."""
+    if id_block is None:
+        return False
+    try:
+        id_block.name
+    except ReferenceError:
+        return False
+    return True
+
+
+def tag_generated(id_block):
+    """Markiert einen Datablock als vom Projekt erzeugt."""
+    id_block[GENERATED_PROP] = True
+    return id_block
+
+
+def purge_generated_orphans(keep=None) -> dict[str, int]:
+    """Entfernt verwaiste, vom Projekt erzeugte Datablocks in einem Rutsch.
+
+    Args:
+        keep: Optionales Prädikat; Datablocks, für die es ``True`` liefert, bleiben erhalten
+            (z. B. noch gültige Prototyp-Meshes oder gecachte Materialien).
+
+    Returns:
+        Anzahl entfernter Datablocks pro ``bpy.data``-Collection.
+    """
+    # Gelinkte Cache-Bibliotheken zuerst: ohne genutzte Objekte fallen alle ihre Datablocks mit weg.
+    used = set()
+    for collection in [scene.collection for scene in bpy.data.scenes] + list(bpy.data.collections):
+        if collection.library is None:
+            used.update(obj.library for obj in collection.objects if obj.library is not None)
+    libraries = [lib for lib in bpy.data.libraries if lib.get(GENERATED_PROP) and lib not in used]
+    if libraries:
+        bpy.data.batch_remove(libraries)
+    freed = {"libraries": len(libraries)}
+    for attr in _PURGE_ORDER:
+        orphans = [
+            id_block
+            for id_block in getattr(bpy.data, attr)
+            if id_block.users == 0
+            and id_block.library is None
+            and id_block.get(GENERATED_PROP)
+            and not (keep and keep(id_block))
+        ]
+        if orphans:
+            bpy.data.batch_remove(orphans)
+        freed[attr] = len(orphans)
+    return freed
+
+
+def ensure_collection(name: str, parent=None):
+    """Liefert eine (Projekt-)Collection und hängt sie bei Bedarf unter ``parent`` ein.
+
+    Ohne ``parent`` landet eine noch nirgends eingehängte Collection direkt unter der Szene;
+    bereits eingehängte (z. B. City-Kacheln unter ``City_Tiles``) bleiben, wo sie sind.
+    """
+    collection = bpy.data.collections.get(name)
+    if collection is None:
+        collection = tag_generated(bpy.data.collections.new(name))
+    if parent is None:
+        if collection.users:
+            return collection
+        parent = bpy.context.scene.collection
+    if collection.name not in parent.children:
+        parent.children.link(collection)
+    return collection
+
+
+def remove_collections(names) -> int:
+    """Entfernt (leere) Projekt-Collections komplett, z. B. entladene City-Kacheln."""
+    collections = [bpy.data.collections[name] for name in names if name in bpy.data.collections]
+    if collections:
+        bpy.data.batch_remove(collections)
+    return len(collections)
+
+
+def set_collections_excluded(states: dict[str, bool]) -> int:
+    """Schließt Collections im aktiven View-Layer aus (``True``) bzw. wieder ein (``False``).
+
+    Ausgeschlossene Collections bleiben in der ``.blend``, werden aber weder im Depsgraph
+    ausgewertet noch gerendert. Der Layer-Baum wird dafür nur einmal durchlaufen.
+
+    Returns:
+        Anzahl geänderter Layer-Collections.
+    """
+    changed = 0
+    pending = [bpy.context.view_layer.layer_collection]
+    while pending:
+        layer_collection = pending.pop()
+        excluded = states.get(layer_collection.name)
+        if excluded is not None and layer_collection.exclude != excluded:
+            layer_collection.exclude = excluded
+            changed += 1
+        pending.extend(layer_collection.children)
+    return changed
+
+
+def write_collections(path, names) -> int:
+    """Schreibt Collections samt Objekten (und deren Meshes/Materialien) in eine ``.blend``-Bibliothek."""
+    ids = set()
+    for name in names:
+        collection = bpy.data.collections[name]
+        ids.add(collection)
+        ids.update(collection.objects)
+    bpy.data.libraries.write(str(path), ids, compress=True)
+    return len(ids)
+
+
+def _base_name(name: str) -> str:
+    base, dot, suffix = name.rpartition(".")
+    return base if dot and suffix.isdigit() else name
+
+
+def _remap_duplicates(id_collection, before: set, match_props) -> int:
+    """Ersetzt frisch angehängte ``Name.001``-Duplikate durch den vorhandenen gleichwertigen Datablock."""
+    duplicates = []
+    for id_block in id_collection:
+        if id_block.as_pointer() in before:
+            continue
+        existing = id_collection.get(_base_name(id_block.name))
+        if existing is None or existing == id_block:
+            continue
+        if any(existing.get(prop) and existing.get(prop) == id_block.get(prop) for prop in match_props):
+            id_block.user_remap(existing)
+            duplicates.append(id_block)
+    if duplicates:
+        bpy.data.batch_remove(duplicates)
+    return len(duplicates)
+
+
+def link_collections(path, names) -> list:
+    """Linkt die Objekte der Collections ``names`` aus einer ``.blend``-Bibliothek.
+
+    Die (schreibgeschützten) Objekte landen in den gleichnamigen lokalen Collections der Szene.
+    Die Bibliothek wird markiert und von ``purge_generated_orphans`` entfernt, sobald keines
+    ihrer Objekte mehr genutzt wird.
+
+    Returns:
+        Die Ziel-Collections (nur die, die in der Bibliothek vorhanden waren).
+    """
+    with bpy.data.libraries.load(str(path), link=True) as (data_from, data_to):
+        requested = [name for name in names if name in data_from.collections]
+        data_to.collections = list(requested)
+
+    targets = []
+    for name, linked in zip(requested, data_to.collections):
+        tag_generated(linked.library)
+        target = ensure_collection(name)
+        for obj in linked.objects:
+            target.objects.link(obj)
+        targets.append(target)
+    return targets
+
+
+def append_collections(path, names, match_props=()) -> list:
+    """Hängt Collections aus einer ``.blend``-Bibliothek an (append, nicht link).
+
+    Langsamer als ``link_collections`` (Blender macht jeden Datablock lokal), dafür ist das
+    Ergebnis editierbar und die ``.blend`` hängt nicht mehr am Cache-Ordner.
+
+    Die Objekte landen in den gleichnamigen, bereits vorhandenen Collections der Szene.
+    Angehängte Meshes/Materialien, die einem vorhandenen Datablock mit gleichem Wert in einer
+    der ``match_props`` entsprechen (z. B. Prototyp- oder Material-Signatur), werden auf diesen
+    umgebogen, statt als ``.001``-Kopie zu bleiben.
+
+    Returns:
+        Die Ziel-Collections (nur die, die in der Bibliothek vorhanden waren).
+    """
+    before = {
+        attr: {id_block.as_pointer() for id_block in getattr(bpy.data, attr)} for attr in ("meshes", "materials")
+    }
+    with bpy.data.libraries.load(str(path), link=False) as (data_from, data_to):
+        requested = [name for name in names if name in data_from.collections]
+        data_to.collections = list(requested)
+
+    targets = []
+    for name, loaded in zip(requested, data_to.collections):
+        target = ensure_collection(name)
+        for obj in loaded.objects:
+            target.objects.link(obj)
+        targets.append(target)
+    bpy.data.batch_remove(data_to.collections)
+
+    for attr in ("meshes", "materials"):
+        _remap_duplicates(getattr(bpy.data, attr), before[attr], match_props)
+
+    # Nach dem Append ist die Bibliothek leer, bleibt aber als Verweis in der .blend stehen.
+    source = os.path.realpath(path)
+    leftovers = [lib for lib in bpy.data.libraries if os.path.realpath(bpy.path.abspath(lib.filepath)) == source]
+    if leftovers:
+        bpy.data.batch_remove(leftovers)
+    return targets
@@ -0,0 +1,115 @@
+"""Flugbahnen der City-Drohnen – komplett in NumPy, ohne ``bpy``.
+
+Die Drohnen kreisen um den Skyway-Ring (``layout.plan_city_elevated_ring``) in übereinander
+liegenden Höhenbändern. Kollisionsfrei per Konstruktion:
+
+- Innerhalb eines Bands haben alle Drohnen dieselbe Winkelgeschwindigkeit und gleichmäßige
+  Startwinkel; der Abstand ist damit nie kleiner als die Sehne am kleinsten Radius.
+- Bänder liegen ``2 * clearance`` auseinander, das Höhenrauschen bleibt unter einem Viertel davon.
+
+Radius und Höhe schwanken mit glattem Rauschen (Summe weniger Sinus-Harmonischer). Alle
+Frequenzen sind ganzzahlige Vielfache der Shot-Länge, die Bahnen schließen sich also zur Schleife.
+``decimate`` dünnt die Keyframes pro Kanal aus (Ramer-Douglas-Peucker mit Höhenfehler).
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from scene_project.scatter import scene_stream
+
+# Unterkante des untersten Bands (Höhe der statischen Drohnen: 4 … 9).
+BAND_BASE = 4.0
+# Radialer Versatz je Drohne (±) und Amplitude des Radius-Rauschens um den Ring.
+RADIAL_SPREAD = 1.5
+RADIAL_NOISE = 0.6
+# Harmonische des Rauschens (Schwingungen pro Shot).
+HARMONICS = np.arange(1, 5)
+# Untergrenze für den Mindestabstand (zwei der größten Drohnen-Kugeln, Radius 0.16).
+MIN_CLEARANCE = 0.4
+
+
+def band_capacity(ring_radius: float, clearance: float) -> int:
+    """Maximale Drohnenzahl pro Band, sodass die Sehne am kleinsten Radius ``clearance`` nicht unterschreitet."""
+    inner = ring_radius - RADIAL_SPREAD - RADIAL_NOISE
+    if inner <= clearance / 2.0:
+        raise ValueError(f"Ring-Radius {ring_radius} zu klein für Drohnen-Bahnen (Mindestabstand {clearance})")
+    return max(1, int(2.0 * math.pi / (2.0 * math.asin(clearance / (2.0 * inner)))))
+
+
+def _noise(rng: np.random.Generator, count: int, phase: np.ndarray, amplitude: float) -> np.ndarray:
+    """Glattes, periodisches Rauschen ``(count, samples)`` mit ``|Wert| <= amplitude``."""
+    weights = rng.uniform(0.2, 1.0, size=(count, len(HARMONICS))) / HARMONICS
+    weights *= amplitude / weights.sum(axis=1, keepdims=True)
+    offsets = rng.uniform(0.0, 2.0 * math.pi, size=(count, len(HARMONICS)))
+    waves = np.sin(HARMONICS[None, :, None] * phase[None, None, :] + offsets[:, :, None])
+    return np.einsum("nh,nhs->ns", weights, waves)
+
+
+def drone_paths(
+    count: int,
+    ring_radius: float,
+    frames: int,
+    laps: int = 1,
+    seed: int = 23,
+    clearance: float = 0.8,
+) -> tuple[np.ndarray, int]:
+    """Positionen ``(count, frames + 1, 3)`` für die Frames ``1 … frames + 1`` und die Zahl der Bänder.
+
+    Das letzte Sample entspricht dem ersten (Schleife); ``laps`` Umläufe pro Shot, Bänder abwechselnd
+    im und gegen den Uhrzeigersinn.
+    """
+    clearance = max(clearance, MIN_CLEARANCE)
+    capacity = band_capacity(ring_radius, clearance)
+    bands = max(1, math.ceil(count / capacity))
+    rng = scene_stream(seed, "drone_flight")
+
+    # Drohnen reihum auf die Bänder verteilen, Startwinkel pro Band gleichmäßig.
+    band = np.arange(count) % bands
+    slot = np.arange(count) // bands
+    per_band = np.bincount(band, minlength=bands)
+    band_phase = rng.uniform(0.0, 2.0 * math.pi, size=bands)
+    start = band_phase[band] + 2.0 * math.pi * slot / per_band[band]
+    direction = np.where(band % 2 == 0, 1.0, -1.0)
+
+    phase = np.linspace(0.0, 2.0 * math.pi, frames + 1)
+    angle = start[:, None] + direction[:, None] * laps * phase[None, :]
+    radius = ring_radius + rng.uniform(-RADIAL_SPREAD, RADIAL_SPREAD, size=count)[:, None]
+    radius = radius + _noise(rng, count, phase, RADIAL_NOISE)
+    spacing = 2.0 * clearance
+    height = BAND_BASE + spacing * (band[:, None] + 0.5) + _noise(rng, count, phase, spacing / 4.0)
+
+    paths = np.empty((count, frames + 1, 3))
+    paths[:, :, 0] = radius * np.cos(angle)
+    paths[:, :, 1] = radius * np.sin(angle)
+    paths[:, :, 2] = height
+    return paths, bands
+
+
+def decimate(values: np.ndarray, tolerance: float) -> np.ndarray:
+    """Indizes der Samples, deren lineare Interpolation ``values`` bis auf ``tolerance`` trifft.
+
+    Ramer-Douglas-Peucker über ``(Frame, Wert)`` mit dem Fehler in Wert-Richtung; erstes und
+    letztes Sample bleiben immer erhalten. ``tolerance <= 0`` behält alle Samples.
+    """
+    count = len(values)
+    if tolerance <= 0.0 or count <= 2:
+        return np.arange(count)
+    keep = np.zeros(count, dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, count - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        t = np.arange(1, last - first) / (last - first)
+        line = values[first] + (values[last] - values[first]) * t
+        error = np.abs(values[first + 1 : last] - line)
+        worst = int(np.argmax(error))
+        if error[worst] > tolerance:
+            split = first + 1 + worst
+            keep[split] = True
+            stack.extend(((first, split), (split, last)))
+    return np.flatnonzero(keep)
@@ -0,0 +1,113 @@
+"""Kamera-Frustum-Culling auf Plan-Ebene – ohne ``bpy``.
+
+Die Kamera wird vor dem Build aus der ``SceneConfig`` aufgelöst. ``cull_plan`` verwirft
+alle geplanten Objekte, deren Bounding-Sphere (plus Margin) komplett außerhalb des
+Frustums liegt, bevor irgendeine Geometrie erzeugt wird.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from scene_project.config import SceneConfig
+from scene_project.plan import ScenePlan
+from scene_project.primitives import bounding_radius
+
+
+@dataclass(frozen=True)
+class CameraSpec:
+    """Alles, was für Frustum und ``setup_camera`` gebraucht wird."""
+
+    location: tuple[float, float, float]
+    rotation_euler: tuple[float, float, float]
+    lens: float = 50.0
+    sensor_width: float = 36.0
+    resolution: tuple[int, int] = (1920, 1080)
+    clip_start: float = 0.1
+    clip_end: float = 100.0
+
+    def rotation_matrix(self) -> np.ndarray:
+        """Rotationsmatrix wie Blenders Euler ``XYZ`` (R = Rz · Ry · Rx)."""
+        rx, ry, rz = self.rotation_euler
+        cx, sx = math.cos(rx), math.sin(rx)
+        cy, sy = math.cos(ry), math.sin(ry)
+        cz, sz = math.cos(rz), math.sin(rz)
+        mat_x = np.array([[1.0, 0.0, 0.0], [0.0, cx, -sx], [0.0, sx, cx]])
+        mat_y = np.array([[cy, 0.0, sy], [0.0, 1.0, 0.0], [-sy, 0.0, cy]])
+        mat_z = np.array([[cz, -sz, 0.0], [sz, cz, 0.0], [0.0, 0.0, 1.0]])
+        return mat_z @ mat_y @ mat_x
+
+    def half_fov_tangents(self) -> tuple[float, float]:
+        """``tan`` der halben Öffnungswinkel (x, y) bei Sensor-Fit ``AUTO``."""
+        res_x, res_y = self.resolution
+        tan_sensor = self.sensor_width * 0.5 / self.lens
+        if res_x >= res_y:
+            return tan_sensor, tan_sensor * res_y / res_x
+        return tan_sensor * res_x / res_y, tan_sensor
+
+    def to_camera_space(self, points: np.ndarray) -> np.ndarray:
+        """Weltpunkte ``(n, 3)`` in Kamerakoordinaten (Blick entlang -Z, oben +Y)."""
+        return (points - np.asarray(self.location)) @ self.rotation_matrix()
+
+
+def camera_spec(cfg: SceneConfig) -> CameraSpec:
+    """Löst die Kamera der gewählten Szene auf (inkl. City-Override)."""
+    if cfg.scene_name.lower().strip() == "city":
+        location, rotation = cfg.city_camera_location, cfg.city_camera_rotation_euler
+    else:
+        location, rotation = cfg.camera_location, cfg.camera_rotation_euler
+    return CameraSpec(
+        location=tuple(location),
+        rotation_euler=tuple(rotation),
+        lens=cfg.camera_lens,
+        resolution=tuple(cfg.render_resolution),
+        clip_start=cfg.camera_clip_start,
+        clip_end=cfg.camera_clip_end,
+    )
+
+
+def bounding_spheres(plan: ScenePlan) -> tuple[np.ndarray, np.ndarray]:
+    """Mittelpunkte ``(n, 3)`` und Radien ``(n,)`` aller Objekte im Plan."""
+    transforms = plan.transform_array()
+    prim_radius = np.array([bounding_radius(spec) for spec in plan.primitives.values], dtype=np.float64)
+    radii = prim_radius[np.asarray(plan.primitive_ids)] * np.abs(transforms[:, 6:9]).max(axis=1)
+    return transforms[:, 0:3].astype(np.float64), radii
+
+
+def visible_mask(camera: CameraSpec, centers: np.ndarray, radii: np.ndarray, margin: float = 0.0) -> np.ndarray:
+    """``True`` für jede Kugel, die das Frustum (erweitert um ``margin``) schneidet."""
+    local = camera.to_camera_space(centers)
+    x, y, z = local[:, 0], local[:, 1], local[:, 2]
+    reach = radii + margin
+    depth = -z
+
+    tan_x, tan_y = camera.half_fov_tangents()
+    cos_x, sin_x = 1.0 / math.hypot(1.0, tan_x), tan_x / math.hypot(1.0, tan_x)
+    cos_y, sin_y = 1.0 / math.hypot(1.0, tan_y), tan_y / math.hypot(1.0, tan_y)
+
+    # Vorzeichenbehafteter Abstand zu den vier Seitenebenen (positiv = außerhalb).
+    inside = depth >= camera.clip_start - reach
+    inside &= depth <= camera.clip_end + reach
+    inside &= np.abs(x) * cos_x - depth * sin_x <= reach
+    inside &= np.abs(y) * cos_y - depth * sin_y <= reach
+    return inside
+
+
+def cull_plan(plan: ScenePlan, camera: CameraSpec, margin: float = 1.0) -> tuple[ScenePlan, dict]:
+    """Verwirft alle Objekte außerhalb des Kamera-Frustums.
+
+    Returns:
+        Gefilterter Plan und Statistik (``total``, ``kept``, ``culled``, ``cull_ratio``).
+    """
+    total = len(plan)
+    if total == 0:
+        return plan, {"total": 0, "kept": 0, "culled": 0, "cull_ratio": 0.0}
+
+    centers, radii = bounding_spheres(plan)
+    mask = visible_mask(camera, centers, radii, margin=margin)
+    kept = int(mask.sum())
+    stats = {"total": total, "kept": kept, "culled": total - kept, "cull_ratio": (total - kept) / total}
+    return plan.select(np.flatnonzero(mask)), stats
@@ -0,0 +1,261 @@
+"""Low-Level-Geometrie: Meshes über ``bpy.data``/``bmesh`` statt ``bpy.ops``.
+
+Jeder ``bpy.ops.mesh.primitive_*_add``-Aufruf prüft den Kontext, ändert die Selektion
+und stößt ein View-Layer-Update an. Bei tausenden Objekten dominiert das die Build-Zeit.
+Das ``data``-Backend baut Meshes direkt per ``bmesh`` und linkt die Objekte ohne Operator
+in eine Collection. Das ``ops``-Backend bleibt als Referenz/Fallback wählbar. ``instances``
+baut wie ``data``, erzeugt gestreute Props aber als Geometry-Nodes-Punkt-Instanzen
+(siehe ``scene_project.instancing``).
+"""
+
+from __future__ import annotations
+
+import math
+
+import bmesh
+import bpy
+
+from scene_project.datablocks import is_alive, tag_generated
+
+GEOMETRY_BACKENDS = ("data", "ops", "instances")
+
+# Custom Property auf Prototyp-Meshes (siehe ``assign_material``).
+PROTOTYPE_PROP = "sp_prototype"
+
+_active_backend = "data"
+
+# Prototyp-Registry: ein Mesh pro (Primitive, Parameter); Instanzen teilen sich dieses Mesh.
+_prototypes: dict[tuple, object] = {}
+_prototype_instances: dict[tuple, int] = {}
+
+
+def set_geometry_backend(name: str):
+    """Wählt das Backend für alle folgenden ``add_primitive``-Aufrufe."""
+    global _active_backend
+
+    backend = name.lower().strip()
+    if backend not in GEOMETRY_BACKENDS:
+        supported = ", ".join(GEOMETRY_BACKENDS)
+        raise ValueError(f"Unbekanntes Geometrie-Backend '{name}'. Erlaubt: {supported}")
+    _active_backend = backend
+
+
+def get_geometry_backend() -> str:
+    """Liefert das aktuell aktive Geometrie-Backend."""
+    return _active_backend
+
+
+def _create_plane(bm, size: float = 2.0):
+    # create_grid erwartet die halbe Kantenlänge (wie primitive_plane_add intern).
+    bmesh.ops.create_grid(bm, x_segments=1, y_segments=1, size=size / 2.0, calc_uvs=True)
+
+
+def _create_cube(bm, size: float = 2.0):
+    bmesh.ops.create_cube(bm, size=size, calc_uvs=True)
+
+
+def _create_cylinder(bm, vertices: int = 32, radius: float = 1.0, depth: float = 2.0):
+    bmesh.ops.create_cone(
+        bm,
+        cap_ends=True,
+        cap_tris=False,
+        segments=vertices,
+        radius1=radius,
+        radius2=radius,
+        depth=depth,
+        calc_uvs=True,
+    )
+
+
+def _create_cone(
+    bm,
+    vertices: int = 32,
+    radius1: float = 1.0,
+    radius2: float = 0.0,
+    depth: float = 2.0,
+):
+    bmesh.ops.create_cone(
+        bm,
+        cap_ends=True,
+        cap_tris=False,
+        segments=vertices,
+        radius1=radius1,
+        radius2=radius2,
+        depth=depth,
+        calc_uvs=True,
+    )
+
+
+def _create_uv_sphere(bm, segments: int = 32, ring_count: int = 16, radius: float = 1.0):
+    bmesh.ops.create_uvsphere(bm, u_segments=segments, v_segments=ring_count, radius=radius, calc_uvs=True)
+    # Die Face-Reihenfolge von create_uvsphere schwankt zwischen Prozessen; nach Vertex-Indizes sortieren,
+    # damit parallel gebaute Teile bitgleich zum seriellen Build sind.
+    n = len(bm.verts)
+    bm.faces.sort(key=lambda face: sum(i * n**k for k, i in enumerate(sorted((v.index for v in face.verts)))))
+
+
+def _create_ico_sphere(bm, subdivisions: int = 2, radius: float = 1.0):
+    bmesh.ops.create_icosphere(bm, subdivisions=subdivisions, radius=radius, calc_uvs=True)
+
+
+def _create_torus(
+    bm,
+    major_radius: float = 1.0,
+    minor_radius: float = 0.25,
+    major_segments: int = 48,
+    minor_segments: int = 12,
+):
+    # bmesh hat keinen Torus-Operator; Topologie wie in ``primitive_torus_add``.
+    rings = []
+    for i in range(major_segments):
+        theta = 2.0 * math.pi * i / major_segments
+        cos_t, sin_t = math.cos(theta), math.sin(theta)
+        ring = []
+        for j in range(minor_segments):
+            phi = 2.0 * math.pi * j / minor_segments
+            dist = major_radius + minor_radius * math.cos(phi)
+            ring.append(bm.verts.new((dist * cos_t, dist * sin_t, minor_radius * math.sin(phi))))
+        rings.append(ring)
+
+    for i in range(major_segments):
+        ring, next_ring = rings[i], rings[(i + 1) % major_segments]
+        for j in range(minor_segments):
+            k = (j + 1) % minor_segments
+            bm.faces.new((ring[j], next_ring[j], next_ring[k], ring[k]))
+
+
+_BMESH_BUILDERS = {
+    "plane": _create_plane,
+    "cube": _create_cube,
+    "cylinder": _create_cylinder,
+    "cone": _create_cone,
+    "uv_sphere": _create_uv_sphere,
+    "ico_sphere": _create_ico_sphere,
+    "torus": _create_torus,
+}
+
+
+def build_primitive_mesh(kind: str, name: str, **params):
+    """Erzeugt einen Mesh-Datablock für ein Primitive, ohne ein Objekt anzulegen."""
+    builder = _BMESH_BUILDERS.get(kind)
+    if builder is None:
+        supported = ", ".join(sorted(_BMESH_BUILDERS))
+        raise ValueError(f"Unbekanntes Primitive '{kind}'. Erlaubt: {supported}")
+
+    bm = bmesh.new()
+    try:
+        bm.loops.layers.uv.new("UVMap")
+        builder(bm, **params)
+        mesh = tag_generated(bpy.data.meshes.new(name))
+        bm.to_mesh(mesh)
+    finally:
+        bm.free()
+    return mesh
+
+
+def _prototype_key(kind: str, params: dict) -> tuple:
+    return (kind, tuple(sorted(params.items())))
+
+
+def _prototype_name(key: tuple) -> str:
+    kind, params = key
+    suffix = "_".join(f"{name}{value:g}" for name, value in params)
+    return f"Proto_{kind}_{suffix}" if suffix else f"Proto_{kind}"
+
+
+def get_prototype_mesh(kind: str, instances: int = 1, **params):
+    """Liefert das geteilte Prototyp-Mesh für ein Primitive (legt es bei Bedarf an).
+
+    ``instances`` zählt, wie viele Objekte das Mesh nutzen werden (für den Build-Report).
+    """
+    key = _prototype_key(kind, params)
+    mesh = _prototypes.get(key)
+    if not is_alive(mesh):
+        name = _prototype_name(key)
+        mesh = bpy.data.meshes.get(name)
+        if mesh is None or not mesh.get(PROTOTYPE_PROP):
+            mesh = build_primitive_mesh(kind, name, **params)
+            mesh[PROTOTYPE_PROP] = True
+            # Leerer Slot, damit Instanzen Objekt-Materialien tragen können.
+            mesh.materials.append(None)
+        _prototypes[key] = mesh
+
+    _prototype_instances[key] = _prototype_instances.get(key, 0) + instances
+    return mesh
+
+
+def reset_prototype_stats():
+    """Setzt die Instanz-Zähler für einen neuen Build zurück."""
+    _prototype_instances.clear()
+
+
+def prototype_stats() -> dict[str, int]:
+    """Kennzahlen für den Build-Report: Prototypen, Instanzen und gesparte Meshes."""
+    instances = sum(_prototype_instances.values())
+    prototypes = len(_prototype_instances)
+    return {
+        "prototypes": prototypes,
+        "instances": instances,
+        "meshes_saved": instances - prototypes,
+    }
+
+
+def link_object(
+    name: str,
+    mesh,
+    location: tuple[float, float, float] = (0.0, 0.0, 0.0),
+    rotation: tuple[float, float, float] | None = None,
+    scale: tuple[float, float, float] | None = None,
+    collection=None,
+):
+    """Legt ein Objekt für ``mesh`` an und linkt es ohne Operator in eine Collection."""
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    if rotation is not None:
+        obj.rotation_euler = rotation
+    if scale is not None:
+        obj.scale = scale
+
+    target = collection or bpy.context.collection
+    target.objects.link(obj)
+    return obj
+
+
+def add_primitive(
+    kind: str,
+    name: str,
+    location: tuple[float, float, float] = (0.0, 0.0, 0.0),
+    rotation: tuple[float, float, float] | None = None,
+    scale: tuple[float, float, float] | None = None,
+    collection=None,
+    shared: bool = False,
+    **params,
+):
+    """Erzeugt ein Primitive-Objekt über das aktive Backend.
+
+    ``params`` entsprechen den Parametern von ``bpy.ops.mesh.primitive_<kind>_add``
+    (z. B. ``radius``, ``depth``, ``vertices``, ``subdivisions``).
+    Mit ``shared=True`` verwendet das ``data``-Backend ein geteiltes Prototyp-Mesh;
+    Variation entsteht dann nur über Location/Rotation/Scale des Objekts.
+    """
+    if _active_backend == "ops":
+        operator = getattr(bpy.ops.mesh, f"primitive_{kind}_add")
+        operator(location=location, **params)
+        obj = bpy.context.active_object
+        obj.name = name
+        tag_generated(obj.data)
+        if rotation is not None:
+            obj.rotation_euler = rotation
+        if scale is not None:
+            obj.scale = scale
+        if collection is not None and collection not in obj.users_collection:
+            for existing in obj.users_collection:
+                existing.objects.unlink(obj)
+            collection.objects.link(obj)
+        return obj
+
+    if shared:
+        mesh = get_prototype_mesh(kind, **params)
+    else:
+        mesh = build_primitive_mesh(kind, name, **params)
+    return link_object(name, mesh, location=location, rotation=rotation, scale=scale, collection=collection)
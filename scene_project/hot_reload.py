@@ -0,0 +1,133 @@
+"""Selektives Neuladen der ``scene_project``-Module für wiederholtes "Run Script" – ohne ``bpy``.
+
+Pro Modul werden mtime, Größe und (nur bei geänderter mtime) ein SHA-256 des Inhalts gemerkt.
+``reload_changed`` lädt nur Module mit geändertem Inhalt neu, dazu alle Module, die sie direkt
+oder indirekt importieren (sonst hielten diese per ``from ... import`` alte Funktionen fest).
+Den Import-Graphen liefert ``import_graph`` per ``ast`` aus dem Quelltext, ohne etwas zu importieren.
+
+Im ersten Lauf eines Prozesses gelten nur Module als geändert, die schon geladen sind (ihr Stand
+ist unbekannt); alle anderen werden ohnehin frisch importiert.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import importlib
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+PACKAGE = "scene_project"
+PACKAGE_DIR = Path(__file__).resolve().parent
+# Wird von ``run_in_blender.py`` immer neu geladen und nicht selbst verfolgt.
+_UNTRACKED = ("__init__", "hot_reload")
+
+# Stand des letzten Laufs: Modul -> (mtime_ns, Größe, SHA-256). ``importlib.reload`` führt das Modul
+# im bestehenden Modul-Dict aus, daher überlebt der Stand das Neuladen dieses Moduls.
+_fingerprints: dict[str, tuple[int, int, str]] = globals().get("_fingerprints", {})
+
+
+class ReloadResult(NamedTuple):
+    changed: tuple[str, ...]
+    reloaded: tuple[str, ...]
+
+
+def _module_paths(package_dir: Path) -> dict[str, Path]:
+    return {path.stem: path for path in sorted(package_dir.glob("*.py")) if path.stem not in _UNTRACKED}
+
+
+def _fingerprint(path: Path, previous: tuple[int, int, str] | None) -> tuple[int, int, str]:
+    stat = path.stat()
+    if previous is not None and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+        return previous
+    return stat.st_mtime_ns, stat.st_size, hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _imported_modules(path: Path) -> set[str]:
+    """Paket-Module, die ``path`` importiert (auch verzögerte Imports in Funktionen)."""
+    found = set()
+    for node in ast.walk(ast.parse(path.read_bytes(), filename=str(path))):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module == PACKAGE:
+            names = [f"{PACKAGE}.{alias.name}" for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names = [node.module]
+        else:
+            continue
+        found.update(name.split(".")[1] for name in names if name.startswith(f"{PACKAGE}."))
+    return found
+
+
+def import_graph(package_dir: Path = PACKAGE_DIR) -> dict[str, set[str]]:
+    """Modul -> direkt importierte Paket-Module."""
+    paths = _module_paths(package_dir)
+    return {name: _imported_modules(path) & set(paths) for name, path in paths.items()}
+
+
+def _closure(modules, edges: dict[str, set[str]]) -> set[str]:
+    seen = set()
+    stack = list(modules)
+    while stack:
+        name = stack.pop()
+        if name not in seen:
+            seen.add(name)
+            stack.extend(edges.get(name, ()))
+    return seen
+
+
+def dependencies(modules, graph: dict[str, set[str]]) -> set[str]:
+    """``modules`` samt allem, was sie direkt oder indirekt importieren."""
+    return _closure(modules, graph)
+
+
+def dependents(modules, graph: dict[str, set[str]]) -> set[str]:
+    """``modules`` samt allen Modulen, die sie direkt oder indirekt importieren."""
+    reverse: dict[str, set[str]] = {}
+    for name, imports in graph.items():
+        for imported in imports:
+            reverse.setdefault(imported, set()).add(name)
+    return _closure(modules, reverse)
+
+
+def reload_order(modules, graph: dict[str, set[str]]) -> list[str]:
+    """``modules`` so sortiert, dass Abhängigkeiten vor ihren Importeuren kommen."""
+    selected = set(modules)
+    order, visiting = [], set()
+
+    def visit(name: str):
+        if name in order or name in visiting:
+            return
+        visiting.add(name)
+        for imported in sorted(graph.get(name, ())):
+            if imported in selected:
+                visit(imported)
+        order.append(name)
+
+    for name in sorted(selected):
+        visit(name)
+    return order
+
+
+def reload_changed(package_dir: Path = PACKAGE_DIR) -> ReloadResult:
+    """Lädt geänderte Module und ihre Importeure neu (Abhängigkeiten zuerst)."""
+    changed = []
+    for name, path in _module_paths(package_dir).items():
+        previous = _fingerprints.get(name)
+        current = _fingerprints[name] = _fingerprint(path, previous)
+        if previous is None:
+            # Bereits geladen, aber mit unbekanntem Stand (z. B. aus einem älteren Lauf ohne hot_reload).
+            stale = f"{PACKAGE}.{name}" in sys.modules
+        else:
+            stale = previous[2] != current[2]
+        if stale:
+            changed.append(name)
+    if not changed:
+        return ReloadResult((), ())
+
+    graph = import_graph(package_dir)
+    loaded = [name for name in reload_order(dependents(changed, graph), graph) if f"{PACKAGE}.{name}" in sys.modules]
+    for name in loaded:
+        importlib.reload(sys.modules[f"{PACKAGE}.{name}"])
+    return ReloadResult(tuple(changed), tuple(loaded))
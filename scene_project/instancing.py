@@ -0,0 +1,159 @@
+"""Punkt-Instanzen per Geometry Nodes für massenhaft gestreute Props (Backend ``instances``).
+
+Statt eines Objekts pro Baum oder Stein entsteht pro (Collection, Primitive, Material) ein
+Objekt mit einem Punkt-Mesh: ein Vertex pro Instanz, Rotation und Scale (im Material-Modus
+``attributes`` auch die Farbwerte) als Punkt-Attribute – alles per ``foreach_set``. Ein
+gemeinsamer Node-Tree (``SP_PointInstancer``) setzt das Prototyp-Mesh auf die Punkte.
+
+Das Prototyp-Objekt liegt versteckt in derselben Collection, damit Aufräumen, Build-Cache
+und parallele Worker es zusammen mit den Instanzen behandeln.
+"""
+
+from __future__ import annotations
+
+import bpy
+import numpy as np
+
+from scene_project.datablocks import is_alive, tag_generated
+from scene_project.profiler import profiled
+
+INSTANCER_TREE = "SP_PointInstancer"
+ROTATION_ATTRIBUTE = "sp_rotation"
+SCALE_ATTRIBUTE = "sp_scale"
+
+_tree = None
+_stats = {"objects": 0, "points": 0}
+
+
+def _new_socket(tree, name: str, in_out: str, socket_type: str):
+    if hasattr(tree, "interface"):
+        # Ab Blender 4.0 liegen Gruppen-Sockets im Interface.
+        return tree.interface.new_socket(name, in_out=in_out, socket_type=socket_type)
+    sockets = tree.inputs if in_out == "INPUT" else tree.outputs
+    return sockets.new(socket_type, name)
+
+
+def _named_attribute(nodes, name: str):
+    node = nodes.new(type="GeometryNodeInputNamedAttribute")
+    node.data_type = "FLOAT_VECTOR"
+    node.inputs["Name"].default_value = name
+    return node
+
+
+def _build_tree():
+    tree = tag_generated(bpy.data.node_groups.new(INSTANCER_TREE, "GeometryNodeTree"))
+    for name, in_out, socket_type in (
+        ("Geometry", "INPUT", "NodeSocketGeometry"),
+        ("Prototype", "INPUT", "NodeSocketObject"),
+        ("Material", "INPUT", "NodeSocketMaterial"),
+        ("Geometry", "OUTPUT", "NodeSocketGeometry"),
+    ):
+        _new_socket(tree, name, in_out, socket_type)
+
+    nodes, links = tree.nodes, tree.links
+    group_in = nodes.new(type="NodeGroupInput")
+    group_out = nodes.new(type="NodeGroupOutput")
+    info = nodes.new(type="GeometryNodeObjectInfo")
+    info.transform_space = "ORIGINAL"
+    set_material = nodes.new(type="GeometryNodeSetMaterial")
+    instance = nodes.new(type="GeometryNodeInstanceOnPoints")
+
+    links.new(group_in.outputs["Prototype"], info.inputs["Object"])
+    links.new(info.outputs["Geometry"], set_material.inputs["Geometry"])
+    links.new(group_in.outputs["Material"], set_material.inputs["Material"])
+    links.new(group_in.outputs["Geometry"], instance.inputs["Points"])
+    links.new(set_material.outputs["Geometry"], instance.inputs["Instance"])
+    # Euler-Vektor; ab 4.x wandelt Blender ihn implizit in einen Rotation-Socket um.
+    links.new(_named_attribute(nodes, ROTATION_ATTRIBUTE).outputs["Attribute"], instance.inputs["Rotation"])
+    links.new(_named_attribute(nodes, SCALE_ATTRIBUTE).outputs["Attribute"], instance.inputs["Scale"])
+    links.new(instance.outputs["Instances"], group_out.inputs[0])
+    return tree
+
+
+def get_instancer_tree():
+    """Liefert den gemeinsamen Instanzierungs-Node-Tree (legt ihn bei Bedarf an)."""
+    global _tree
+
+    if not is_alive(_tree):
+        tree = bpy.data.node_groups.get(INSTANCER_TREE)
+        _tree = tree if tree is not None and tree.library is None else _build_tree()
+    return _tree
+
+
+def _input_identifiers(tree) -> dict[str, str]:
+    """Socket-Name -> Identifier der Gruppen-Eingänge (Schlüssel der Modifier-Properties)."""
+    if hasattr(tree, "interface"):
+        items = [item for item in tree.interface.items_tree if getattr(item, "in_out", None) == "INPUT"]
+    else:
+        items = tree.inputs
+    return {item.name: item.identifier for item in items}
+
+
+def _point_attribute(mesh, name: str, values: np.ndarray):
+    if values.ndim == 1:
+        mesh.attributes.new(name, "FLOAT", "POINT").data.foreach_set("value", values)
+    elif values.shape[1] == 4:
+        mesh.attributes.new(name, "FLOAT_COLOR", "POINT").data.foreach_set("color", values.ravel())
+    else:
+        mesh.attributes.new(name, "FLOAT_VECTOR", "POINT").data.foreach_set("vector", values.ravel())
+
+
+@profiled
+def add_point_instances(
+    name: str,
+    prototype_mesh,
+    material,
+    collection,
+    locations: np.ndarray,
+    rotations: np.ndarray,
+    scales: np.ndarray,
+    attributes: dict[str, np.ndarray] | None = None,
+):
+    """Legt ein Objekt an, das ``prototype_mesh`` auf ``len(locations)`` Punkte instanziert.
+
+    Args:
+        locations, rotations, scales: ``(n, 3)``-Arrays (Rotation als Euler XYZ).
+        attributes: Weitere Punkt-Attribute ``{name: (n,) oder (n, 4)}``; landen als
+            Instanz-Attribute beim Shader (Attribute-Node Typ ``INSTANCER``).
+
+    Returns:
+        Das Instanz-Objekt.
+    """
+    count = len(locations)
+    points = tag_generated(bpy.data.meshes.new(name))
+    points.vertices.add(count)
+    points.vertices.foreach_set("co", np.ascontiguousarray(locations, dtype=np.float32).ravel())
+    _point_attribute(points, ROTATION_ATTRIBUTE, np.asarray(rotations, dtype=np.float32))
+    _point_attribute(points, SCALE_ATTRIBUTE, np.asarray(scales, dtype=np.float32))
+    for key, values in (attributes or {}).items():
+        _point_attribute(points, key, np.asarray(values, dtype=np.float32))
+    points.update()
+
+    prototype = bpy.data.objects.new(f"{name}_Prototype", prototype_mesh)
+    prototype.hide_render = True
+    prototype.hide_viewport = True
+    collection.objects.link(prototype)
+
+    obj = bpy.data.objects.new(name, points)
+    collection.objects.link(obj)
+    tree = get_instancer_tree()
+    modifier = obj.modifiers.new("Instances", "NODES")
+    modifier.node_group = tree
+    inputs = _input_identifiers(tree)
+    modifier[inputs["Prototype"]] = prototype
+    if material is not None:
+        modifier[inputs["Material"]] = material
+
+    _stats["objects"] += 1
+    _stats["points"] += count
+    return obj
+
+
+def reset_instance_stats():
+    """Setzt die Zähler für einen neuen Build zurück."""
+    _stats.update(objects=0, points=0)
+
+
+def instance_stats() -> dict[str, int]:
+    """Kennzahlen für den Build-Report: Instanz-Objekte und Punkte."""
+    return dict(_stats)
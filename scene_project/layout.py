@@ -0,0 +1,872 @@
+"""Platzierungslogik der Szenen als reine Plan-Funktionen (ohne ``bpy``).
+
+Jede ``plan_*``-Funktion hängt Objekte an einen ``ScenePlan`` an. Die gleichnamigen
+``add_*``-Builder in ``objects.py`` wenden diese Pläne nur noch in Blender an.
+Zufällige Layouts ziehen alle Werte eines Builders in einem NumPy-Aufruf aus dem
+eigenen Stream (``scene_stream(seed, "<builder>")``).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from scene_project.config import SceneConfig
+from scene_project.plan import ScenePlan, material, primitive
+from scene_project.profiler import profiled
+from scene_project.scatter import (
+    EllipseZone,
+    RectZone,
+    SpatialHash,
+    poisson_scatter,
+    ring_angles,
+    scatter_xy,
+    scene_stream,
+    uniform_vec3,
+)
+
+# Collections pro Builder
+FOREST_GROUND = "Forest_Ground"
+FOREST_TREES = "Forest_Trees"
+FOREST_ROCKS = "Forest_Rocks"
+FOREST_BUSHES = "Forest_Bushes"
+FOREST_POND = "Forest_Pond"
+CITY_GROUND = "City_Ground"
+CITY_ROADS = "City_Roads"
+CITY_BLOCKS = "City_Blocks"
+CITY_SPIRE = "City_Spire"
+CITY_SKYWAY = "City_Skyway"
+CITY_BILLBOARDS = "City_Billboards"
+CITY_DRONES = "City_Drones"
+CITY_STATIC = "City_Static"
+FOREST_LIGHTS = "Forest_Lights"
+CITY_LIGHTS = "City_Lights"
+SCENE_CAMERA = "Scene_Camera"
+CITY_TILES = "City_Tiles"
+# Collections, deren Objekte "bake static" pro Material zusammenführen darf (Drohnen bleiben einzeln).
+CITY_STATIC_SOURCES = (CITY_GROUND, CITY_ROADS, CITY_BLOCKS, CITY_SPIRE, CITY_SKYWAY, CITY_BILLBOARDS)
+# Collections mit vielen gleichen Props; das Geometrie-Backend "instances" erzeugt sie als Punkt-Instanzen.
+SCATTER_COLLECTIONS = (FOREST_TREES, FOREST_ROCKS, FOREST_BUSHES, CITY_BILLBOARDS, CITY_DRONES)
+
+# Geteilte Einheits-Primitives; Größe kommt aus dem Objekt-Scale.
+UNIT_CUBE = primitive("cube", shared=True)
+UNIT_CYLINDER = primitive("cylinder", shared=True, radius=1.0, depth=1.0)
+UNIT_ICO_SPHERE = primitive("ico_sphere", shared=True, subdivisions=1, radius=1.0)
+UNIT_UV_SPHERE = primitive("uv_sphere", shared=True, radius=1.0)
+
+M_TRUNK = material("principled", "M_Trunk", base_color=(0.18, 0.10, 0.05, 1.0), roughness=0.8, metallic=0.0)
+M_CROWN = material("principled", "M_Crown", base_color=(0.08, 0.28, 0.12, 1.0), roughness=0.6, metallic=0.0)
+M_CITY_ROOFTOP = material(
+    "principled",
+    "M_City_Rooftop",
+    base_color=(0.03, 0.03, 0.04, 1.0),
+    roughness=0.45,
+    metallic=0.65,
+)
+
+M_CITY_ROAD = material(
+    "principled",
+    "M_City_Road",
+    base_color=(0.015, 0.015, 0.02, 1.0),
+    roughness=0.85,
+    metallic=0.05,
+)
+M_CITY_ROAD_LINE = material("emission", "M_City_Road_Line", color=(0.1, 0.85, 1.0, 1.0), strength=3.0)
+ROAD_PLANE = primitive("plane", shared=True, size=1.0)
+
+CITY_NEON_VARIANTS = [
+    ("M_City_Blue", (0.08, 0.22, 0.45, 1.0), (0.18, 0.70, 1.0, 1.0)),
+    ("M_City_Purple", (0.19, 0.09, 0.32, 1.0), (0.65, 0.28, 1.0, 1.0)),
+    ("M_City_Cyan", (0.05, 0.28, 0.30, 1.0), (0.20, 1.0, 0.9, 1.0)),
+]
+
+POND_LOCATION = (0.0, -1.8, 0.02)
+# Flaches, leicht ovales Gewässer wirkt natürlicher als ein perfekter Kreis.
+POND_SCALE = (1.2, 0.85, 1.0)
+
+SPIRE_RADIUS = 1.3
+
+DRONE_VARIANTS = [
+    ("M_Drone_Cyan", (0.25, 1.0, 0.9, 1.0)),
+    ("M_Drone_Magenta", (1.0, 0.28, 0.85, 1.0)),
+    ("M_Drone_Blue", (0.35, 0.55, 1.0, 1.0)),
+]
+
+
+def _scatter_positions(
+    rng,
+    count: int,
+    area_half_extent: float,
+    min_spacing: float,
+    spatial_hash: SpatialHash | None,
+    label: str,
+):
+    """Gleichverteilt oder – mit Mindestabstand/Hash – per Poisson-Disk."""
+    if min_spacing <= 0.0 and spatial_hash is None:
+        return scatter_xy(rng, count, area_half_extent)
+
+    xy = poisson_scatter(rng, count, area_half_extent, min_spacing, spatial_hash=spatial_hash)
+    if len(xy) < count:
+        print(f"[scene_project] {label}: nur {len(xy)}/{count} platziert (Mindestabstand {min_spacing}).")
+    return xy
+
+
+def pond_zone(radius: float, location: tuple[float, float, float] = POND_LOCATION) -> EllipseZone:
+    """Sperrfläche des Teichs (gleiche Ellipse wie ``plan_forest_pond``)."""
+    return EllipseZone(location[0], location[1], radius * POND_SCALE[0], radius * POND_SCALE[1])
+
+
+def _road_strips(grid_size: int, spacing: float) -> tuple[list[float], float, float]:
+    """Versätze der Straßenstreifen, ihre Länge und Breite (``ROAD_PLANE`` hat Kantenlänge 1)."""
+    half = (grid_size - 1) * spacing * 0.5
+    offsets = [-half - spacing * 0.5 + i * spacing for i in range(grid_size + 1)]
+    return offsets, half + spacing * 0.5, spacing * 0.22
+
+
+def road_zones(grid_size: int, spacing: float) -> list[RectZone]:
+    """Sperrflächen der Straßenstreifen aus ``plan_city_roads`` (gleiche Maße über ``_road_strips``)."""
+    offsets, road_length, road_width = _road_strips(grid_size, spacing)
+    zones = []
+    for offset in offsets:
+        zones.append(RectZone(offset, 0.0, road_width * 0.5, road_length * 0.5))
+        zones.append(RectZone(0.0, offset, road_length * 0.5, road_width * 0.5))
+    return zones
+
+
+def tower_zones(footprints) -> list[RectZone]:
+    """Sperrflächen aus den Tower-Footprints ``(x, y, width, depth)`` von ``plan_city_block_grid``."""
+    return [RectZone(x, y, width * 0.5, depth * 0.5) for x, y, width, depth in footprints.tolist()]
+
+
+@profiled
+def plan_ground(plan: ScenePlan, size: float = 20.0):
+    """Ground-Plane für den Wald."""
+    mat = material("principled", "M_Ground", base_color=(0.12, 0.16, 0.13, 1.0), roughness=0.9, metallic=0.0)
+    plan.add("Ground", primitive("plane", size=size), mat, FOREST_GROUND, (0.0, 0.0, 0.0))
+
+
+@profiled
+def plan_forest_pond(
+    plan: ScenePlan,
+    radius: float = 2.4,
+    location: tuple[float, float, float] = POND_LOCATION,
+):
+    """Flacher, leicht ovaler Teich."""
+    mat = material("principled", "M_Pond_Water", base_color=(0.05, 0.16, 0.20, 1.0), roughness=0.08, metallic=0.0)
+    plan.add(
+        "ForestPond",
+        primitive("cylinder", vertices=40, radius=radius, depth=0.08),
+        mat,
+        FOREST_POND,
+        location,
+        scale=POND_SCALE,
+    )
+
+
+@profiled
+def plan_city_ground(plan: ScenePlan, size: float = 24.0):
+    """Dunkle Ground-Plane für City-Szenen."""
+    mat = material("principled", "M_City_Ground", base_color=(0.02, 0.02, 0.03, 1.0), roughness=0.95, metallic=0.0)
+    plan.add("CityGround", primitive("plane", size=size), mat, CITY_GROUND, (0.0, 0.0, 0.0))
+
+
+def plan_tree(plan: ScenePlan, location: tuple[float, float, float], scale: float = 1.0, serial: int = 0):
+    """Sehr einfacher Low-Poly-Baum (Stamm + Krone)."""
+    x, y, z = location
+    plan.add(
+        "Tree_Trunk_{i:02d}",
+        UNIT_CYLINDER,
+        M_TRUNK,
+        FOREST_TREES,
+        (x, y, z + 0.55 * scale),
+        scale=(0.12 * scale, 0.12 * scale, 1.1 * scale),
+        serial=serial,
+    )
+    plan.add(
+        "Tree_Crown_{i:02d}",
+        UNIT_ICO_SPHERE,
+        M_CROWN,
+        FOREST_TREES,
+        (x, y, z + 1.25 * scale),
+        scale=(0.6 * scale,) * 3,
+        serial=serial,
+    )
+
+
+@profiled
+def plan_tree_cluster(
+    plan: ScenePlan,
+    count: int,
+    area_half_extent: float,
+    seed: int = 42,
+    min_spacing: float = 0.0,
+    spatial_hash: SpatialHash | None = None,
+):
+    """Mehrere Bäume verteilt in einem Bereich."""
+    rng = scene_stream(seed, "trees")
+    xy = _scatter_positions(rng, count, area_half_extent, min_spacing, spatial_hash, "Bäume")
+    count = len(xy)
+    scale = rng.uniform(0.8, 1.3, size=count)
+
+    plan.add_batch(
+        "Tree_Trunk_{i:02d}",
+        UNIT_CYLINDER,
+        M_TRUNK,
+        FOREST_TREES,
+        np.column_stack((xy, 0.55 * scale)),
+        scales=np.column_stack((0.12 * scale, 0.12 * scale, 1.1 * scale)),
+    )
+    plan.add_batch(
+        "Tree_Crown_{i:02d}",
+        UNIT_ICO_SPHERE,
+        M_CROWN,
+        FOREST_TREES,
+        np.column_stack((xy, 1.25 * scale)),
+        scales=np.repeat(0.6 * scale[:, None], 3, axis=1),
+    )
+
+
+@profiled
+def plan_rock_field(
+    plan: ScenePlan,
+    count: int,
+    area_half_extent: float,
+    seed: int = 101,
+    min_spacing: float = 0.0,
+    spatial_hash: SpatialHash | None = None,
+):
+    """Kleinere Felsen auf dem Waldboden."""
+    rng = scene_stream(seed, "rocks")
+    rock_mat = material("principled", "M_Rock", base_color=(0.24, 0.25, 0.23, 1.0), roughness=0.92, metallic=0.0)
+
+    xy = _scatter_positions(rng, count, area_half_extent, min_spacing, spatial_hash, "Felsen")
+    count = len(xy)
+    scale = rng.uniform(0.15, 0.45, size=count)
+    stretch = uniform_vec3(rng, count, (1.0, 0.8, 0.6), (1.8, 1.3, 1.0))
+    rotation = uniform_vec3(rng, count, (-0.35, -0.35, 0.0), (0.35, 0.35, 3.14))
+
+    plan.add_batch(
+        "Rock_{i:02d}",
+        UNIT_ICO_SPHERE,
+        rock_mat,
+        FOREST_ROCKS,
+        np.column_stack((xy, scale * 0.45)),
+        rotations=rotation,
+        scales=stretch * scale[:, None],
+    )
+
+
+@profiled
+def plan_bush_cluster(
+    plan: ScenePlan,
+    count: int,
+    area_half_extent: float,
+    seed: int = 202,
+    min_spacing: float = 0.0,
+    spatial_hash: SpatialHash | None = None,
+):
+    """Niedrige Büsche zwischen den Bäumen."""
+    rng = scene_stream(seed, "bushes")
+    bush_mat = material("principled", "M_Bush", base_color=(0.09, 0.33, 0.14, 1.0), roughness=0.55, metallic=0.0)
+
+    xy = _scatter_positions(rng, count, area_half_extent, min_spacing, spatial_hash, "Büsche")
+    count = len(xy)
+    size = rng.uniform(0.25, 0.7, size=count)
+    stretch_y = rng.uniform(0.7, 1.4, size=count)
+
+    plan.add_batch(
+        "Bush_{i:02d}",
+        UNIT_UV_SPHERE,
+        bush_mat,
+        FOREST_BUSHES,
+        np.column_stack((xy, size * 0.6)),
+        scales=np.column_stack((1.2 * size, stretch_y * size, 0.65 * size)),
+    )
+
+
+def _plan_towers(plan: ScenePlan, rng, x, y, min_height: float, max_height: float, collection: str, prefix: str = ""):
+    """Tower + Dach-Aufbau an den Rasterpunkten ``x``/``y``; liefert die Footprints."""
+    count = len(x)
+    height = rng.uniform(min_height, max_height, size=count)
+    variant = rng.integers(0, len(CITY_NEON_VARIANTS), size=count)
+    width = rng.uniform(1.2, 2.0, size=count)
+    depth = rng.uniform(1.2, 2.0, size=count)
+    roof_height = rng.uniform(0.2, 0.5, size=count)
+
+    tower_mats = [
+        material("window", name, base_color=color, emission_color=emissive, emission_strength=1.6)
+        for name, color, emissive in CITY_NEON_VARIANTS
+    ]
+    plan.add_batch(
+        f"Tower_{prefix}{{i:03d}}",
+        UNIT_CUBE,
+        tower_mats,
+        collection,
+        np.column_stack((x, y, height / 2.0)),
+        scales=np.column_stack((width / 2.0, depth / 2.0, height / 2.0)),
+        material_choice=variant,
+    )
+    # Dach-Aufbau (Tech-Box)
+    plan.add_batch(
+        f"Rooftop_{prefix}{{i:03d}}",
+        UNIT_CUBE,
+        M_CITY_ROOFTOP,
+        collection,
+        np.column_stack((x, y, height + roof_height / 2.0)),
+        scales=np.column_stack((width * 0.22, depth * 0.22, roof_height / 2.0)),
+    )
+    return np.column_stack((x, y, width, depth))
+
+
+def _tower_cells(gx, gy):
+    # Jede dritte Kachel bleibt frei als "Straßenraum".
+    return (gx + gy) % 3 != 0
+
+
+@profiled
+def plan_city_block_grid(
+    plan: ScenePlan,
+    grid_size: int,
+    spacing: float,
+    min_height: float,
+    max_height: float,
+    seed: int = 7,
+):
+    """Futuristisches City-Grid mit variierenden Tower-Höhen (Tower + Dach-Aufbau).
+
+    Returns:
+        Footprints der Tower als ``(n, 4)``-Array ``(x, y, width, depth)``.
+    """
+    rng = scene_stream(seed, "city_blocks")
+    half = (grid_size - 1) * spacing * 0.5
+
+    gx, gy = np.meshgrid(np.arange(grid_size), np.arange(grid_size), indexing="ij")
+    keep = _tower_cells(gx, gy).ravel()
+    x = (gx.ravel() * spacing - half)[keep]
+    y = (gy.ravel() * spacing - half)[keep]
+    return _plan_towers(plan, rng, x, y, min_height, max_height, CITY_BLOCKS)
+
+
+@profiled
+def plan_city_roads(plan: ScenePlan, grid_size: int, spacing: float, line_width: float = 0.12):
+    """Schlichtes Straßenraster mit leuchtenden Markierungen."""
+    offsets, road_extent, road_width = _road_strips(grid_size, spacing)
+
+    for i, offset in enumerate(offsets):
+        plan.add(
+            "Road_X_{i:02d}",
+            ROAD_PLANE,
+            M_CITY_ROAD,
+            CITY_ROADS,
+            (offset, 0.0, 0.001),
+            scale=(road_width, road_extent, 1.0),
+            serial=i,
+        )
+        plan.add(
+            "Road_Y_{i:02d}",
+            ROAD_PLANE,
+            M_CITY_ROAD,
+            CITY_ROADS,
+            (0.0, offset, 0.001),
+            scale=(road_extent, road_width, 1.0),
+            serial=i,
+        )
+
+    for i, offset in enumerate(offsets):
+        plan.add(
+            "RoadLine_X_{i:02d}",
+            UNIT_CUBE,
+            M_CITY_ROAD_LINE,
+            CITY_ROADS,
+            (offset, 0.0, 0.012),
+            scale=(line_width, road_extent * 0.98, 0.002),
+            serial=i,
+        )
+        plan.add(
+            "RoadLine_Y_{i:02d}",
+            UNIT_CUBE,
+            M_CITY_ROAD_LINE,
+            CITY_ROADS,
+            (0.0, offset, 0.012),
+            scale=(road_extent * 0.98, line_width, 0.002),
+            serial=i,
+        )
+
+
+def city_tile_name(tx: int, ty: int) -> str:
+    """Name (Builder und Collection) der City-Kachel ``(tx, ty)``."""
+    return f"City_Tile_{tx:03d}_{ty:03d}"
+
+
+def city_tile_grid(grid_size: int, tile_size: int) -> int:
+    """Anzahl Kacheln pro Achse."""
+    if tile_size < 1:
+        raise ValueError(f"Ungültige Kachelgröße '{tile_size}'. Erlaubt: >= 1")
+    return -(-grid_size // tile_size)
+
+
+def city_tile_bounds(tx, ty, grid_size: int, spacing: float, tile_size: int) -> np.ndarray:
+    """Rechteck(e) ``(x0, y0, x1, y1)`` der Kachel(n) in Weltkoordinaten (auch vektorisiert)."""
+    origin = -(grid_size - 1) * spacing * 0.5 - spacing * 0.5
+    tx, ty = np.asarray(tx), np.asarray(ty)
+    x0 = origin + tx * tile_size * spacing
+    y0 = origin + ty * tile_size * spacing
+    x1 = origin + np.minimum((tx + 1) * tile_size, grid_size) * spacing
+    y1 = origin + np.minimum((ty + 1) * tile_size, grid_size) * spacing
+    return np.stack((x0, y0, x1, y1), axis=-1)
+
+
+def city_tiles_in_radius(grid_size: int, spacing: float, tile_size: int, center, radius: float) -> list:
+    """Alle Kacheln ``(tx, ty)``, deren Rechteck näher als ``radius`` an ``center`` (XY) liegt.
+
+    ``radius <= 0`` liefert alle Kacheln.
+    """
+    n = city_tile_grid(grid_size, tile_size)
+    tx, ty = np.meshgrid(np.arange(n), np.arange(n), indexing="ij")
+    tx, ty = tx.ravel(), ty.ravel()
+    if radius > 0.0:
+        x0, y0, x1, y1 = city_tile_bounds(tx, ty, grid_size, spacing, tile_size).T
+        # Abstand zum nächstgelegenen Punkt des Rechtecks
+        dx = np.maximum(np.maximum(x0 - center[0], center[0] - x1), 0.0)
+        dy = np.maximum(np.maximum(y0 - center[1], center[1] - y1), 0.0)
+        near = np.hypot(dx, dy) <= radius
+        tx, ty = tx[near], ty[near]
+    return list(zip(tx.tolist(), ty.tolist()))
+
+
+@profiled
+def plan_city_tile(
+    plan: ScenePlan,
+    tx: int,
+    ty: int,
+    grid_size: int,
+    spacing: float,
+    min_height: float,
+    max_height: float,
+    tile_size: int = 8,
+    seed: int = 7,
+    line_width: float = 0.12,
+    collection: str | None = None,
+):
+    """Tower und Straßenabschnitte einer City-Kachel.
+
+    Jede Kachel zieht aus einem eigenen Stream (``city_tile_<tx>_<ty>``) und ist damit
+    unabhängig von allen anderen Kacheln reproduzierbar.
+
+    Returns:
+        Footprints der Tower als ``(n, 4)``-Array ``(x, y, width, depth)``.
+    """
+    collection = collection or city_tile_name(tx, ty)
+    prefix = f"{tx:03d}_{ty:03d}_"
+    half = (grid_size - 1) * spacing * 0.5
+    i0, i1 = tx * tile_size, min((tx + 1) * tile_size, grid_size)
+    j0, j1 = ty * tile_size, min((ty + 1) * tile_size, grid_size)
+    x0, y0, x1, y1 = city_tile_bounds(tx, ty, grid_size, spacing, tile_size).tolist()
+
+    rng = scene_stream(seed, f"city_tile_{tx}_{ty}")
+    gx, gy = np.meshgrid(np.arange(i0, i1), np.arange(j0, j1), indexing="ij")
+    keep = _tower_cells(gx, gy).ravel()
+    footprints = _plan_towers(
+        plan,
+        rng,
+        (gx.ravel() * spacing - half)[keep],
+        (gy.ravel() * spacing - half)[keep],
+        min_height,
+        max_height,
+        collection,
+        prefix=prefix,
+    )
+
+    # Straßen zwischen den Blöcken, auf die Kachel zugeschnitten; die letzte Kachel schließt das Raster ab.
+    x_lines = np.arange(i0, i1 + 1 if i1 == grid_size else i1) * spacing - half - spacing * 0.5
+    y_lines = np.arange(j0, j1 + 1 if j1 == grid_size else j1) * spacing - half - spacing * 0.5
+    cx, cy, len_x, len_y = (x0 + x1) / 2.0, (y0 + y1) / 2.0, x1 - x0, y1 - y0
+    nx, ny = len(x_lines), len(y_lines)
+    road_locations = np.vstack(
+        (
+            np.column_stack((x_lines, np.full(nx, cy), np.full(nx, 0.001))),
+            np.column_stack((np.full(ny, cx), y_lines, np.full(ny, 0.001))),
+        )
+    )
+    plan.add_batch(
+        f"Road_{prefix}{{i:02d}}",
+        ROAD_PLANE,
+        M_CITY_ROAD,
+        collection,
+        road_locations,
+        scales=np.vstack(
+            (
+                np.tile((spacing * 0.22, len_y, 1.0), (nx, 1)),
+                np.tile((len_x, spacing * 0.22, 1.0), (ny, 1)),
+            )
+        ),
+    )
+    plan.add_batch(
+        f"RoadLine_{prefix}{{i:02d}}",
+        UNIT_CUBE,
+        M_CITY_ROAD_LINE,
+        collection,
+        road_locations + (0.0, 0.0, 0.011),
+        scales=np.vstack(
+            (
+                np.tile((line_width, len_y / 2.0, 0.002), (nx, 1)),
+                np.tile((len_x / 2.0, line_width, 0.002), (ny, 1)),
+            )
+        ),
+    )
+    return footprints
+
+
+@profiled
+def plan_city_elevated_ring(plan: ScenePlan, radius: float = 8.0, width: float = 0.55):
+    """Erhöhter Ring als Sci-Fi-Skyway."""
+    ring_mat = material("principled", "M_City_Skyway", base_color=(0.04, 0.05, 0.08, 1.0), roughness=0.4, metallic=0.7)
+    rail_mat = material("emission", "M_City_Skyway_Glow", color=(0.42, 0.12, 1.0, 1.0), strength=9.0)
+
+    plan.add(
+        "SkywayRing",
+        primitive("torus", major_radius=radius, minor_radius=width),
+        ring_mat,
+        CITY_SKYWAY,
+        (0.0, 0.0, 2.8),
+    )
+    plan.add(
+        "SkywayRailGlow",
+        primitive("torus", major_radius=radius, minor_radius=0.06),
+        rail_mat,
+        CITY_SKYWAY,
+        (0.0, 0.0, 2.95),
+    )
+
+
+@profiled
+def plan_city_holo_billboards(plan: ScenePlan, count: int, radius: float, seed: int = 17):
+    """Holografische Werbetafeln um das Zentrum."""
+    rng = scene_stream(seed, "billboards")
+    panel_mat = material("emission", "M_Holo_Panel", color=(0.05, 0.95, 0.95, 1.0), strength=12.0)
+    frame_mat = material(
+        "principled",
+        "M_Holo_Frame",
+        base_color=(0.03, 0.03, 0.04, 1.0),
+        roughness=0.35,
+        metallic=0.78,
+    )
+    panel_plane = primitive("plane", shared=True, size=1.0)
+
+    angle = ring_angles(rng, count, jitter=0.15)
+    dist = radius + rng.uniform(-1.2, 1.2, size=count)
+    x = dist * np.cos(angle)
+    y = dist * np.sin(angle)
+    z = rng.uniform(2.0, 4.2, size=count)
+
+    plan.add_batch(
+        "HoloMast_{i:02d}",
+        UNIT_CYLINDER,
+        frame_mat,
+        CITY_BILLBOARDS,
+        np.column_stack((x, y, z * 0.5)),
+        scales=np.column_stack((np.full(count, 0.07), np.full(count, 0.07), z)),
+    )
+    plan.add_batch(
+        "HoloPanel_{i:02d}",
+        panel_plane,
+        panel_mat,
+        CITY_BILLBOARDS,
+        np.column_stack((x, y, z + 0.8)),
+        rotations=np.column_stack((np.full(count, 1.5708), np.zeros(count), angle + 1.5708)),
+        scales=np.tile((1.1, 0.45, 1.0), (count, 1)),
+    )
+
+
+@profiled
+def plan_city_central_spire(plan: ScenePlan, height: float = 13.0):
+    """Zentraler Spire als Landmarke."""
+    core_mat = material(
+        "window",
+        "M_Spire_Core",
+        base_color=(0.07, 0.08, 0.12, 1.0),
+        emission_color=(0.35, 0.6, 1.0, 1.0),
+        emission_strength=2.8,
+    )
+    tip_mat = material("emission", "M_Spire_Tip_Glow", color=(0.85, 0.2, 1.0, 1.0), strength=15.0)
+
+    plan.add(
+        "CentralSpire_Core",
+        primitive("cylinder", radius=SPIRE_RADIUS, depth=height),
+        core_mat,
+        CITY_SPIRE,
+        (0.0, 0.0, height * 0.5),
+    )
+    plan.add(
+        "CentralSpire_Tip",
+        primitive("cone", radius1=1.0, radius2=0.2, depth=4.0),
+        tip_mat,
+        CITY_SPIRE,
+        (0.0, 0.0, height + 2.0),
+    )
+
+
+@profiled
+def plan_city_sky_drones(
+    plan: ScenePlan,
+    count: int,
+    area_half_extent: float,
+    seed: int = 23,
+    min_spacing: float = 0.0,
+    zones=(),
+):
+    """Kleine leuchtende Drohnen-Kugeln als Leben im Himmel.
+
+    Mit ``min_spacing``/``zones`` halten die Drohnen Abstand zueinander und meiden
+    Sperrflächen (z. B. Tower-Footprints).
+    """
+    rng = scene_stream(seed, "drones")
+
+    spatial_hash = SpatialHash(cell_size=max(min_spacing, 1.0)) if zones else None
+    if spatial_hash is not None:
+        spatial_hash.add_zones(zones)
+    xy = _scatter_positions(rng, count, area_half_extent, min_spacing, spatial_hash, "Drohnen")
+    count = len(xy)
+    z = rng.uniform(4.0, 9.0, size=count)
+    size = rng.uniform(0.06, 0.16, size=count)
+    variant = rng.integers(0, len(DRONE_VARIANTS), size=count)
+
+    plan.add_batch(
+        "SkyDrone_{i:02d}",
+        UNIT_UV_SPHERE,
+        [material("emission", name, color=color, strength=20.0) for name, color in DRONE_VARIANTS],
+        CITY_DRONES,
+        np.column_stack((xy, z)),
+        scales=np.repeat(size[:, None], 3, axis=1),
+        material_choice=variant,
+    )
+
+
+def _forest_ground(cfg: SceneConfig) -> ScenePlan:
+    plan = ScenePlan()
+    plan_ground(plan, size=cfg.ground_size)
+    return plan
+
+
+def _forest_props(cfg: SceneConfig) -> ScenePlan:
+    plan = ScenePlan()
+    # Ein gemeinsamer Hash: Bäume, Felsen und Büsche meiden sich gegenseitig und den Teich.
+    spacings = (cfg.tree_min_spacing, cfg.rock_min_spacing, cfg.bush_min_spacing)
+    spatial_hash = None
+    if max(spacings) > 0.0 or cfg.scatter_avoid_pond:
+        spatial_hash = SpatialHash(cell_size=max(max(spacings), 0.5))
+        if cfg.scatter_avoid_pond:
+            spatial_hash.add_zone(pond_zone(cfg.pond_radius))
+
+    plan_tree_cluster(
+        plan,
+        count=cfg.tree_count,
+        area_half_extent=cfg.tree_area_half_extent,
+        seed=cfg.scene_seed,
+        min_spacing=cfg.tree_min_spacing,
+        spatial_hash=spatial_hash,
+    )
+    plan_rock_field(
+        plan,
+        count=cfg.rock_count,
+        area_half_extent=cfg.tree_area_half_extent,
+        seed=cfg.scene_seed,
+        min_spacing=cfg.rock_min_spacing,
+        spatial_hash=spatial_hash,
+    )
+    plan_bush_cluster(
+        plan,
+        count=cfg.bush_count,
+        area_half_extent=cfg.tree_area_half_extent * 0.95,
+        seed=cfg.scene_seed,
+        min_spacing=cfg.bush_min_spacing,
+        spatial_hash=spatial_hash,
+    )
+    return plan
+
+
+def _forest_pond(cfg: SceneConfig) -> ScenePlan:
+    plan = ScenePlan()
+    plan_forest_pond(plan, radius=cfg.pond_radius)
+    return plan
+
+
+def _city_extent(cfg: SceneConfig) -> float:
+    return cfg.city_grid_size * cfg.city_block_spacing * 0.7
+
+
+def _city_ground(cfg: SceneConfig) -> ScenePlan:
+    plan = ScenePlan()
+    plan_city_ground(plan, size=max(cfg.ground_size, cfg.city_grid_size * cfg.city_block_spacing * 1.2))
+    return plan
+
+
+def _city_roads(cfg: SceneConfig) -> ScenePlan:
+    plan = ScenePlan()
+    plan_city_roads(plan, grid_size=cfg.city_grid_size, spacing=cfg.city_block_spacing)
+    return plan
+
+
+def _plan_city_blocks(cfg: SceneConfig, plan: ScenePlan):
+    if cfg.city_tiled:
+        n = city_tile_grid(cfg.city_grid_size, cfg.city_tile_size)
+        return np.vstack([_plan_city_tile(cfg, plan, tx, ty) for tx in range(n) for ty in range(n)])
+    return plan_city_block_grid(
+        plan,
+        grid_size=cfg.city_grid_size,
+        spacing=cfg.city_block_spacing,
+        min_height=cfg.city_min_height,
+        max_height=cfg.city_max_height,
+        seed=cfg.scene_seed,
+    )
+
+
+def _city_blocks(cfg: SceneConfig) -> ScenePlan:
+    plan = ScenePlan()
+    _plan_city_blocks(cfg, plan)
+    return plan
+
+
+def _plan_city_tile(cfg: SceneConfig, plan: ScenePlan, tx: int, ty: int):
+    return plan_city_tile(
+        plan,
+        tx,
+        ty,
+        grid_size=cfg.city_grid_size,
+        spacing=cfg.city_block_spacing,
+        min_height=cfg.city_min_height,
+        max_height=cfg.city_max_height,
+        tile_size=cfg.city_tile_size,
+        seed=cfg.scene_seed,
+    )
+
+
+def _city_tile_section(tx: int, ty: int):
+    def plan_section(cfg: SceneConfig) -> ScenePlan:
+        plan = ScenePlan()
+        _plan_city_tile(cfg, plan, tx, ty)
+        return plan
+
+    return plan_section
+
+
+def loaded_city_tiles(cfg: SceneConfig) -> list:
+    """Kacheln im ``city_tile_load_radius`` um die City-Kamera."""
+    return city_tiles_in_radius(
+        cfg.city_grid_size,
+        cfg.city_block_spacing,
+        cfg.city_tile_size,
+        cfg.city_camera_location,
+        cfg.city_tile_load_radius,
+    )
+
+
+def _city_spire(cfg: SceneConfig) -> ScenePlan:
+    plan = ScenePlan()
+    plan_city_central_spire(plan, height=cfg.city_spire_height)
+    return plan
+
+
+def _city_skyway(cfg: SceneConfig) -> ScenePlan:
+    plan = ScenePlan()
+    plan_city_elevated_ring(plan, radius=cfg.city_ring_radius)
+    return plan
+
+
+def _city_billboards(cfg: SceneConfig) -> ScenePlan:
+    plan = ScenePlan()
+    plan_city_holo_billboards(plan, count=cfg.city_holo_billboards, radius=_city_extent(cfg), seed=cfg.scene_seed)
+    return plan
+
+
+def _city_drones(cfg: SceneConfig) -> ScenePlan:
+    drone_zones = []
+    if "towers" in cfg.city_drone_exclusions:
+        # Tower-Footprints kommen aus einem eigenen Stream und sind daher ohne Tower-Objekte reproduzierbar.
+        drone_zones.extend(tower_zones(_plan_city_blocks(cfg, ScenePlan())))
+    if "roads" in cfg.city_drone_exclusions:
+        drone_zones.extend(road_zones(cfg.city_grid_size, cfg.city_block_spacing))
+    if "spire" in cfg.city_drone_exclusions:
+        drone_zones.append(EllipseZone(0.0, 0.0, SPIRE_RADIUS, SPIRE_RADIUS))
+
+    plan = ScenePlan()
+    plan_city_sky_drones(
+        plan,
+        count=cfg.city_drone_count,
+        area_half_extent=_city_extent(cfg),
+        seed=cfg.scene_seed,
+        min_spacing=cfg.city_drone_min_spacing,
+        zones=drone_zones,
+    )
+    return plan
+
+
+# Teilpläne pro Builder in Build-Reihenfolge (siehe ``scene_project.main`` für die Config-Abhängigkeiten).
+FOREST_SECTIONS = {
+    "ground": _forest_ground,
+    "props": _forest_props,
+    "pond": _forest_pond,
+}
+
+CITY_SECTIONS = {
+    "ground": _city_ground,
+    "roads": _city_roads,
+    "blocks": _city_blocks,
+    "spire": _city_spire,
+    "skyway": _city_skyway,
+    "billboards": _city_billboards,
+    "drones": _city_drones,
+}
+
+SCENE_SECTIONS = {
+    "forest": FOREST_SECTIONS,
+    "city": CITY_SECTIONS,
+}
+
+
+def _plan_sections(cfg: SceneConfig, sections: dict) -> ScenePlan:
+    plan = ScenePlan()
+    for plan_section in sections.values():
+        plan.extend(plan_section(cfg))
+    return plan
+
+
+def city_sections(cfg: SceneConfig) -> dict:
+    """City-Teilpläne; im Kachel-Modus ersetzen die geladenen Kacheln Straßen und Tower."""
+    if not cfg.city_tiled:
+        return CITY_SECTIONS
+    sections = {"ground": CITY_SECTIONS["ground"]}
+    for tx, ty in loaded_city_tiles(cfg):
+        sections[city_tile_name(tx, ty)] = _city_tile_section(tx, ty)
+    sections.update((name, CITY_SECTIONS[name]) for name in ("spire", "skyway", "billboards", "drones"))
+    return sections
+
+
+def plan_forest_scene(cfg: SceneConfig) -> ScenePlan:
+    """Dichtere Waldszene mit Teich, Felsen und Büschen."""
+    return _plan_sections(cfg, FOREST_SECTIONS)
+
+
+def plan_city_scene(cfg: SceneConfig) -> ScenePlan:
+    """Deutlich komplexere futuristische Stadt."""
+    return _plan_sections(cfg, city_sections(cfg))
+
+
+SCENE_PLANNERS = {
+    "forest": plan_forest_scene,
+    "city": plan_city_scene,
+}
+
+
+def scene_sections(cfg: SceneConfig) -> dict:
+    """Teilplan-Funktionen (``name -> plan(cfg)``) der in ``cfg.scene_name`` gewählten Szene."""
+    scene_name = cfg.scene_name.lower().strip()
+    if scene_name not in SCENE_SECTIONS:
+        supported = ", ".join(sorted(SCENE_SECTIONS))
+        raise ValueError(f"Unbekannte Szene '{cfg.scene_name}'. Erlaubt: {supported}")
+    return city_sections(cfg) if scene_name == "city" else SCENE_SECTIONS[scene_name]
+
+
+def plan_scene(cfg: SceneConfig) -> ScenePlan:
+    """Plant die in ``cfg.scene_name`` gewählte Szene."""
+    scene_sections(cfg)
+    return SCENE_PLANNERS[cfg.scene_name.lower().strip()](cfg)
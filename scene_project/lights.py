@@ -2,17 +2,24 @@
 
 import bpy
 
+from scene_project.datablocks import tag_generated
+from scene_project.profiler import profiled
+from scene_project.render import engine_id
 
+
+@profiled
 def setup_sun_light(energy: float = 3.5, location: tuple[float, float, float] = (6.0, -6.0, 8.0)):
     """Fügt ein Sonnenlicht hinzu."""
     bpy.ops.object.light_add(type="SUN", location=location)
     sun = bpy.context.active_object
+    tag_generated(sun.data)
     sun.name = "SunKey"
     sun.data.energy = energy
     sun.rotation_euler = (0.8, 0.2, 0.6)
     return sun
 
 
+@profiled
 def setup_city_lighting():
     """Erweitertes Beleuchtungssetup für nächtliche City-Szenen."""
     created = []
@@ -20,6 +27,7 @@ def setup_city_lighting():
     # Key / Rim
     bpy.ops.object.light_add(type="AREA", location=(8.0, -10.0, 12.0))
     area_key = bpy.context.active_object
+    tag_generated(area_key.data)
     area_key.name = "CityAreaKey"
     area_key.data.energy = 950.0
     area_key.data.size = 7.0
@@ -28,6 +36,7 @@ def setup_city_lighting():
 
     bpy.ops.object.light_add(type="AREA", location=(-10.0, 8.0, 9.0))
     area_rim = bpy.context.active_object
+    tag_generated(area_rim.data)
     area_rim.name = "CityAreaRim"
     area_rim.data.energy = 420.0
     area_rim.data.size = 5.0
@@ -38,6 +47,7 @@ def setup_city_lighting():
     # Farbiger Nebel-Accent
     bpy.ops.object.light_add(type="POINT", location=(0.0, 0.0, 6.0))
     center_glow = bpy.context.active_object
+    tag_generated(center_glow.data)
     center_glow.name = "CityCenterGlow"
     center_glow.data.energy = 1500.0
     center_glow.data.color = (0.65, 0.2, 1.0)
@@ -47,8 +57,12 @@ def setup_city_lighting():
     return created
 
 
+@profiled
 def setup_city_world_and_fog():
-    """Setzt ein dunkles World-Setup mit leichter Volumetrik."""
+    """Setzt ein dunkles World-Setup mit leichter Volumetrik.
+
+    Ein gesetztes Render-Profil (``scene_project.render``) überschreibt Engine, Bloom und Glare-Qualität danach.
+    """
     scene = bpy.context.scene
     world = scene.world or bpy.data.worlds.new("World")
     scene.world = world
@@ -64,10 +78,13 @@ def setup_city_world_and_fog():
     bg.inputs["Strength"].default_value = 0.35
     links.new(bg.outputs["Background"], out.inputs["Surface"])
 
-    scene.render.engine = "BLENDER_EEVEE"
-    scene.eevee.use_bloom = True
-    scene.eevee.bloom_intensity = 0.11
-    scene.eevee.bloom_radius = 6.5
+    scene.render.engine = engine_id(scene.render, "BLENDER_EEVEE")
+    if hasattr(scene.eevee, "use_bloom"):
+        scene.eevee.use_bloom = True
+    if hasattr(scene.eevee, "bloom_intensity"):
+        # Bloom-Look für EEVEE-Legacy (bis 3.6); in EEVEE Next ohne Wirkung bzw. entfallen.
+        scene.eevee.bloom_intensity = 0.11
+        scene.eevee.bloom_radius = 6.5
 
     scene.use_nodes = True
     tree = scene.node_tree
@@ -75,6 +92,7 @@ def setup_city_world_and_fog():
 
     rlayers = tree.nodes.new(type="CompositorNodeRLayers")
     glare = tree.nodes.new(type="CompositorNodeGlare")
+    glare.name = "CityGlare"
     comp = tree.nodes.new(type="CompositorNodeComposite")
 
     glare.glare_type = "FOG_GLOW"
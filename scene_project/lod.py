@@ -0,0 +1,106 @@
+"""Kamera-abhängige LOD-Auswahl auf Plan-Ebene – ohne ``bpy``.
+
+Jedes geplante Objekt bekommt aus seiner projizierten Bildschirmgröße (Bounding-Sphere
+relativ zur halben Bildhöhe der aktiven Kamera) eine LOD-Stufe. Stufe 0 ist das
+Original-Primitive, jede weitere Stufe ein Prototyp mit weniger Vertices.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from scene_project.frustum import CameraSpec, bounding_spheres
+from scene_project.plan import PrimitiveSpec, ScenePlan
+from scene_project.primitives import primitive_params, vertex_count
+
+
+def _reduced(spec: PrimitiveSpec) -> PrimitiveSpec | None:
+    """Nächstgröbere Variante desselben Primitives (gleiche Maße), ``None`` = nicht reduzierbar."""
+    p = primitive_params(spec)
+    kind = spec.kind
+
+    def variant(new_kind: str, **changes) -> PrimitiveSpec:
+        params = dict(spec.params)
+        params.update(changes)
+        return PrimitiveSpec(new_kind, tuple(sorted(params.items())), spec.shared)
+
+    if kind in ("cylinder", "cone") and p["vertices"] > 6:
+        return variant(kind, vertices=max(6, p["vertices"] // 2))
+    if kind == "uv_sphere" and p["ring_count"] > 2:
+        return variant(kind, segments=max(4, p["segments"] // 2), ring_count=max(2, p["ring_count"] // 2))
+    if kind == "ico_sphere":
+        if p["subdivisions"] > 1:
+            return variant(kind, subdivisions=p["subdivisions"] - 1)
+        # Unterhalb des Ikosaeders (12 Vertices): Oktaeder als UV-Sphere mit 6 Vertices.
+        return PrimitiveSpec("uv_sphere", (("radius", p["radius"]), ("ring_count", 2), ("segments", 4)), spec.shared)
+    if kind == "torus" and p["minor_segments"] > 4:
+        return variant(
+            kind,
+            major_segments=max(8, p["major_segments"] // 2),
+            minor_segments=max(4, p["minor_segments"] // 2),
+        )
+    return None
+
+
+def lod_chain(spec: PrimitiveSpec, tiers: int) -> list[PrimitiveSpec]:
+    """Primitive pro LOD-Stufe (``tiers`` Einträge, gröbste Stufe wiederholt sich ggf.)."""
+    chain = [spec]
+    while len(chain) < tiers:
+        coarser = _reduced(chain[-1])
+        chain.append(coarser or chain[-1])
+    return chain
+
+
+def plan_vertex_count(plan: ScenePlan) -> int:
+    """Summe der Vertices aller Objekte im Plan."""
+    if len(plan) == 0:
+        return 0
+    per_prim = np.array([vertex_count(spec) for spec in plan.primitives.values], dtype=np.int64)
+    return int(per_prim[np.asarray(plan.primitive_ids)].sum())
+
+
+def screen_sizes(plan: ScenePlan, camera: CameraSpec) -> np.ndarray:
+    """Projizierte Größe jeder Bounding-Sphere als Anteil der halben Bildhöhe."""
+    centers, radii = bounding_spheres(plan)
+    distance = np.linalg.norm(centers - np.asarray(camera.location), axis=1)
+    _, tan_y = camera.half_fov_tangents()
+    return radii / (np.maximum(distance, camera.clip_start) * tan_y)
+
+
+def assign_lod(plan: ScenePlan, camera: CameraSpec, thresholds: tuple[float, ...]) -> tuple[ScenePlan, dict]:
+    """Ersetzt die Primitives aller Objekte durch ihre LOD-Stufe.
+
+    Args:
+        thresholds: Absteigende Bildschirmgrößen; ab ``thresholds[0]`` bleibt Stufe 0,
+            ab ``thresholds[1]`` Stufe 1 usw., darunter die gröbste Stufe.
+
+    Returns:
+        Neuer Plan und Statistik (Objekte pro Stufe, Vertices vorher/nachher).
+    """
+    tiers = len(thresholds) + 1
+    vertices_before = plan_vertex_count(plan)
+    if len(plan) == 0:
+        return plan, {"tiers": [0] * tiers, "vertices_before": 0, "vertices_after": 0}
+
+    sizes = screen_sizes(plan, camera)
+    # searchsorted braucht aufsteigende Werte: Stufe = Anzahl Schwellen oberhalb der Größe.
+    ascending = np.sort(np.asarray(thresholds, dtype=np.float64))
+    tier = (tiers - 1) - np.searchsorted(ascending, sizes, side="right")
+
+    result = plan.select(np.arange(len(plan)))
+    lookup = np.empty((len(plan.primitives), tiers), dtype=np.uint32)
+    for prim_id, spec in enumerate(plan.primitives.values):
+        for level, variant in enumerate(lod_chain(spec, tiers)):
+            lookup[prim_id, level] = result.primitives.intern(variant)
+
+    prim_ids = np.frombuffer(plan.primitive_ids, dtype=np.uint32)
+    del result.primitive_ids[:]
+    result.primitive_ids.frombytes(lookup[prim_ids, tier].tobytes())
+
+    stats = {
+        "tiers": np.bincount(tier, minlength=tiers).tolist(),
+        "vertices_before": vertices_before,
+        "vertices_after": plan_vertex_count(result),
+    }
+    return result, stats
+
@@ -1,78 +1,749 @@
-"""Main-Orchestrierung der Szene."""
+"""Main-Orchestrierung der Szene.
 
-from scene_project.camera import setup_camera
+Eine Szene besteht aus Buildern (``SceneBuilder``). Jeder Builder besitzt eigene Collections
+und deklariert, von welchen ``SceneConfig``-Feldern er abhängt. ``build_scene`` vergleicht
+die Config mit der des letzten Builds (als JSON an der Szene gespeichert) und baut nur die
+Builder neu, deren Eingaben sich geändert haben. Mit ``parallel_workers > 1`` bauen
+Hintergrund-Prozesse die Plan-Builder (siehe ``scene_project.parallel``). Builder mit
+``update`` (Sonne, Kamera) passen ihre vorhandenen Objekte an, statt sie neu zu bauen.
+``code_affected_builders`` ordnet geänderte Module (siehe ``scene_project.hot_reload``) den
+Buildern zu, die ``build_scene(..., rebuild=...)`` dann unabhängig von der Config neu baut.
+``build_steps`` liefert denselben Build schrittweise (für zeitgeteilte Builds in der Oberfläche,
+siehe ``scene_project.progressive``).
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import asdict, replace
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, NamedTuple
+
+import bpy
+
+from scene_project.animation import animate_drones
+from scene_project.apply import apply_plan, iter_apply_plan
+from scene_project.build_cache import CACHE_MODES, BuildCache
+from scene_project.camera import setup_camera, update_camera
 from scene_project.config import SceneConfig
+from scene_project.datablocks import (
+    append_collections,
+    ensure_collection,
+    link_collections,
+    remove_collections,
+    set_collections_excluded,
+    write_collections,
+)
+from scene_project.frustum import CameraSpec, camera_spec, cull_plan
+from scene_project.geometry import PROTOTYPE_PROP, prototype_stats, reset_prototype_stats, set_geometry_backend
+from scene_project.hot_reload import dependencies, import_graph
+from scene_project.instancing import instance_stats, reset_instance_stats
+from scene_project.layout import (
+    CITY_BILLBOARDS,
+    CITY_BLOCKS,
+    CITY_DRONES,
+    CITY_GROUND,
+    CITY_LIGHTS,
+    CITY_ROADS,
+    CITY_SKYWAY,
+    CITY_SPIRE,
+    CITY_STATIC,
+    CITY_STATIC_SOURCES,
+    CITY_TILES,
+    FOREST_BUSHES,
+    FOREST_GROUND,
+    FOREST_LIGHTS,
+    FOREST_POND,
+    FOREST_ROCKS,
+    FOREST_TREES,
+    SCATTER_COLLECTIONS,
+    SCENE_CAMERA,
+    city_tile_name,
+    city_tiles_in_radius,
+    loaded_city_tiles,
+    scene_sections,
+)
 from scene_project.lights import setup_city_lighting, setup_city_world_and_fog, setup_sun_light
-from scene_project.objects import (
-    add_bush_cluster,
-    add_city_block_grid,
-    add_city_central_spire,
-    add_city_elevated_ring,
-    add_city_ground,
-    add_city_holo_billboards,
-    add_city_roads,
-    add_city_sky_drones,
-    add_forest_pond,
-    add_ground,
-    add_rock_field,
-    add_tree_cluster,
-    clear_scene,
+from scene_project.lod import assign_lod
+from scene_project.materials import SIGNATURE_PROP, begin_material_cache, material_cache_stats, set_material_mode
+from scene_project.merge import bake_static_by_material
+from scene_project.objects import clear_collections, clear_scene
+from scene_project.parallel import (
+    job_parts,
+    partition,
+    parts_dir,
+    run_workers,
+    scene_digest,
+    timing_summary,
+    write_result,
+)
+from scene_project.plan import ScenePlan
+from scene_project.profiler import BuildProfiler, default_summary_dir, profiling, scene_summary, section, write_summary
+from scene_project.render import apply_render_profile, describe, get_render_profile
+
+# Custom Properties der Szene mit der Config und den Builder-Collections des letzten Builds.
+CONFIG_PROP = "scene_project_config"
+COLLECTIONS_PROP = "scene_project_collections"
+
+# Felder, von denen jeder Plan-Builder implizit abhängt (Backend, Material-Modus, Culling, LOD, Bake).
+PLAN_FIELDS = (
+    "geometry_backend",
+    "material_mode",
+    "cull_to_camera",
+    "cull_margin",
+    "lod_enabled",
+    "lod_screen_thresholds",
+    "city_bake_static",
+)
+CAMERA_FIELDS = (
+    "camera_location",
+    "camera_rotation_euler",
+    "city_camera_location",
+    "city_camera_rotation_euler",
+    "camera_lens",
+    "camera_clip_start",
+    "camera_clip_end",
+    "render_resolution",
+)
+CITY_LAYOUT_FIELDS = ("city_grid_size", "city_block_spacing")
+TOWER_FIELDS = CITY_LAYOUT_FIELDS + ("city_min_height", "city_max_height", "scene_seed")
+TILE_FIELDS = TOWER_FIELDS + ("city_tiled", "city_tile_size")
+FLIGHT_FIELDS = (
+    "city_drone_flight",
+    "city_drone_frames",
+    "city_drone_laps",
+    "city_drone_keyframe_tolerance",
+    "city_ring_radius",
 )
+# Module, deren Code (samt ihrer Imports) das Ergebnis der Plan-Builder bestimmt.
+PLAN_MODULES = ("layout", "apply", "frustum", "lod", "merge")
+
+
+class SceneBuilder(NamedTuple):
+    """Ein Baustein der Szene mit eigenen Collections und Config-Abhängigkeiten.
+
+    Ohne ``setup`` liefert der gleichnamige Teilplan aus ``layout.scene_sections`` die Objekte;
+    mit ``setup(cfg, camera)`` erzeugt der Builder seine Objekte direkt (Licht, Kamera).
+    ``parent`` hängt die Collections unter eine gemeinsame Eltern-Collection (z. B. ``City_Tiles``).
+    ``update(cfg, camera)`` übernimmt geänderte Felder direkt an den vorhandenen Objekten und
+    liefert ``False``, wenn es nichts anzupassen gibt (dann wird der Builder normal neu gebaut).
+    ``modules`` nennt die Module mit dem Code des Builders (Standard: ``PLAN_MODULES``).
+    ``finish(cfg)`` bearbeitet die erzeugten Objekte nach (z. B. Animation), bevor sie im
+    Build-Cache bzw. als Worker-Teil landen.
+    """
 
+    name: str
+    collections: tuple[str, ...]
+    depends_on: tuple[str, ...]
+    setup: Callable[[SceneConfig, CameraSpec], None] | None = None
+    parent: str | None = None
+    update: Callable[[SceneConfig, CameraSpec], bool] | None = None
+    modules: tuple[str, ...] = PLAN_MODULES
+    finish: Callable[[SceneConfig], None] | None = None
 
-def _build_forest_scene(cfg: SceneConfig):
-    """Baut eine dichtere Waldszene mit Teich, Felsen und Büschen."""
-    add_ground(size=cfg.ground_size)
-    add_tree_cluster(count=cfg.tree_count, area_half_extent=cfg.tree_area_half_extent, seed=42)
-    add_rock_field(count=cfg.rock_count, area_half_extent=cfg.tree_area_half_extent, seed=101)
-    add_bush_cluster(count=cfg.bush_count, area_half_extent=cfg.tree_area_half_extent * 0.95, seed=202)
-    add_forest_pond(radius=cfg.pond_radius)
-
-
-def _build_futuristic_city_scene(cfg: SceneConfig):
-    """Baut eine deutlich komplexere futuristische Stadt."""
-    ground_size = max(cfg.ground_size, cfg.city_grid_size * cfg.city_block_spacing * 1.2)
-    city_extent = cfg.city_grid_size * cfg.city_block_spacing * 0.7
-
-    add_city_ground(size=ground_size)
-    add_city_roads(grid_size=cfg.city_grid_size, spacing=cfg.city_block_spacing)
-    add_city_block_grid(
-        grid_size=cfg.city_grid_size,
-        spacing=cfg.city_block_spacing,
-        min_height=cfg.city_min_height,
-        max_height=cfg.city_max_height,
-        seed=7,
+
+class BuildProgress(NamedTuple):
+    """Fortschritt von ``build_steps``: Phase und erledigte Schritte der Phase."""
+
+    stage: str
+    done: int
+    total: int
+
+
+def _first_object(collection_name: str, object_type: str):
+    collection = bpy.data.collections.get(collection_name)
+    if collection is None:
+        return None
+    return next((obj for obj in collection.objects if obj.type == object_type), None)
+
+
+def _setup_sun(cfg: SceneConfig, camera: CameraSpec):
+    setup_sun_light(energy=cfg.sun_energy)
+
+
+def _update_sun(cfg: SceneConfig, camera: CameraSpec) -> bool:
+    sun = _first_object(FOREST_LIGHTS, "LIGHT")
+    if sun is None:
+        return False
+    sun.data.energy = cfg.sun_energy
+    return True
+
+
+def _animate_city_drones(cfg: SceneConfig):
+    if not cfg.city_drone_flight:
+        return
+    collection = bpy.data.collections.get(CITY_DRONES)
+    stats = animate_drones(
+        collection.objects if collection is not None else (),
+        ring_radius=cfg.city_ring_radius,
+        frames=cfg.city_drone_frames,
+        laps=cfg.city_drone_laps,
+        seed=cfg.scene_seed,
+        clearance=cfg.city_drone_min_spacing,
+        tolerance=cfg.city_drone_keyframe_tolerance,
+    )
+    print(
+        f"[scene_project] Drohnen-Flug: {stats['drones']} Drohnen in {stats['bands']} Höhenbändern, "
+        f"{stats['keyframes']} von {stats['samples']} Keyframes."
     )
-    add_city_central_spire(height=cfg.city_spire_height)
-    add_city_elevated_ring(radius=cfg.city_ring_radius)
-    add_city_holo_billboards(count=cfg.city_holo_billboards, radius=city_extent, seed=17)
-    add_city_sky_drones(count=cfg.city_drone_count, area_half_extent=city_extent, seed=23)
 
 
-def build_scene(config: SceneConfig | None = None):
-    """Baut die Szene anhand einer Konfiguration auf."""
-    cfg = config or SceneConfig()
+def _setup_city_lights(cfg: SceneConfig, camera: CameraSpec):
+    setup_city_world_and_fog()
+    setup_city_lighting()
+
+
+def _setup_camera(cfg: SceneConfig, camera: CameraSpec):
+    setup_camera(
+        location=camera.location,
+        rotation_euler=camera.rotation_euler,
+        lens=camera.lens,
+        clip_start=camera.clip_start,
+        clip_end=camera.clip_end,
+        resolution=camera.resolution,
+    )
+
+
+def _update_camera(cfg: SceneConfig, camera: CameraSpec) -> bool:
+    cam = _first_object(SCENE_CAMERA, "CAMERA")
+    if cam is None:
+        return False
+    update_camera(
+        cam,
+        location=camera.location,
+        rotation_euler=camera.rotation_euler,
+        lens=camera.lens,
+        clip_start=camera.clip_start,
+        clip_end=camera.clip_end,
+        resolution=camera.resolution,
+    )
+    return True
+
+
+SCENE_BUILDERS = {
+    "forest": (
+        SceneBuilder("ground", (FOREST_GROUND,), ("ground_size",)),
+        SceneBuilder(
+            "props",
+            (FOREST_TREES, FOREST_ROCKS, FOREST_BUSHES),
+            (
+                "tree_count",
+                "tree_area_half_extent",
+                "rock_count",
+                "bush_count",
+                "pond_radius",
+                "tree_min_spacing",
+                "rock_min_spacing",
+                "bush_min_spacing",
+                "scatter_avoid_pond",
+                "scene_seed",
+            ),
+        ),
+        SceneBuilder("pond", (FOREST_POND,), ("pond_radius",)),
+        SceneBuilder(
+            "sun", (FOREST_LIGHTS,), ("sun_energy",), setup=_setup_sun, update=_update_sun, modules=("lights",)
+        ),
+        SceneBuilder(
+            "camera", (SCENE_CAMERA,), CAMERA_FIELDS, setup=_setup_camera, update=_update_camera, modules=("camera",)
+        ),
+    ),
+    "city": (
+        SceneBuilder("ground", (CITY_GROUND,), ("ground_size",) + CITY_LAYOUT_FIELDS),
+        SceneBuilder("roads", (CITY_ROADS,), CITY_LAYOUT_FIELDS),
+        SceneBuilder("blocks", (CITY_BLOCKS,), TOWER_FIELDS),
+        SceneBuilder("spire", (CITY_SPIRE,), ("city_spire_height",)),
+        SceneBuilder("skyway", (CITY_SKYWAY,), ("city_ring_radius",)),
+        SceneBuilder("billboards", (CITY_BILLBOARDS,), CITY_LAYOUT_FIELDS + ("city_holo_billboards", "scene_seed")),
+        SceneBuilder(
+            "drones",
+            (CITY_DRONES,),
+            TILE_FIELDS + ("city_drone_count", "city_drone_min_spacing", "city_drone_exclusions") + FLIGHT_FIELDS,
+            modules=PLAN_MODULES + ("animation",),
+            finish=_animate_city_drones,
+        ),
+        # render_profile: ein Wechsel zurück auf "kein Profil" stellt den City-Look neu her.
+        SceneBuilder("lights", (CITY_LIGHTS,), ("render_profile",), setup=_setup_city_lights, modules=("lights",)),
+        SceneBuilder(
+            "camera", (SCENE_CAMERA,), CAMERA_FIELDS, setup=_setup_camera, update=_update_camera, modules=("camera",)
+        ),
+    ),
+}
+
+
+def scene_builders(cfg: SceneConfig) -> tuple[SceneBuilder, ...]:
+    """Builder der gewählten Szene; im Kachel-Modus ein Builder pro geladener City-Kachel."""
     scene_name = cfg.scene_name.lower().strip()
+    builders = SCENE_BUILDERS[scene_name]
+    if scene_name != "city" or not cfg.city_tiled:
+        return builders
+
+    tiles = tuple(
+        SceneBuilder(city_tile_name(tx, ty), (city_tile_name(tx, ty),), TILE_FIELDS, parent=CITY_TILES)
+        for tx, ty in loaded_city_tiles(cfg)
+    )
+    head = tuple(b for b in builders if b.name == "ground")
+    tail = tuple(b for b in builders if b.name not in ("ground", "roads", "blocks"))
+    return head + tiles + tail
+
+
+def _static_builders(builders) -> list[SceneBuilder]:
+    return [b for b in builders if b.setup is None and set(b.collections) <= set(CITY_STATIC_SOURCES)]
+
+
+def _config_values(cfg: SceneConfig) -> dict:
+    # Über JSON normalisiert (Tupel -> Listen), damit der Vergleich mit der gespeicherten Config passt.
+    return json.loads(json.dumps(asdict(cfg)))
+
+
+def _previous_config(scene) -> dict | None:
+    raw = scene.get(CONFIG_PROP)
+    return json.loads(raw) if raw else None
+
+
+def _builder_fields(builder: SceneBuilder, cfg: SceneConfig) -> tuple[str, ...]:
+    if builder.setup is not None:
+        return builder.depends_on
+    fields = builder.depends_on + PLAN_FIELDS
+    if cfg.cull_to_camera or cfg.lod_enabled:
+        fields += CAMERA_FIELDS
+    return fields
+
+
+def rebuild_fields(cfg: SceneConfig) -> set[str]:
+    """Config-Felder, deren Änderung mindestens einen Builder der Szene neu baut.
+
+    Alle anderen Felder liest die Szene nicht oder übernimmt sie per ``update`` (Sonne, Kamera).
+    """
+    builders = scene_builders(cfg)
+    return {field for builder in builders if builder.update is None for field in _builder_fields(builder, cfg)}
+
+
+def code_affected_builders(cfg: SceneConfig, modules: Iterable[str]) -> list[str]:
+    """Namen der Builder, deren Code in ``modules`` liegt (direkt oder über Imports).
+
+    ``main`` selbst enthält Setup-Funktionen und Builder-Definitionen: eine Änderung dort betrifft alle.
+    """
+    changed = set(modules)
+    builders = scene_builders(cfg)
+    if "main" in changed:
+        return [builder.name for builder in builders]
+    graph = import_graph()
+    return [builder.name for builder in builders if changed & dependencies(builder.modules, graph)]
+
+
+def _dirty_builders(builders, cfg: SceneConfig, previous: dict, forced: set[str]) -> list[SceneBuilder]:
+    """Builder, deren Eingaben sich geändert haben, deren Collections fehlen oder die ``forced`` nennt."""
+    current = _config_values(cfg)
+    dirty = []
+    for builder in builders:
+        changed = any(current[field] != previous.get(field) for field in _builder_fields(builder, cfg))
+        missing = any(bpy.data.collections.get(name) is None for name in builder.collections)
+        if changed or missing or builder.name in forced:
+            dirty.append(builder)
+
+    # Gebakte Geometrie mischt mehrere Builder: ändert sich einer, werden alle statischen neu gebaut.
+    if cfg.scene_name.lower().strip() == "city" and cfg.city_bake_static:
+        static = _static_builders(builders)
+        if any(builder in static for builder in dirty):
+            dirty = [b for b in builders if b in dirty or b in static]
+    return dirty
 
-    clear_scene()
 
-    builders = {
-        "forest": _build_forest_scene,
-        "city": _build_futuristic_city_scene,
+def _open_build_cache(cfg: SceneConfig) -> BuildCache | None:
+    if not cfg.build_cache:
+        return None
+    if cfg.build_cache_mode not in CACHE_MODES:
+        supported = ", ".join(CACHE_MODES)
+        raise ValueError(f"Unbekannter Cache-Modus '{cfg.build_cache_mode}'. Erlaubt: {supported}")
+    return BuildCache(cfg.build_cache_dir or None, max_bytes=int(cfg.build_cache_max_mb * 2**20))
+
+
+def _cache_payload(builder: SceneBuilder, cfg: SceneConfig) -> dict:
+    """Alles, was das Ergebnis eines Plan-Builders bestimmt (ohne Quelltext, den ergänzt ``BuildCache``)."""
+    values = _config_values(cfg)
+    return {
+        "scene": cfg.scene_name.lower().strip(),
+        "builder": builder.name,
+        "fields": {field: values[field] for field in _builder_fields(builder, cfg)},
+        "blender": bpy.app.version_string,
     }
-    scene_builder = builders.get(scene_name)
-    if scene_builder is None:
-        supported = ", ".join(sorted(builders))
-        raise ValueError(f"Unbekannte Szene '{cfg.scene_name}'. Erlaubt: {supported}")
 
-    scene_builder(cfg)
 
-    if scene_name == "city":
-        setup_city_world_and_fog()
-        setup_city_lighting()
-        setup_camera(location=(20.0, -22.0, 14.0), rotation_euler=(1.08, 0.0, 0.8))
+def _load_part(builder: SceneBuilder, path: Path, mode: str):
+    """Holt die Collections eines Builders aus einer ``.blend`` (Cache-Treffer oder Worker-Teil)."""
+    if mode == "append":
+        append_collections(path, builder.collections, match_props=(PROTOTYPE_PROP, SIGNATURE_PROP))
+    else:
+        link_collections(path, builder.collections)
+
+
+def _instance_collections(cfg: SceneConfig) -> tuple[str, ...]:
+    """Collections, deren Props das Backend ``instances`` als Punkt-Instanzen erzeugt."""
+    if cfg.city_drone_flight:
+        # Fliegende Drohnen brauchen eigene Objekte für ihre Keyframes.
+        return tuple(name for name in SCATTER_COLLECTIONS if name != CITY_DRONES)
+    return SCATTER_COLLECTIONS
+
+
+def _prepare_plan(plan: ScenePlan, cfg: SceneConfig, camera: CameraSpec) -> ScenePlan:
+    """Frustum-Culling und LOD-Auswahl vor dem Erzeugen (beides pro Objekt, also teilbar)."""
+    if cfg.cull_to_camera:
+        plan, cull_stats = cull_plan(plan, camera, margin=cfg.cull_margin)
+        print(
+            f"[scene_project] Frustum-Culling: {cull_stats['culled']} von {cull_stats['total']} Objekten "
+            f"verworfen ({cull_stats['cull_ratio']:.1%})."
+        )
+    if cfg.lod_enabled:
+        plan, lod_stats = assign_lod(plan, camera, cfg.lod_screen_thresholds)
+        tiers = ", ".join(f"LOD{level}: {count}" for level, count in enumerate(lod_stats["tiers"]))
+        print(
+            f"[scene_project] LOD ({tiers}): {lod_stats['vertices_before']} -> "
+            f"{lod_stats['vertices_after']} Vertices."
+        )
+    return plan
+
+
+def _ensure_builder_collections(builder: SceneBuilder):
+    # Auch bei leerem (z. B. komplett gecullten) Teilplan anlegen, sonst gilt der Builder als fehlend.
+    parent = ensure_collection(builder.parent) if builder.parent else None
+    for name in builder.collections:
+        ensure_collection(name, parent=parent)
+
+
+def _activate_collection(name: str | None):
+    """Lenkt ``bpy.ops``-Objekte (Licht, Kamera) in die Collection ``name`` (``None`` = Szene)."""
+    view_layer = bpy.context.view_layer
+    if name is None:
+        view_layer.active_layer_collection = view_layer.layer_collection
+        return
+    collection = ensure_collection(name)
+    view_layer.active_layer_collection = view_layer.layer_collection.children[collection.name]
+
+
+def build_scene(config: SceneConfig | None = None, rebuild: Iterable[str] = ()):
+    """Baut die Szene anhand einer Konfiguration auf.
+
+    Mit ``incremental_build`` (Standard) werden nur Builder neu gebaut, deren Config-Felder
+    sich seit dem letzten Build derselben Szene geändert haben, dazu die in ``rebuild``
+    genannten (z. B. nach Code-Änderungen). Mit ``profile`` entsteht zusätzlich
+    ``scene_summary.json`` (siehe ``scene_project.profiler``).
+    """
+    for _ in build_steps(config, rebuild):
+        pass
+
+
+def build_steps(config: SceneConfig | None = None, rebuild: Iterable[str] = ()) -> Iterator[BuildProgress]:
+    """``build_scene`` als Generator: ein ``BuildProgress`` pro Phase, Builder bzw. ``APPLY_BATCH`` Objekte.
+
+    Wird der Generator vorzeitig geschlossen (Abbruch), bleibt die Szene teilweise gebaut und
+    ohne gespeicherte Config; der nächste Build baut dann komplett neu.
+    """
+    cfg = config or SceneConfig()
+    profiler = BuildProfiler(cprofile=cfg.profile_cprofile) if cfg.profile else None
+    with profiling(profiler):
+        builders = yield from _build_steps(cfg, set(rebuild))
+    if profiler is not None:
+        summary = scene_summary(
+            profiler,
+            cfg.scene_name.lower().strip(),
+            {builder.name: builder.collections for builder in builders},
+            config=cfg.to_dict(),
+        )
+        path = write_summary(profiler, summary, cfg.profile_dir or default_summary_dir())
+        print(
+            f"[scene_project] Profil: {path} ({profiler.seconds:.3f} s, "
+            f"Python-Peak {profiler.peak_bytes / 2**20:.1f} MB)."
+        )
+
+
+def _build_steps(cfg: SceneConfig, forced: set[str]):
+    started = time.perf_counter()
+    # Profil und Material-Modus vor dem Aufräumen prüfen, damit ein Tippfehler die Szene nicht leert.
+    if cfg.render_profile:
+        get_render_profile(cfg.render_profile)
+    set_material_mode(cfg.material_mode)
+    scene_name = cfg.scene_name.lower().strip()
+    sections = scene_sections(cfg)
+    builders = scene_builders(cfg)
+    scene = bpy.context.scene
+
+    # Kamera zuerst auflösen: ``update`` und Culling brauchen sie vor dem Erzeugen.
+    camera = camera_spec(cfg)
+    previous = _previous_config(scene)
+    incremental = (
+        cfg.incremental_build and previous is not None and previous.get("scene_name", "").lower().strip() == scene_name
+    )
+    static = _static_builders(builders) if scene_name == "city" and cfg.city_bake_static else []
+    # Erst am Ende wieder gesetzt: ein abgebrochener Build gilt beim nächsten Mal nicht als aktuell.
+    scene.pop(CONFIG_PROP, None)
+    if incremental:
+        dirty = _dirty_builders(builders, cfg, previous, forced)
+        with section("update"):
+            updated = [
+                builder
+                for builder in dirty
+                if builder.update is not None and builder.name not in forced and builder.update(cfg, camera)
+            ]
+        dirty = [builder for builder in dirty if builder not in updated]
+        owned = [name for builder in dirty for name in builder.collections]
+        if any(builder in static for builder in dirty):
+            owned.append(CITY_STATIC)
+        # Collections von Buildern, die es nicht mehr gibt (z. B. entladene City-Kacheln).
+        current = {name for builder in builders for name in builder.collections}
+        stale = [name for name in json.loads(scene.get(COLLECTIONS_PROP, "[]")) if name not in current]
+        with section("clear"):
+            # Nach Code-Änderungen könnten gecachte Prototypen/Materialien veraltet sein.
+            clear_collections(owned + stale, keep_caches=cfg.keep_caches_on_clear and not forced)
+            remove_collections(stale)
+        names = ", ".join(builder.name for builder in dirty[:8]) or "keiner"
+        if len(dirty) > 8:
+            names += f", +{len(dirty) - 8}"
+        unloaded = f", {len(stale)} entladen" if stale else ""
+        adjusted = f", angepasst: {', '.join(builder.name for builder in updated)}" if updated else ""
+        print(
+            f"[scene_project] Inkrementeller Build: {len(dirty)}/{len(builders)} Builder neu "
+            f"({names}){adjusted}{unloaded}."
+        )
+    else:
+        dirty = list(builders)
+        with section("clear"):
+            clear_scene(keep_caches=cfg.keep_caches_on_clear)
+    yield BuildProgress("clear", 1, 1)
+
+    cache = _open_build_cache(cfg)
+    # Cache-Treffer werden direkt angehängt, der Rest wird geplant (ohne bpy) und gesammelt angewendet.
+    pending = []
+    for index, builder in enumerate(dirty):
+        _ensure_builder_collections(builder)
+        if builder.setup is not None:
+            continue
+        key = None
+        if cache is not None:
+            key = cache.key(_cache_payload(builder, cfg))
+            path = cache.lookup(key)
+            if path is not None:
+                with section(f"cache:{builder.name}"):
+                    _load_part(builder, path, cfg.build_cache_mode)
+                yield BuildProgress("cache", index + 1, len(dirty))
+                continue
+        pending.append((builder, key))
+
+    set_geometry_backend(cfg.geometry_backend)
+    reset_prototype_stats()
+    reset_instance_stats()
+    begin_material_cache()
+
+    if cfg.parallel_workers > 1 and len(pending) > 1:
+        with section("parallel"):
+            # Blockiert bis alle Worker fertig sind; die Teile erscheinen danach auf einmal.
+            _build_parallel(cfg, pending, cache, sections)
+        yield BuildProgress("parallel", 1, 1)
     else:
-        setup_sun_light(energy=cfg.sun_energy)
-        setup_camera(location=cfg.camera_location, rotation_euler=cfg.camera_rotation_euler)
+        plan = ScenePlan()
+        for index, (builder, _) in enumerate(pending):
+            with section(f"plan:{builder.name}", datablocks=False):
+                plan.extend(sections[builder.name](cfg))
+            yield BuildProgress("plan", index + 1, len(pending))
+        with section("cull_lod", datablocks=False):
+            plan = _prepare_plan(plan, cfg, camera)
+        with section("apply"):
+            for done in iter_apply_plan(plan, instance_collections=_instance_collections(cfg)):
+                yield BuildProgress("apply", done, len(plan))
+        print(f"[scene_project] Plan: {len(plan)} Objekte in {len(plan.collections)} Collections.")
+        for index, (builder, _) in enumerate(pending):
+            if builder.finish is not None:
+                with section(f"finish:{builder.name}"):
+                    builder.finish(cfg)
+                yield BuildProgress("finish", index + 1, len(pending))
+        if cache is not None:
+            # Vor dem Bake schreiben, damit jeder Eintrag genau die Objekte eines Builders enthält.
+            with section("cache_store", datablocks=False):
+                for builder, key in pending:
+                    cache.store(key, lambda path, names=builder.collections: write_collections(path, names))
 
-    print(f"[scene_project] Scene '{scene_name}' build complete.")
+    if cache is not None:
+        print(f"[scene_project] Build-Cache: {cache.report()}.")
+        cache.flush()
+
+    if any(builder in static for builder in dirty):
+        with section("bake"):
+            _bake_city_static()
+        yield BuildProgress("bake", 1, 1)
+    if scene_name == "city" and cfg.city_tiled:
+        with section("tile_visibility", datablocks=False):
+            _exclude_far_tiles(cfg, builders, camera)
+
+    for index, builder in enumerate(dirty):
+        if builder.setup is not None:
+            _activate_collection(builder.collections[0])
+            try:
+                with section(f"setup:{builder.name}"):
+                    builder.setup(cfg, camera)
+            finally:
+                _activate_collection(None)
+            yield BuildProgress("setup", index + 1, len(dirty))
+
+    if scene_name == "city" and cfg.city_drone_flight:
+        # Letztes Keyframe (frames + 1) entspricht Frame 1: die Schleife läuft nahtlos.
+        scene.frame_start, scene.frame_end = 1, cfg.city_drone_frames
+
+    # Ein gewähltes Profil ist billig und hängt an keinem Builder: bei jedem Build setzen.
+    # Ohne Profil bleibt es bei den Einstellungen der Szene (wie vor den Render-Profilen).
+    if cfg.render_profile:
+        with section("render_profile", datablocks=False):
+            print(f"[scene_project] {describe(apply_render_profile(cfg.render_profile))}.")
+
+    scene[CONFIG_PROP] = json.dumps(_config_values(cfg))
+    scene[COLLECTIONS_PROP] = json.dumps([name for builder in builders for name in builder.collections])
+
+    sharing = prototype_stats()
+    print(
+        f"[scene_project] Mesh-Sharing: {sharing['instances']} Instanzen auf {sharing['prototypes']} Prototypen "
+        f"({sharing['meshes_saved']} Mesh-Datablocks gespart)."
+    )
+    instances = instance_stats()
+    if instances["objects"]:
+        print(
+            f"[scene_project] Punkt-Instanzen: {instances['points']} Props in "
+            f"{instances['objects']} Geometry-Nodes-Objekten."
+        )
+    materials = material_cache_stats()
+    print(
+        f"[scene_project] Material-Cache: {materials['hits']} Hits, {materials['misses']} Misses "
+        f"({materials['reused']} ohne Node-Neubau), {materials['materials']} Materialien."
+    )
+    print(f"[scene_project] Scene '{scene_name}' build complete ({time.perf_counter() - started:.3f} s).")
+    return builders
+
+
+def _build_parallel(cfg: SceneConfig, pending, cache: BuildCache | None, sections):
+    """Baut ``pending`` in ``cfg.parallel_workers`` Hintergrund-Prozessen und linkt die Teile.
+
+    Die Teile landen im Build-Cache (gleiche Schlüssel wie seriell) bzw. ohne Cache in
+    ``parallel.parts_dir``; dort bleiben sie liegen, solange die Szene sie linkt.
+    """
+    store = cache or BuildCache(parts_dir(cfg.build_cache_dir), max_bytes=int(cfg.build_cache_max_mb * 2**20))
+    keys = {builder.name: key or store.key(_cache_payload(builder, cfg)) for builder, key in pending}
+    weights = {builder.name: len(sections[builder.name](cfg)) for builder, _ in pending}
+    job = {"config": cfg.to_dict(), "cache_dir": str(store.directory), "max_bytes": store.max_bytes}
+    jobs = [
+        dict(job, parts=[{"builder": name, "key": keys[name]} for name in group])
+        for group in partition(weights, cfg.parallel_workers)
+    ]
+
+    started = time.perf_counter()
+    results = run_workers(jobs)
+    linking = time.perf_counter()
+    mode = cfg.build_cache_mode if cache is not None else "link"
+    for builder, _ in pending:
+        _load_part(builder, store.path(keys[builder.name]), mode)
+    link_seconds = time.perf_counter() - linking
+    store.counters["writes"] += len(pending)
+    # Erst jetzt, da alle Teile gelinkt sind: Worker verdrängen nie Teile anderer Worker.
+    store.evict()
+    for line in timing_summary(results, time.perf_counter() - started, link_seconds):
+        print(f"[scene_project] {line}")
+
+
+def build_scene_part(job_path):
+    """Einstieg eines Worker-Prozesses: baut die Builder eines Jobs und schreibt je eine ``.blend``."""
+    job = json.loads(Path(job_path).read_text(encoding="utf-8"))
+    cfg = SceneConfig.from_dict(job["config"])
+    builders = {builder.name: builder for builder in scene_builders(cfg)}
+    sections = scene_sections(cfg)
+    camera = camera_spec(cfg)
+    store = BuildCache(job["cache_dir"], max_bytes=job["max_bytes"])
+
+    clear_scene(keep_caches=False)
+    set_geometry_backend(cfg.geometry_backend)
+    set_material_mode(cfg.material_mode)
+    reset_prototype_stats()
+    reset_instance_stats()
+    begin_material_cache()
+
+    parts = []
+    for name, key in job_parts(job):
+        started = time.perf_counter()
+        builder = builders[name]
+        _ensure_builder_collections(builder)
+        plan = _prepare_plan(sections[name](cfg), cfg, camera)
+        apply_plan(plan, instance_collections=_instance_collections(cfg))
+        if builder.finish is not None:
+            builder.finish(cfg)
+        seconds = time.perf_counter() - started
+        store.store(key, lambda path, names=builder.collections: write_collections(path, names), evict=False)
+        parts.append({"builder": name, "objects": len(plan), "seconds": seconds})
+    write_result(job_path, parts)
+
+
+def compare_parallel_build(config: SceneConfig | None = None, workers: int = 4) -> dict:
+    """Baut die Szene komplett seriell und parallel, vergleicht Laufzeit und Ergebnis (``scene_digest``).
+
+    Für die City läuft zusätzlich ein Fall mit ``city_drone_flight``, damit animierte (gelinkte)
+    Objekte mitgeprüft werden.
+    """
+    cfg = replace(config or SceneConfig(), incremental_build=False, build_cache=False)
+    cases = {"": cfg}
+    if cfg.scene_name.lower().strip() == "city" and not cfg.city_drone_flight:
+        cases["Drohnen-Flug"] = replace(cfg, city_drone_flight=True)
+
+    results = {}
+    for case, case_cfg in cases.items():
+        seconds, digests = {}, {}
+        for label, count in (("serial", 0), ("parallel", workers)):
+            started = time.perf_counter()
+            build_scene(replace(case_cfg, parallel_workers=count))
+            seconds[label] = time.perf_counter() - started
+            digests[label] = scene_digest()
+
+        identical = digests["serial"] == digests["parallel"]
+        speedup = seconds["serial"] / max(seconds["parallel"], 1e-9)
+        prefix = f"{case}: " if case else ""
+        verdict = "identisch" if identical else "ABWEICHEND"
+        print(
+            f"[scene_project] {prefix}Seriell {seconds['serial']:.2f} s, parallel ({workers} Worker) "
+            f"{seconds['parallel']:.2f} s, Speedup {speedup:.2f}x, Ergebnis {verdict}."
+        )
+        digest = digests["parallel"]
+        results[case] = {"seconds": seconds, "speedup": speedup, "identical": identical, "digest": digest}
+
+    result = dict(results[""])
+    result["identical"] = all(case["identical"] for case in results.values())
+    result["cases"] = results
+    return result
+
+
+def _exclude_far_tiles(cfg: SceneConfig, builders, camera: CameraSpec):
+    """Schließt geladene Kacheln außerhalb von ``city_tile_exclude_radius`` aus dem View-Layer aus."""
+    tiles = [builder.name for builder in builders if builder.parent == CITY_TILES]
+    near = set(tiles)
+    if cfg.city_tile_exclude_radius > 0.0:
+        near = {
+            city_tile_name(tx, ty)
+            for tx, ty in city_tiles_in_radius(
+                cfg.city_grid_size,
+                cfg.city_block_spacing,
+                cfg.city_tile_size,
+                camera.location,
+                cfg.city_tile_exclude_radius,
+            )
+        }
+    states = {name: name not in near for name in tiles}
+    excluded = sum(states.values())
+    set_collections_excluded(states)
+    if excluded:
+        print(f"[scene_project] City-Kacheln: {len(tiles) - excluded} sichtbar, {excluded} ausgeschlossen.")
+
+
+def _bake_city_static():
+    sources = []
+    for name in CITY_STATIC_SOURCES:
+        collection = bpy.data.collections.get(name)
+        if collection is not None:
+            sources.extend(collection.objects)
+    baked = bake_static_by_material(sources, collection_name=CITY_STATIC)
+    print(
+        f"[scene_project] Bake Static: {baked['source_objects']} Objekte -> "
+        f"{len(baked['merged'])} Meshes (eins pro Material)."
+    )
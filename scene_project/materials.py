@@ -1,24 +1,90 @@
-"""Material-Helferfunktionen."""
+"""Material-Helferfunktionen.
+
+Die ``make_*_material``-Funktionen laufen über einen Build-Cache: Jede Kombination aus
+Material-Typ, Name und Parametern baut ihren Node-Tree höchstens einmal pro Build.
+Existiert das Material bereits mit identischer Signatur (z. B. aus dem letzten
+"Run Script"), wird der Node-Tree gar nicht neu aufgebaut.
+
+Im Material-Modus ``attributes`` teilen sich alle Window- bzw. Emission-Varianten ein
+Familien-Material, das Farben und Stärke per Attribute-Node (Typ ``INSTANCER``) aus Custom
+Properties ``sp_attr_<param>`` am Objekt bzw. gleichnamigen Punkt-Attributen der Instanz liest.
+Materialzahl und Shader-Kompilierungen bleiben so konstant, egal wie viele Farbvarianten es gibt.
+"""
 
 import bpy
 
+from scene_project.datablocks import is_alive, tag_generated
+from scene_project.geometry import PROTOTYPE_PROP
+from scene_project.profiler import profiled
 
-def make_principled_material(
-    name: str,
-    base_color: tuple[float, float, float, float],
-    roughness: float = 0.5,
-    metallic: float = 0.0,
-):
-    """Erzeugt oder aktualisiert ein Principled-Material."""
+# Custom Property mit den Parametern, aus denen der Node-Tree gebaut wurde.
+SIGNATURE_PROP = "sp_signature"
+
+# "materials": ein Material pro Variante; "attributes": ein Material pro Familie, Werte am Objekt.
+MATERIAL_MODES = ("materials", "attributes")
+ATTRIBUTE_PREFIX = "sp_attr_"
+# Familie -> (Name des gemeinsamen Materials, Parameter, die als Objekt-Attribute gelesen werden).
+SHARED_FAMILIES = {
+    "window": ("M_Shared_Window", ("base_color", "emission_color", "emission_strength")),
+    "emission": ("M_Shared_Emission", ("color", "strength")),
+}
+
+_material_cache: dict[tuple, object] = {}
+_cache_stats = {"hits": 0, "misses": 0, "reused": 0}
+_material_mode = "materials"
+
+
+def set_material_mode(mode: str):
+    """Wählt den Material-Modus für folgende ``resolve_material``-Aufrufe."""
+    global _material_mode
+    if mode not in MATERIAL_MODES:
+        supported = ", ".join(MATERIAL_MODES)
+        raise ValueError(f"Unbekannter Material-Modus '{mode}'. Erlaubt: {supported}")
+    _material_mode = mode
+
+
+def get_material_mode() -> str:
+    return _material_mode
+
+
+def begin_material_cache():
+    """Startet einen neuen Build-Scope für den Material-Cache."""
+    _material_cache.clear()
+    for key in _cache_stats:
+        _cache_stats[key] = 0
+
+
+def material_cache_stats() -> dict[str, int]:
+    """Hits/Misses des Caches; ``reused`` = Misses ohne Node-Tree-Neubau."""
+    return dict(_cache_stats, materials=len(_material_cache))
+
+
+def _cached_material(kind: str, name: str, params: dict, build_nodes):
+    key = (kind, name, tuple(sorted(params.items())))
+    mat = _material_cache.get(key)
+    if is_alive(mat):
+        _cache_stats["hits"] += 1
+        return mat
+
+    _cache_stats["misses"] += 1
     mat = bpy.data.materials.get(name)
     if mat is None:
-        mat = bpy.data.materials.new(name=name)
+        mat = tag_generated(bpy.data.materials.new(name=name))
 
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
+    signature = repr(key)
+    if mat.use_nodes and mat.get(SIGNATURE_PROP) == signature:
+        _cache_stats["reused"] += 1
+    else:
+        mat.use_nodes = True
+        mat.node_tree.nodes.clear()
+        build_nodes(mat.node_tree.nodes, mat.node_tree.links, **params)
+        mat[SIGNATURE_PROP] = signature
+
+    _material_cache[key] = mat
+    return mat
 
-    nodes.clear()
+
+def _build_principled_nodes(nodes, links, base_color, roughness, metallic):
     out = nodes.new(type="ShaderNodeOutputMaterial")
     bsdf = nodes.new(type="ShaderNodeBsdfPrincipled")
 
@@ -27,31 +93,40 @@ def make_principled_material(
     bsdf.inputs["Metallic"].default_value = metallic
 
     links.new(bsdf.outputs["BSDF"], out.inputs["Surface"])
-    return mat
 
 
+@profiled
+def make_principled_material(
+    name: str,
+    base_color: tuple[float, float, float, float],
+    roughness: float = 0.5,
+    metallic: float = 0.0,
+):
+    """Erzeugt oder aktualisiert ein Principled-Material."""
+    params = {"base_color": tuple(base_color), "roughness": roughness, "metallic": metallic}
+    return _cached_material("principled", name, params, _build_principled_nodes)
+
+
+@profiled
 def assign_material(obj, material):
     """Weist einem Objekt ein Material zu."""
     if obj is None or material is None:
         return
 
+    if obj.data.get(PROTOTYPE_PROP):
+        # Geteiltes Mesh: Material am Objekt-Slot, sonst überschreiben sich die Instanzen.
+        slot = obj.material_slots[0]
+        slot.link = "OBJECT"
+        slot.material = material
+        return
+
     if len(obj.data.materials) == 0:
         obj.data.materials.append(material)
     else:
         obj.data.materials[0] = material
 
 
-def make_emission_material(name: str, color: tuple[float, float, float, float], strength: float = 8.0):
-    """Erzeugt oder aktualisiert ein Emission-Material."""
-    mat = bpy.data.materials.get(name)
-    if mat is None:
-        mat = bpy.data.materials.new(name=name)
-
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-
-    nodes.clear()
+def _build_emission_nodes(nodes, links, color, strength):
     out = nodes.new(type="ShaderNodeOutputMaterial")
     emission = nodes.new(type="ShaderNodeEmission")
 
@@ -59,9 +134,29 @@ def make_emission_material(name: str, color: tuple[float, float, float, float],
     emission.inputs["Strength"].default_value = strength
 
     links.new(emission.outputs["Emission"], out.inputs["Surface"])
-    return mat
 
 
+@profiled
+def make_emission_material(name: str, color: tuple[float, float, float, float], strength: float = 8.0):
+    """Erzeugt oder aktualisiert ein Emission-Material."""
+    params = {"color": tuple(color), "strength": strength}
+    return _cached_material("emission", name, params, _build_emission_nodes)
+
+
+def _build_window_nodes(nodes, links, base_color, emission_color, emission_strength):
+    out = nodes.new(type="ShaderNodeOutputMaterial")
+    bsdf = nodes.new(type="ShaderNodeBsdfPrincipled")
+
+    bsdf.inputs["Base Color"].default_value = base_color
+    bsdf.inputs["Metallic"].default_value = 0.45
+    bsdf.inputs["Roughness"].default_value = 0.22
+    bsdf.inputs["Emission Color"].default_value = emission_color
+    bsdf.inputs["Emission Strength"].default_value = emission_strength
+
+    links.new(bsdf.outputs["BSDF"], out.inputs["Surface"])
+
+
+@profiled
 def make_window_material(
     name: str,
     base_color: tuple[float, float, float, float],
@@ -69,23 +164,80 @@ def make_window_material(
     emission_strength: float = 1.8,
 ):
     """Material für City-Tower mit leichter Selbstbeleuchtung."""
-    mat = bpy.data.materials.get(name)
-    if mat is None:
-        mat = bpy.data.materials.new(name=name)
+    params = {
+        "base_color": tuple(base_color),
+        "emission_color": tuple(emission_color),
+        "emission_strength": emission_strength,
+    }
+    return _cached_material("window", name, params, _build_window_nodes)
+
+
+_MATERIAL_FACTORIES = {
+    "principled": make_principled_material,
+    "emission": make_emission_material,
+    "window": make_window_material,
+}
+
 
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    links = mat.node_tree.links
-    nodes.clear()
+@profiled
+def build_material(factory: str, name: str, **params):
+    """Erzeugt ein Material über den Factory-Namen (``principled``/``emission``/``window``)."""
+    make = _MATERIAL_FACTORIES.get(factory)
+    if make is None:
+        supported = ", ".join(sorted(_MATERIAL_FACTORIES))
+        raise ValueError(f"Unbekannte Material-Factory '{factory}'. Erlaubt: {supported}")
+    return make(name=name, **params)
 
+
+def _attribute_node(nodes, param: str):
+    node = nodes.new(type="ShaderNodeAttribute")
+    # Liest Instanz-Attribute (Backend "instances"), sonst die Custom Properties des Objekts.
+    node.attribute_type = "INSTANCER"
+    node.attribute_name = ATTRIBUTE_PREFIX + param
+    return node
+
+
+def _build_shared_window_nodes(nodes, links):
     out = nodes.new(type="ShaderNodeOutputMaterial")
     bsdf = nodes.new(type="ShaderNodeBsdfPrincipled")
-
-    bsdf.inputs["Base Color"].default_value = base_color
     bsdf.inputs["Metallic"].default_value = 0.45
     bsdf.inputs["Roughness"].default_value = 0.22
-    bsdf.inputs["Emission Color"].default_value = emission_color
-    bsdf.inputs["Emission Strength"].default_value = emission_strength
 
+    links.new(_attribute_node(nodes, "base_color").outputs["Color"], bsdf.inputs["Base Color"])
+    links.new(_attribute_node(nodes, "emission_color").outputs["Color"], bsdf.inputs["Emission Color"])
+    links.new(_attribute_node(nodes, "emission_strength").outputs["Fac"], bsdf.inputs["Emission Strength"])
     links.new(bsdf.outputs["BSDF"], out.inputs["Surface"])
-    return mat
+
+
+def _build_shared_emission_nodes(nodes, links):
+    out = nodes.new(type="ShaderNodeOutputMaterial")
+    emission = nodes.new(type="ShaderNodeEmission")
+
+    links.new(_attribute_node(nodes, "color").outputs["Color"], emission.inputs["Color"])
+    links.new(_attribute_node(nodes, "strength").outputs["Fac"], emission.inputs["Strength"])
+    links.new(emission.outputs["Emission"], out.inputs["Surface"])
+
+
+_SHARED_BUILDERS = {"window": _build_shared_window_nodes, "emission": _build_shared_emission_nodes}
+
+
+def resolve_material(factory: str, name: str, **params) -> tuple[object, dict | None]:
+    """Material für eine Plan-Variante plus Objekt-Attribute (``None`` = keine).
+
+    Im Modus ``attributes`` liefern Familien aus ``SHARED_FAMILIES`` ihr gemeinsames Material und
+    die Werte ``{"sp_attr_<param>": wert}``, die an jedes Objekt dieser Variante gehören.
+    """
+    if _material_mode != "attributes" or factory not in SHARED_FAMILIES:
+        return build_material(factory, name, **params), None
+    shared_name, attributes = SHARED_FAMILIES[factory]
+    mat = _cached_material(f"shared_{factory}", shared_name, {}, _SHARED_BUILDERS[factory])
+    return mat, {ATTRIBUTE_PREFIX + param: params[param] for param in attributes}
+
+
+def object_attributes(obj) -> tuple:
+    """Gesetzte ``sp_attr_*``-Werte eines Objekts als hashbares Tupel (z. B. als Gruppen-Schlüssel)."""
+    return tuple(
+        (key, tuple(value) if hasattr(value, "__len__") else value)
+        for key, value in sorted(obj.items())
+        if key.startswith(ATTRIBUTE_PREFIX)
+    )
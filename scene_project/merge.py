@@ -0,0 +1,166 @@
+"""Merge statischer Geometrie zu einem Mesh pro Material ("Bake Static").
+
+Viele kleine Objekte kosten Depsgraph-Auswertung und Draw-Calls. ``bake_static_by_material``
+fasst alle übergebenen, nicht animierten Objekte mit gleichem Material zu einem Mesh
+zusammen – per Array-Konkatenation über ``foreach_get``/``foreach_set`` statt
+``bpy.ops.object.join``. Eine Seitentabelle (Custom Property ``sp_face_ranges``) merkt
+sich, welche Faces zu welchem Originalobjekt gehörten. Objekte mit Farb-Attributen
+(Material-Modus ``attributes``) werden zusätzlich nach diesen Werten gruppiert.
+"""
+
+from __future__ import annotations
+
+import json
+from bisect import bisect_right
+
+import bpy
+import numpy as np
+
+from scene_project.datablocks import ensure_collection, tag_generated
+from scene_project.materials import object_attributes
+
+FACE_RANGES_PROP = "sp_face_ranges"
+
+
+def _is_static(obj) -> bool:
+    # Punkt-Instanzen (Modifier) und ihre versteckten Prototyp-Objekte bleiben, wie sie sind.
+    anim = obj.animation_data
+    return obj.type == "MESH" and not obj.modifiers and not obj.hide_render and (anim is None or anim.action is None)
+
+
+def _mesh_arrays(mesh) -> dict[str, np.ndarray]:
+    """Topologie eines Meshes als flache NumPy-Arrays (einmal pro Mesh, nicht pro Objekt)."""
+    n_verts, n_loops, n_polys = len(mesh.vertices), len(mesh.loops), len(mesh.polygons)
+
+    co = np.empty(n_verts * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    vertex_index = np.empty(n_loops, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", vertex_index)
+    loop_start = np.empty(n_polys, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_start)
+    loop_total = np.empty(n_polys, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_total)
+
+    uv = None
+    if mesh.uv_layers.active is not None:
+        uv = np.empty(n_loops * 2, dtype=np.float32)
+        mesh.uv_layers.active.data.foreach_get("uv", uv)
+
+    return {
+        "co": co.reshape(-1, 3),
+        "vertex_index": vertex_index,
+        "loop_start": loop_start,
+        "loop_total": loop_total,
+        "uv": uv,
+    }
+
+
+def _merge_group(name: str, objects: list, material, collection, attributes: tuple = ()):
+    """Baut ein Mesh aus allen ``objects`` (gleiches Material) und liefert Objekt + Face-Ranges."""
+    cache: dict[str, dict[str, np.ndarray]] = {}
+    co_parts, index_parts, start_parts, total_parts, uv_parts = [], [], [], [], []
+    face_ranges: list[tuple[str, int, int]] = []
+    vert_offset = loop_offset = face_offset = 0
+    has_uv = True
+
+    for obj in objects:
+        mesh = obj.data
+        arrays = cache.get(mesh.name)
+        if arrays is None:
+            arrays = cache[mesh.name] = _mesh_arrays(mesh)
+
+        matrix = np.array(obj.matrix_world, dtype=np.float32)
+        co = arrays["co"] @ matrix[:3, :3].T + matrix[:3, 3]
+
+        co_parts.append(co)
+        index_parts.append(arrays["vertex_index"] + vert_offset)
+        start_parts.append(arrays["loop_start"] + loop_offset)
+        total_parts.append(arrays["loop_total"])
+        has_uv = has_uv and arrays["uv"] is not None
+        uv_parts.append(arrays["uv"])
+
+        n_faces = len(arrays["loop_start"])
+        face_ranges.append((obj.name, face_offset, n_faces))
+        vert_offset += len(co)
+        loop_offset += len(arrays["vertex_index"])
+        face_offset += n_faces
+
+    mesh = tag_generated(bpy.data.meshes.new(name))
+    mesh.vertices.add(vert_offset)
+    mesh.vertices.foreach_set("co", np.concatenate(co_parts).ravel())
+    mesh.loops.add(loop_offset)
+    mesh.loops.foreach_set("vertex_index", np.concatenate(index_parts))
+    mesh.polygons.add(face_offset)
+    mesh.polygons.foreach_set("loop_start", np.concatenate(start_parts))
+    if bpy.app.version < (4, 0, 0):
+        # Ab Blender 4.0 ergibt sich loop_total aus loop_start und ist schreibgeschützt.
+        mesh.polygons.foreach_set("loop_total", np.concatenate(total_parts))
+    if has_uv:
+        uv_layer = mesh.uv_layers.new(name="UVMap")
+        uv_layer.data.foreach_set("uv", np.concatenate(uv_parts))
+    mesh.update(calc_edges=True)
+    mesh.materials.append(material)
+
+    merged = bpy.data.objects.new(name, mesh)
+    merged[FACE_RANGES_PROP] = json.dumps(face_ranges)
+    for key, value in attributes:
+        merged[key] = value
+    collection.objects.link(merged)
+    return merged, face_ranges
+
+
+def bake_static_by_material(objects, collection_name: str = "City_Static", name_prefix: str = "CityStatic") -> dict:
+    """Merged alle statischen Mesh-Objekte pro Material (und Attribut-Kombination) und entfernt die Originale.
+
+    Args:
+        objects: Kandidaten; animierte, Nicht-Mesh- und Instanz-Objekte bleiben unangetastet.
+        collection_name: Collection für die gemergten Objekte.
+        name_prefix: Präfix für Objekt-/Mesh-Namen (``<prefix>_<Material>``).
+
+    Returns:
+        ``{"merged": [...], "face_ranges": {merged_name: [(source_name, first_face, face_count), ...]},
+        "source_objects": n}``
+    """
+    groups: dict[tuple, tuple[object, list]] = {}
+    for obj in objects:
+        if not _is_static(obj):
+            continue
+        material = obj.active_material
+        key = (material.name if material is not None else "", object_attributes(obj))
+        groups.setdefault(key, (material, []))[1].append(obj)
+
+    # matrix_world von frisch per bpy.data angelegten Objekten ist erst nach einem Update gültig.
+    bpy.context.view_layer.update()
+
+    collection = ensure_collection(collection_name)
+    merged, face_ranges, sources = [], {}, []
+    variants: dict[str, int] = {}
+    for (material_name, attributes), (material, members) in groups.items():
+        name = f"{name_prefix}_{material_name or 'NoMaterial'}"
+        if attributes:
+            # Gemeinsames Familien-Material: ein Mesh pro Attribut-Kombination.
+            variants[name] = variants.get(name, 0) + 1
+            name = f"{name}_{variants[name]:02d}"
+        obj, ranges = _merge_group(name, members, material, collection, attributes)
+        merged.append(obj)
+        face_ranges[obj.name] = ranges
+        sources.extend(members)
+
+    if sources:
+        bpy.data.batch_remove(sources)
+
+    return {"merged": merged, "face_ranges": face_ranges, "source_objects": len(sources)}
+
+
+def source_object_for_face(merged_obj, face_index: int) -> str | None:
+    """Name des Originalobjekts, aus dem ``face_index`` eines gemergten Objekts stammt."""
+    raw = merged_obj.get(FACE_RANGES_PROP)
+    if not raw:
+        return None
+    ranges = json.loads(raw)
+    starts = [first for _, first, _ in ranges]
+    slot = bisect_right(starts, face_index) - 1
+    if slot < 0:
+        return None
+    name, first, count = ranges[slot]
+    return name if face_index < first + count else None
@@ -0,0 +1,158 @@
+"""Verteilt Plan-Builder auf mehrere ``blender --background``-Prozesse.
+
+Jeder Worker bekommt eine Job-Datei (JSON mit Config und Builder-Namen), baut seine Builder
+wie der serielle Pfad und schreibt jeden Builder als eigene ``.blend`` (Schlüssel wie im
+Build-Cache). Der Hauptprozess linkt die Teile anschließend in die Szene. Da jeder Teilplan
+einen eigenen Zufallsstrom nutzt (Builder-Name bzw. Kachel-Koordinate), ist das Ergebnis
+unabhängig von der Aufteilung identisch zum seriellen Build – ``scene_digest`` prüft das.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import bpy
+import numpy as np
+
+from scene_project.build_cache import PACKAGE_DIR, default_cache_dir
+
+ENTRY_SCRIPT = PACKAGE_DIR.parent / "run_in_blender.py"
+WORKER_ARG = "--worker"
+PARTS_DIR_NAME = "parts"
+
+
+def parts_dir(cache_dir: str = "") -> Path:
+    """Ablage für Worker-Teile, wenn der Build-Cache aus ist (wird per LRU klein gehalten)."""
+    return Path(cache_dir or default_cache_dir()) / PARTS_DIR_NAME
+
+
+def partition(weights: dict[str, int], workers: int) -> list[list[str]]:
+    """Verteilt Builder nach Gewicht (Objektzahl) auf ``workers`` Gruppen (größte zuerst, LPT)."""
+    groups: list[list[str]] = [[] for _ in range(max(1, min(workers, len(weights))))]
+    loads = [0] * len(groups)
+    for name in sorted(weights, key=lambda name: (-weights[name], name)):
+        slot = loads.index(min(loads))
+        groups[slot].append(name)
+        loads[slot] += weights[name] or 1
+    return groups
+
+
+def worker_command(job_path: Path) -> list[str]:
+    """Kommandozeile eines Workers: Blender im Hintergrund, bei ``bpy`` als Modul der aktuelle Interpreter."""
+    script_args = [str(ENTRY_SCRIPT), "--", WORKER_ARG, str(job_path)]
+    binary = bpy.app.binary_path
+    if binary and Path(binary).name.lower().startswith("blender"):
+        return [binary, "--background", "--factory-startup", "--python", *script_args]
+    return [sys.executable, *script_args]
+
+
+def run_workers(jobs: list[dict]) -> list[dict]:
+    """Startet einen Prozess pro Job, wartet auf alle und liefert deren Ergebnisse.
+
+    Jeder Job ist ein JSON-fähiges dict; der Worker schreibt sein Ergebnis nach ``<job>.result.json``.
+
+    Raises:
+        RuntimeError: Wenn ein Worker mit Fehler endet (inkl. dessen Ausgabe).
+    """
+    with tempfile.TemporaryDirectory(prefix="scene_project_") as tmp:
+        running = []
+        for index, job in enumerate(jobs):
+            job_path = Path(tmp) / f"job_{index}.json"
+            job_path.write_text(json.dumps(job), encoding="utf-8")
+            # Ausgabe in eine Datei statt Pipe: ein volles Pipe-Puffer würde den Worker blockieren.
+            with open(job_path.with_suffix(".log"), "w", encoding="utf-8") as log:
+                process = subprocess.Popen(worker_command(job_path), stdout=log, stderr=subprocess.STDOUT)
+            running.append((job_path, process, time.perf_counter()))
+
+        results = []
+        for index, (job_path, process, started) in enumerate(running):
+            process.wait()
+            seconds = time.perf_counter() - started
+            result_path = job_path.with_suffix(".result.json")
+            if process.returncode != 0 or not result_path.is_file():
+                for _, other, _ in running:
+                    other.kill()
+                    other.wait()
+                output = job_path.with_suffix(".log").read_text(encoding="utf-8", errors="replace")
+                raise RuntimeError(f"Worker {index} fehlgeschlagen (Exit {process.returncode}):\n{output}")
+            result = json.loads(result_path.read_text(encoding="utf-8"))
+            result["process_seconds"] = seconds
+            results.append(result)
+    return results
+
+
+def timing_summary(results: list[dict], wall_seconds: float, link_seconds: float) -> list[str]:
+    """Zeilen für die Konsole: Wandzeit inkl. Worker-Start und Linken, Worker-Auslastung, Details pro Worker.
+
+    Die Auslastung ist Build-Arbeit / (Worker × Wandzeit) – kein Speedup ggü. dem seriellen Pfad;
+    den misst ``main.compare_parallel_build`` mit einem echten seriellen ``build_scene``.
+    """
+    work = sum(part["seconds"] for result in results for part in result["parts"])
+    builders = sum(len(result["parts"]) for result in results)
+    utilization = work / max(len(results) * wall_seconds, 1e-9)
+    lines = [
+        f"Parallel-Build: {builders} Builder auf {len(results)} Worker in {wall_seconds:.2f} s "
+        f"inkl. Worker-Start und Linken ({link_seconds:.2f} s); Build-Arbeit {work:.2f} s, "
+        f"Worker-Auslastung {utilization:.0%}. Speedup ggü. seriell: main.compare_parallel_build()."
+    ]
+    for index, result in enumerate(results):
+        parts = result["parts"]
+        build = sum(part["seconds"] for part in parts)
+        lines.append(
+            f"  Worker {index}: {len(parts)} Builder, {sum(part['objects'] for part in parts)} Objekte, "
+            f"Build {build:.2f} s, Prozess {result['process_seconds']:.2f} s "
+            f"(Start/Schreiben {result['process_seconds'] - build:.2f} s)"
+        )
+    return lines
+
+
+def scene_digest() -> str:
+    """SHA-256 über alle Objekte der Szene: Name, Collections, Typ, Transformation, Materialien, Mesh-Daten.
+
+    Bibliothek und Datablock-Namen zählen nicht, damit gelinkte Teile und lokal gebaute Objekte
+    vergleichbar sind. Animierte Objekte zählen mit ihrer Pose im aktuellen Frame.
+    """
+    scene = bpy.context.scene
+    # ``view_layer.update()`` wertet die Animation gelinkter Objekte nicht aus, ``frame_set`` schon.
+    scene.frame_set(scene.frame_current)
+    meshes: dict[int, bytes] = {}
+    h = hashlib.sha256()
+    for obj in sorted(scene.objects, key=lambda obj: obj.name):
+        h.update(obj.name.encode("utf-8"))
+        # Nur lokale Collections: gelinkte Objekte hängen zusätzlich in der Collection ihrer Bibliothek.
+        collections = sorted(c.name for c in obj.users_collection if c.library is None)
+        h.update(",".join(collections).encode("utf-8"))
+        h.update(obj.type.encode("utf-8"))
+        h.update(np.array(obj.matrix_world, dtype=np.float64).tobytes())
+        h.update(",".join(slot.material.name if slot.material else "" for slot in obj.material_slots).encode("utf-8"))
+        if obj.type == "MESH":
+            pointer = obj.data.as_pointer()
+            if pointer not in meshes:
+                meshes[pointer] = _mesh_digest(obj.data)
+            h.update(meshes[pointer])
+    return h.hexdigest()
+
+
+def _mesh_digest(mesh) -> bytes:
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    vertex_index = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", vertex_index)
+    return hashlib.sha256(co.tobytes() + vertex_index.tobytes()).digest()
+
+
+def job_parts(job: dict) -> list[tuple[str, str]]:
+    """``(builder, key)``-Paare eines Jobs."""
+    return [(part["builder"], part["key"]) for part in job["parts"]]
+
+
+def write_result(job_path: str | os.PathLike, parts: list[dict]):
+    """Ergebnis eines Workers neben die Job-Datei schreiben (``<job>.result.json``)."""
+    Path(job_path).with_suffix(".result.json").write_text(json.dumps({"parts": parts}), encoding="utf-8")
@@ -0,0 +1,320 @@
+"""Scene-Plan: kompakte Beschreibung aller Objekte einer Szene – ohne ``bpy``.
+
+Ein ``ScenePlan`` hält pro Objekt nur Indizes in interne Tabellen (Primitive, Material,
+Collection, Namensmuster) plus 9 Floats für Location/Rotation/Scale in ``array``-Spalten.
+Damit lassen sich Layouts mit 10^6 Objekten ohne Blender (CPython + NumPy) erzeugen,
+vergleichen, cachen und benchmarken. Erst ``scene_project.apply.apply_plan`` erzeugt daraus Blender-Objekte.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from array import array
+from typing import Iterator, NamedTuple, Sequence
+
+import numpy as np
+
+Vec3 = tuple[float, float, float]
+
+# Floats pro Objekt in ``ScenePlan.transforms``: Location, Rotation (Euler XYZ), Scale.
+TRANSFORM_STRIDE = 9
+
+
+class PrimitiveSpec(NamedTuple):
+    """Mesh-Primitive mit den Parametern von ``bpy.ops.mesh.primitive_<kind>_add``."""
+
+    kind: str
+    params: tuple
+    shared: bool = False
+
+
+class MaterialSpec(NamedTuple):
+    """Material-Factory (``principled``/``emission``/``window``) mit Name und Parametern."""
+
+    factory: str
+    name: str
+    params: tuple
+
+
+class PlannedObject(NamedTuple):
+    """Lesesicht auf ein Objekt im Plan (wird beim Iterieren erzeugt, nicht gespeichert)."""
+
+    index: int
+    name: str
+    primitive: PrimitiveSpec
+    material: MaterialSpec | None
+    collection: str
+    location: Vec3
+    rotation: Vec3
+    scale: Vec3
+
+
+def primitive(kind: str, shared: bool = False, **params) -> PrimitiveSpec:
+    """Baut eine hashbare ``PrimitiveSpec``."""
+    return PrimitiveSpec(kind, tuple(sorted(params.items())), shared)
+
+
+def material(factory: str, name: str, **params) -> MaterialSpec:
+    """Baut eine hashbare ``MaterialSpec`` (Farben als Tupel)."""
+    frozen = {key: tuple(value) if isinstance(value, list) else value for key, value in params.items()}
+    return MaterialSpec(factory, name, tuple(sorted(frozen.items())))
+
+
+def _freeze(value):
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class _Table:
+    """Interning-Tabelle: jeder Wert bekommt genau einen stabilen Index."""
+
+    def __init__(self):
+        self.values: list = []
+        self._index: dict = {}
+
+    def intern(self, value) -> int:
+        idx = self._index.get(value)
+        if idx is None:
+            idx = len(self.values)
+            self.values.append(value)
+            self._index[value] = idx
+        return idx
+
+    def __getitem__(self, idx: int):
+        return self.values[idx]
+
+    def copy(self) -> _Table:
+        table = _Table()
+        table.values = list(self.values)
+        table._index = dict(self._index)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class ScenePlan:
+    """Array-basierter Plan aller Objekte einer Szene."""
+
+    NO_MATERIAL = -1
+
+    def __init__(self):
+        self.primitives = _Table()
+        self.materials = _Table()
+        self.collections = _Table()
+        self.name_patterns = _Table()
+
+        self.primitive_ids = array("I")
+        self.material_ids = array("i")
+        self.collection_ids = array("I")
+        self.name_ids = array("I")
+        self.serials = array("I")
+        self.transforms = array("f")
+
+    def __len__(self) -> int:
+        return len(self.primitive_ids)
+
+    def add(
+        self,
+        name: str,
+        prim: PrimitiveSpec,
+        mat: MaterialSpec | None,
+        collection: str,
+        location: Vec3,
+        rotation: Vec3 = (0.0, 0.0, 0.0),
+        scale: Vec3 = (1.0, 1.0, 1.0),
+        serial: int = 0,
+    ) -> int:
+        """Hängt ein Objekt an und liefert seinen Index.
+
+        ``name`` ist ein Format-Muster; ``{i}`` wird beim Anwenden durch ``serial`` ersetzt
+        (z. B. ``"Rock_{i:02d}"``).
+        """
+        self.primitive_ids.append(self.primitives.intern(prim))
+        self.material_ids.append(self.NO_MATERIAL if mat is None else self.materials.intern(mat))
+        self.collection_ids.append(self.collections.intern(collection))
+        self.name_ids.append(self.name_patterns.intern(name))
+        self.serials.append(serial)
+        self.transforms.extend(location)
+        self.transforms.extend(rotation)
+        self.transforms.extend(scale)
+        return len(self.primitive_ids) - 1
+
+    def add_batch(
+        self,
+        name: str,
+        prim: PrimitiveSpec,
+        mat: MaterialSpec | Sequence[MaterialSpec] | None,
+        collection: str,
+        locations,
+        rotations=None,
+        scales=None,
+        material_choice=None,
+        serials=None,
+    ) -> range:
+        """Hängt ``n`` gleichartige Objekte aus ``(n, 3)``-Arrays in einem Schritt an.
+
+        Args:
+            mat: Eine ``MaterialSpec`` für alle Objekte oder eine Liste von Varianten;
+                bei Varianten wählt ``material_choice`` (Index-Array) pro Objekt.
+            rotations/scales: Optional, Standard ist keine Rotation bzw. Scale 1.
+            serials: Nummern für das Namensmuster, Standard ``0..n-1``.
+
+        Returns:
+            Indexbereich der neuen Objekte.
+        """
+        locations = np.asarray(locations, dtype=np.float32).reshape(-1, 3)
+        count = len(locations)
+        rotations = np.zeros((count, 3), np.float32) if rotations is None else rotations
+        scales = np.ones((count, 3), np.float32) if scales is None else scales
+        serials = np.arange(count) if serials is None else serials
+        start = len(self)
+
+        self.primitive_ids.extend(array("I", [self.primitives.intern(prim)]) * count)
+        if material_choice is not None:
+            variants = np.array([self.materials.intern(variant) for variant in mat], dtype=np.int32)
+            self.material_ids.frombytes(variants[np.asarray(material_choice)].astype(np.int32).tobytes())
+        else:
+            mat_id = self.NO_MATERIAL if mat is None else self.materials.intern(mat)
+            self.material_ids.extend(array("i", [mat_id]) * count)
+        self.collection_ids.extend(array("I", [self.collections.intern(collection)]) * count)
+        self.name_ids.extend(array("I", [self.name_patterns.intern(name)]) * count)
+        self.serials.frombytes(np.asarray(serials, dtype=np.uint32).tobytes())
+
+        block = np.hstack(
+            (
+                locations,
+                np.asarray(rotations, dtype=np.float32).reshape(count, 3),
+                np.asarray(scales, dtype=np.float32).reshape(count, 3),
+            )
+        )
+        self.transforms.frombytes(block.astype(np.float32).tobytes())
+        return range(start, start + count)
+
+    def extend(self, other: ScenePlan):
+        """Hängt alle Objekte eines anderen Plans an (Tabellen werden neu gemappt)."""
+        prim_map = [self.primitives.intern(value) for value in other.primitives.values]
+        mat_map = [self.materials.intern(value) for value in other.materials.values]
+        coll_map = [self.collections.intern(value) for value in other.collections.values]
+        name_map = [self.name_patterns.intern(value) for value in other.name_patterns.values]
+
+        self.primitive_ids.extend(prim_map[idx] for idx in other.primitive_ids)
+        self.material_ids.extend(idx if idx == self.NO_MATERIAL else mat_map[idx] for idx in other.material_ids)
+        self.collection_ids.extend(coll_map[idx] for idx in other.collection_ids)
+        self.name_ids.extend(name_map[idx] for idx in other.name_ids)
+        self.serials.extend(other.serials)
+        self.transforms.extend(other.transforms)
+
+    def select(self, indices) -> ScenePlan:
+        """Neuer Plan mit den Objekten an ``indices`` (Reihenfolge bleibt erhalten)."""
+        indices = np.asarray(indices, dtype=np.int64)
+        subset = ScenePlan()
+        subset.primitives = self.primitives.copy()
+        subset.materials = self.materials.copy()
+        subset.collections = self.collections.copy()
+        subset.name_patterns = self.name_patterns.copy()
+
+        for attr, dtype in (
+            ("primitive_ids", np.uint32),
+            ("material_ids", np.int32),
+            ("collection_ids", np.uint32),
+            ("name_ids", np.uint32),
+            ("serials", np.uint32),
+        ):
+            column = np.frombuffer(getattr(self, attr), dtype=dtype)
+            getattr(subset, attr).frombytes(column[indices].tobytes())
+        subset.transforms.frombytes(self.transform_array()[indices].tobytes())
+        return subset
+
+    def transform_array(self) -> np.ndarray:
+        """Transforms als ``(n, 9)``-Float32-Sicht (Location, Rotation, Scale)."""
+        return np.frombuffer(self.transforms, dtype=np.float32).reshape(-1, TRANSFORM_STRIDE)
+
+    def name(self, index: int) -> str:
+        return self.name_patterns[self.name_ids[index]].format(i=self.serials[index])
+
+    def transform(self, index: int) -> tuple[Vec3, Vec3, Vec3]:
+        base = index * TRANSFORM_STRIDE
+        t = self.transforms[base : base + TRANSFORM_STRIDE]
+        return (t[0], t[1], t[2]), (t[3], t[4], t[5]), (t[6], t[7], t[8])
+
+    def get(self, index: int) -> PlannedObject:
+        mat_id = self.material_ids[index]
+        location, rotation, scale = self.transform(index)
+        return PlannedObject(
+            index=index,
+            name=self.name(index),
+            primitive=self.primitives[self.primitive_ids[index]],
+            material=None if mat_id == self.NO_MATERIAL else self.materials[mat_id],
+            collection=self.collections[self.collection_ids[index]],
+            location=location,
+            rotation=rotation,
+            scale=scale,
+        )
+
+    def __iter__(self) -> Iterator[PlannedObject]:
+        for index in range(len(self)):
+            yield self.get(index)
+
+    def summary(self) -> dict[str, dict[str, int]]:
+        """Objektanzahl pro Collection und pro Primitive-Typ."""
+        per_collection: dict[str, int] = {}
+        per_kind: dict[str, int] = {}
+        for coll_id, prim_id in zip(self.collection_ids, self.primitive_ids):
+            coll = self.collections[coll_id]
+            kind = self.primitives[prim_id].kind
+            per_collection[coll] = per_collection.get(coll, 0) + 1
+            per_kind[kind] = per_kind.get(kind, 0) + 1
+        return {"collections": per_collection, "primitives": per_kind}
+
+    def digest(self) -> str:
+        """Stabiler Hash über den gesamten Plan (für Diff/Cache)."""
+        h = hashlib.sha256()
+        for table in (self.primitives, self.materials, self.collections, self.name_patterns):
+            h.update(repr(table.values).encode("utf-8"))
+        for column in (
+            self.primitive_ids,
+            self.material_ids,
+            self.collection_ids,
+            self.name_ids,
+            self.serials,
+            self.transforms,
+        ):
+            h.update(column.tobytes())
+        return h.hexdigest()
+
+    def to_dict(self) -> dict:
+        """JSON-fähige Darstellung (Tabellen + Spalten)."""
+        return {
+            "primitives": [list(spec) for spec in self.primitives.values],
+            "materials": [list(spec) for spec in self.materials.values],
+            "collections": list(self.collections.values),
+            "name_patterns": list(self.name_patterns.values),
+            "primitive_ids": self.primitive_ids.tolist(),
+            "material_ids": self.material_ids.tolist(),
+            "collection_ids": self.collection_ids.tolist(),
+            "name_ids": self.name_ids.tolist(),
+            "serials": self.serials.tolist(),
+            "transforms": self.transforms.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ScenePlan:
+        plan = cls()
+        for kind, params, shared in data["primitives"]:
+            plan.primitives.intern(PrimitiveSpec(kind, _freeze(params), shared))
+        for factory, name, params in data["materials"]:
+            plan.materials.intern(MaterialSpec(factory, name, _freeze(params)))
+        for name in data["collections"]:
+            plan.collections.intern(name)
+        for pattern in data["name_patterns"]:
+            plan.name_patterns.intern(pattern)
+
+        plan.primitive_ids.extend(data["primitive_ids"])
+        plan.material_ids.extend(data["material_ids"])
+        plan.collection_ids.extend(data["collection_ids"])
+        plan.name_ids.extend(data["name_ids"])
+        plan.serials.extend(data["serials"])
+        plan.transforms.extend(data["transforms"])
+        return plan
@@ -0,0 +1,69 @@
+"""Geometrische Kennzahlen der Mesh-Primitives – ohne ``bpy``.
+
+Die Werte folgen den Standardparametern von ``bpy.ops.mesh.primitive_<kind>_add``
+bzw. ``scene_project.geometry`` und werden von Culling/LOD auf Plan-Ebene genutzt.
+"""
+
+from __future__ import annotations
+
+import math
+
+from scene_project.plan import PrimitiveSpec
+
+_DEFAULTS = {
+    "plane": {"size": 2.0},
+    "cube": {"size": 2.0},
+    "cylinder": {"vertices": 32, "radius": 1.0, "depth": 2.0},
+    "cone": {"vertices": 32, "radius1": 1.0, "radius2": 0.0, "depth": 2.0},
+    "uv_sphere": {"segments": 32, "ring_count": 16, "radius": 1.0},
+    "ico_sphere": {"subdivisions": 2, "radius": 1.0},
+    "torus": {"major_radius": 1.0, "minor_radius": 0.25, "major_segments": 48, "minor_segments": 12},
+}
+
+
+def primitive_params(spec: PrimitiveSpec) -> dict:
+    """Parameter des Primitives inklusive Standardwerten."""
+    params = dict(_DEFAULTS.get(spec.kind, {}))
+    params.update(spec.params)
+    return params
+
+
+def bounding_radius(spec: PrimitiveSpec) -> float:
+    """Radius der Bounding-Sphere um den Ursprung (vor Objekt-Scale)."""
+    p = primitive_params(spec)
+    kind = spec.kind
+    if kind == "plane":
+        return p["size"] * 0.5 * math.sqrt(2.0)
+    if kind == "cube":
+        return p["size"] * 0.5 * math.sqrt(3.0)
+    if kind == "cylinder":
+        return math.hypot(p["radius"], p["depth"] * 0.5)
+    if kind == "cone":
+        return math.hypot(max(p["radius1"], p["radius2"]), p["depth"] * 0.5)
+    if kind in ("uv_sphere", "ico_sphere"):
+        return p["radius"]
+    if kind == "torus":
+        return p["major_radius"] + p["minor_radius"]
+    raise ValueError(f"Unbekanntes Primitive '{kind}'.")
+
+
+def vertex_count(spec: PrimitiveSpec) -> int:
+    """Anzahl Vertices des erzeugten Meshes."""
+    p = primitive_params(spec)
+    kind = spec.kind
+    if kind == "plane":
+        return 4
+    if kind == "cube":
+        return 8
+    if kind == "cylinder":
+        return 2 * p["vertices"]
+    if kind == "cone":
+        caps = sum(1 for radius in (p["radius1"], p["radius2"]) if radius > 0.0)
+        return caps * p["vertices"] + (2 - caps)
+    if kind == "uv_sphere":
+        return p["segments"] * (p["ring_count"] - 1) + 2
+    if kind == "ico_sphere":
+        return 10 * 4 ** (p["subdivisions"] - 1) + 2
+    if kind == "torus":
+        return p["major_segments"] * p["minor_segments"]
+    raise ValueError(f"Unbekanntes Primitive '{kind}'.")
@@ -0,0 +1,211 @@
+"""Build-Profiler: Zeiten, Aufrufe, Datablocks und Speicher eines Builds als ``scene_summary.json``.
+
+Builder-Phasen in ``main.build_scene`` und die Schritte von ``apply.iter_apply_plan`` laufen
+in ``section``-Blöcken (Zeit + erzeugte Datablocks). Die ``plan_*``-Funktionen aus ``layout``
+und die Helfer aus ``materials``, ``lights``, ``instancing`` und ``animation`` sind mit
+``@profiled`` markiert (Zeit + Aufrufe). Ohne aktiven Profiler kosten beide nur eine
+Abfrage einer Modulvariable. ``bpy`` wird erst beim Zählen und im Report importiert, damit
+auch ``layout`` (ohne Blender) ``@profiled`` nutzen kann.
+
+Zeiten sind inklusive verschachtelter Abschnitte. ``tracemalloc`` verlangsamt Python-Code
+spürbar; absolute Zeiten eines Profil-Laufs sind daher nur untereinander vergleichbar.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import json
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+SUMMARY_FILE = "scene_summary.json"
+CPROFILE_FILE = "scene_profile.prof"
+# Gezählte bpy.data-Collections (Zählen kostet O(n), daher nur pro Abschnitt, nicht pro Helfer-Aufruf).
+DATABLOCKS = ("objects", "meshes", "materials", "lights", "cameras", "collections")
+
+_active: BuildProfiler | None = None
+
+
+class BuildProfiler:
+    """Sammelt Abschnitte (``section``) und Helfer-Aufrufe eines Builds."""
+
+    def __init__(self, cprofile: bool = False, hotspots: int = 20):
+        self.sections: dict[str, dict] = {}
+        self.hotspots = hotspots
+        self.profile = cProfile.Profile() if cprofile else None
+        self.started = 0.0
+        self.seconds = 0.0
+        self.peak_bytes = 0
+        self._own_tracing = False
+
+    def start(self):
+        self.started = time.perf_counter()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._own_tracing = True
+        tracemalloc.reset_peak()
+        if self.profile is not None:
+            self.profile.enable()
+
+    def stop(self):
+        if self.profile is not None:
+            self.profile.disable()
+        self.peak_bytes = tracemalloc.get_traced_memory()[1]
+        if self._own_tracing:
+            tracemalloc.stop()
+        self.seconds = time.perf_counter() - self.started
+
+    def record(self, name: str, seconds: float, datablocks: dict[str, int] | None = None):
+        entry = self.sections.setdefault(name, {"calls": 0, "seconds": 0.0})
+        entry["calls"] += 1
+        entry["seconds"] += seconds
+        for attr, delta in (datablocks or {}).items():
+            if delta:
+                created = entry.setdefault("datablocks", {})
+                created[attr] = created.get(attr, 0) + delta
+
+    def hotspot_rows(self) -> list[dict]:
+        """Die teuersten Funktionen nach Eigenzeit (nur mit cProfile)."""
+        if self.profile is None:
+            return []
+        stats = pstats.Stats(self.profile)
+        rows = []
+        for (filename, line, func), (_, calls, own, cumulative, _) in stats.stats.items():
+            rows.append(
+                {
+                    "function": f"{Path(filename).name}:{line}({func})",
+                    "calls": calls,
+                    "own_seconds": own,
+                    "cumulative_seconds": cumulative,
+                }
+            )
+        rows.sort(key=lambda row: row["own_seconds"], reverse=True)
+        return rows[: self.hotspots]
+
+
+def count_datablocks() -> dict[str, int]:
+    """Anzahl der Datablocks pro ``DATABLOCKS``-Eintrag."""
+    import bpy
+
+    return {attr: len(getattr(bpy.data, attr)) for attr in DATABLOCKS}
+
+
+@contextmanager
+def _timed(profiler: BuildProfiler, name: str, datablocks: bool):
+    before = count_datablocks() if datablocks else None
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - started
+        delta = None
+        if before is not None:
+            after = count_datablocks()
+            delta = {attr: after[attr] - before[attr] for attr in DATABLOCKS}
+        profiler.record(name, seconds, delta)
+
+
+def section(name: str, datablocks: bool = True):
+    """Kontextmanager für einen Build-Abschnitt; ohne aktiven Profiler ein No-op."""
+    if _active is None:
+        return nullcontext()
+    return _timed(_active, name, datablocks)
+
+
+def profiled(func):
+    """Dekorator: Laufzeit und Aufrufe einer Helfer-Funktion erfassen (``modul.funktion``)."""
+    name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _active is None:
+            return func(*args, **kwargs)
+        with _timed(_active, name, datablocks=False):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def profiling(profiler: BuildProfiler | None):
+    """Aktiviert ``profiler`` für die Dauer des Blocks (``None``: nichts tun)."""
+    global _active
+    if profiler is None:
+        yield None
+        return
+    previous, _active = _active, profiler
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        _active = previous
+
+
+def _mesh_totals(objects) -> dict[str, int]:
+    """Vertices/Faces über alle Mesh-Objekte (Instanzen zählen mehrfach) und über eindeutige Meshes."""
+    per_object = {"vertices": 0, "faces": 0}
+    unique: dict[int, tuple[int, int]] = {}
+    for obj in objects:
+        if obj.type != "MESH":
+            continue
+        mesh = obj.data
+        counts = unique.get(mesh.as_pointer())
+        if counts is None:
+            counts = unique[mesh.as_pointer()] = (len(mesh.vertices), len(mesh.polygons))
+        per_object["vertices"] += counts[0]
+        per_object["faces"] += counts[1]
+    per_object["unique_mesh_vertices"] = sum(vertices for vertices, _ in unique.values())
+    per_object["unique_mesh_faces"] = sum(faces for _, faces in unique.values())
+    return per_object
+
+
+def scene_summary(profiler: BuildProfiler, scene_name: str, builders: dict[str, tuple[str, ...]], config=None) -> dict:
+    """Report eines Builds: Abschnitte, Builder (Objekte, Vertices, Faces), Szenen-Summen, Hotspots."""
+    import bpy
+
+    per_builder = {}
+    for name, collections in builders.items():
+        objects = [
+            obj
+            for collection_name in collections
+            if (collection := bpy.data.collections.get(collection_name)) is not None
+            for obj in collection.objects
+        ]
+        per_builder[name] = {"collections": list(collections), "objects": len(objects), **_mesh_totals(objects)}
+
+    totals = {**count_datablocks(), **_mesh_totals(bpy.context.scene.objects)}
+    sections = dict(sorted(profiler.sections.items(), key=lambda item: item[1]["seconds"], reverse=True))
+    return {
+        "scene": scene_name,
+        "blender": bpy.app.version_string,
+        "wall_seconds": profiler.seconds,
+        "peak_python_bytes": profiler.peak_bytes,
+        "totals": totals,
+        "builders": per_builder,
+        "sections": sections,
+        "hotspots": profiler.hotspot_rows(),
+        "config": config or {},
+    }
+
+
+def write_summary(profiler: BuildProfiler, summary: dict, directory: str | Path) -> Path:
+    """Schreibt ``scene_summary.json`` (und ggf. ``scene_profile.prof``) nach ``directory``."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / SUMMARY_FILE
+    path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    if profiler.profile is not None:
+        profiler.profile.dump_stats(str(directory / CPROFILE_FILE))
+    return path
+
+
+def default_summary_dir() -> Path:
+    """Neben der gespeicherten ``.blend``, sonst das aktuelle Arbeitsverzeichnis."""
+    import bpy
+
+    return Path(bpy.path.abspath("//")) if bpy.data.filepath else Path.cwd()
@@ -0,0 +1,115 @@
+"""Progressive Builds in der Blender-Oberfläche: ``main.build_steps`` zeitgeteilt per ``bpy.app.timers``.
+
+Jeder Timer-Aufruf arbeitet Build-Schritte ab, bis ``budget_ms`` verbraucht sind, und gibt die
+Oberfläche dann bis zum nächsten Frame frei. Neue Objekte erscheinen sofort im Viewport, die
+Statusleiste zeigt Phase und Fortschritt. ``cancel_build`` (oder ein erneutes "Run Script")
+bricht ab; die Szene bleibt dann teilweise gebaut, und der nächste Build baut komplett neu.
+
+Im Hintergrund-Modus (``blender --background``) laufen keine Timer; dort bleibt ``build_scene``.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Iterable
+
+import bpy
+
+from scene_project.config import SceneConfig
+from scene_project.main import BuildProgress, build_steps
+
+# Rechenzeit pro Timer-Aufruf; der Rest des Frames bleibt für Eingaben und Viewport.
+FRAME_BUDGET_MS = 30.0
+
+# Laufender Build; überlebt ``importlib.reload`` wie ``hot_reload._fingerprints``.
+_build: dict | None = globals().get("_build")
+
+
+def is_running() -> bool:
+    """Ob gerade ein progressiver Build läuft."""
+    return _build is not None
+
+
+def start_build(
+    config: SceneConfig | None = None,
+    rebuild: Iterable[str] = (),
+    budget_ms: float = FRAME_BUDGET_MS,
+):
+    """Startet ``build_scene(config, rebuild)`` zeitgeteilt; ein laufender Build wird vorher abgebrochen."""
+    global _build
+
+    cancel_build()
+    cfg = config or SceneConfig()
+    _build = {
+        "steps": build_steps(cfg, rebuild),
+        "scene": cfg.scene_name.lower().strip(),
+        "budget": budget_ms / 1000.0,
+        "started": time.perf_counter(),
+        "busy": 0.0,
+    }
+    _set_status(f"Scene-Build '{_build['scene']}' startet …")
+    bpy.app.timers.register(_tick, first_interval=0.0)
+
+
+def cancel_build() -> bool:
+    """Bricht einen laufenden progressiven Build ab; ``False``, wenn keiner läuft."""
+    if _build is None:
+        return False
+    if bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.unregister(_tick)
+    _build["steps"].close()
+    _finish("abgebrochen")
+    return True
+
+
+def _tick() -> float | None:
+    if _build is None:
+        return None
+    started = time.perf_counter()
+    deadline = started + _build["budget"]
+    progress = None
+    try:
+        # Mindestens ein Schritt pro Aufruf, auch wenn ein einzelner Schritt das Budget sprengt.
+        while progress is None or time.perf_counter() < deadline:
+            progress = next(_build["steps"])
+    except StopIteration:
+        _build["busy"] += time.perf_counter() - started
+        _finish("fertig")
+        return None
+    except Exception:
+        _finish("fehlgeschlagen")
+        raise
+    _build["busy"] += time.perf_counter() - started
+    _show(progress)
+    # 0: direkt nach dem nächsten Event-/Redraw-Durchlauf weitermachen.
+    return 0.0
+
+
+def _show(progress: BuildProgress):
+    percent = f" ({progress.done / progress.total:.0%})" if progress.total else ""
+    _set_status(
+        f"Scene-Build '{_build['scene']}': {progress.stage} {progress.done}/{progress.total}{percent} – "
+        f"Abbrechen: scene_project.progressive.cancel_build() oder erneut Run Script"
+    )
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == "VIEW_3D":
+                area.tag_redraw()
+
+
+def _finish(outcome: str):
+    global _build
+
+    build, _build = _build, None
+    _set_status(None)
+    wall = time.perf_counter() - build["started"]
+    print(
+        f"[scene_project] Progressiver Build '{build['scene']}' {outcome}: {wall:.2f} s "
+        f"(davon {build['busy']:.2f} s Build-Arbeit)."
+    )
+
+
+def _set_status(text: str | None):
+    window_manager = bpy.context.window_manager
+    for window in window_manager.windows if window_manager is not None else ():
+        window.workspace.status_text_set(text)
@@ -0,0 +1,129 @@
+"""Render-Profile: Qualität/Laufzeit des Renderings pro Build wählbar.
+
+Ein Profil legt Engine, Auflösungs-Prozent, Samples, Bloom, die Glare-Qualität im
+Compositor (oder Bypass), Schattenauflösung und Volumetrik fest. ``apply_render_profile``
+setzt nur Eigenschaften, die es in der laufenden Blender-Version gibt (EEVEE-Legacy bis 3.6
+vs. EEVEE Next ab 4.2), und liefert die tatsächlich gesetzten Werte zurück.
+
+- ``preview``: Cycles auf der CPU, 25 %, 4 Samples, 1 Bounce, ohne Glare – läuft headless
+  ohne GPU in wenigen Sekunden
+- ``review``: EEVEE, 50 %, mittlere Qualität
+- ``final``: EEVEE, 100 %, Bloom und Glare ``HIGH`` wie bisher, dazu feinere Schatten und Volumetrik
+
+Ohne Profil (``render_profile=""``, Standard) setzt der Build keine Render-Einstellungen; es
+gilt, was die Szene selbst einrichtet (City: EEVEE, Bloom, Glare ``HIGH``; Wald: nichts).
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import bpy
+
+
+class RenderProfile(NamedTuple):
+    engine: str
+    resolution_percentage: int
+    samples: int
+    bloom: bool
+    # "LOW" | "MEDIUM" | "HIGH"; None = Glare-Nodes im Compositor überbrücken (mute)
+    glare_quality: str | None
+    shadow_resolution: int
+    volumetrics: bool
+    # Lichtpfad-Bounces (nur Cycles)
+    bounces: int = 12
+
+
+RENDER_PROFILES = {
+    # Renderzeit skaliert in Cycles fast linear mit den Samples; Standard-City mit 4 Samples ≈ 6 s auf einem Kern.
+    "preview": RenderProfile("CYCLES", 25, 4, False, None, 256, False, bounces=1),
+    "review": RenderProfile("BLENDER_EEVEE", 50, 16, True, "LOW", 512, False),
+    "final": RenderProfile("BLENDER_EEVEE", 100, 64, True, "HIGH", 2048, True),
+}
+
+
+def get_render_profile(name: str) -> RenderProfile:
+    profile = RENDER_PROFILES.get(name.lower().strip())
+    if profile is None:
+        supported = ", ".join(RENDER_PROFILES)
+        raise ValueError(f"Unbekanntes Render-Profil '{name}'. Erlaubt: {supported}")
+    return profile
+
+
+def engine_id(render, engine: str) -> str:
+    """Engine-Name der laufenden Version (``BLENDER_EEVEE`` heißt ab 4.2 ``BLENDER_EEVEE_NEXT``)."""
+    available = {item.identifier for item in render.bl_rna.properties["engine"].enum_items}
+    if engine not in available and f"{engine}_NEXT" in available:
+        return f"{engine}_NEXT"
+    return engine
+
+
+def _set(applied: dict, label: str, owner, attr: str, value):
+    if owner is not None and hasattr(owner, attr):
+        setattr(owner, attr, value)
+        applied[label] = value
+
+
+def apply_render_profile(name: str, scene=None) -> dict:
+    """Setzt das Profil ``name`` auf ``scene`` (Standard: aktive Szene).
+
+    Returns:
+        Gesetzte Einstellungen (``{"profile": name, "engine": ..., ...}``).
+    """
+    profile = get_render_profile(name)
+    scene = scene or bpy.context.scene
+    render = scene.render
+    eevee = scene.eevee
+    cycles = getattr(scene, "cycles", None)
+
+    applied = {"profile": name.lower().strip()}
+    _set(applied, "engine", render, "engine", engine_id(render, profile.engine))
+    _set(applied, "resolution_percentage", render, "resolution_percentage", profile.resolution_percentage)
+
+    if profile.engine == "CYCLES":
+        _set(applied, "samples", cycles, "samples", profile.samples)
+        _set(applied, "device", cycles, "device", "CPU")
+        _set(applied, "denoise", cycles, "use_denoising", False)
+        _set(applied, "bounces", cycles, "max_bounces", profile.bounces)
+        _set(applied, "volume_bounces", cycles, "volume_bounces", 1 if profile.volumetrics else 0)
+    else:
+        _set(applied, "samples", eevee, "taa_render_samples", profile.samples)
+        _set(applied, "volumetric_shadows", eevee, "use_volumetric_shadows", profile.volumetrics)
+        _set(applied, "volumetric_samples", eevee, "volumetric_samples", 64 if profile.volumetrics else 16)
+    _set(applied, "bloom", eevee, "use_bloom", profile.bloom)
+    _set(applied, "shadow_cube_size", eevee, "shadow_cube_size", str(profile.shadow_resolution))
+    _set(applied, "shadow_cascade_size", eevee, "shadow_cascade_size", str(profile.shadow_resolution))
+
+    glare_nodes = []
+    if scene.use_nodes and scene.node_tree is not None:
+        glare_nodes = [node for node in scene.node_tree.nodes if node.bl_idname == "CompositorNodeGlare"]
+    for node in glare_nodes:
+        node.mute = profile.glare_quality is None
+        if profile.glare_quality is not None:
+            node.quality = profile.glare_quality
+    if glare_nodes:
+        applied["glare"] = profile.glare_quality or "bypass"
+    return applied
+
+
+def describe(applied: dict) -> str:
+    """Einzeilige Beschreibung der gesetzten Profil-Werte für die Konsole."""
+    details = ", ".join(f"{key}={value}" for key, value in applied.items() if key != "profile")
+    return f"Render-Profil '{applied['profile']}': {details}"
+
+
+def render_still(path: str | Path, scene=None) -> dict:
+    """Rendert die aktive Kamera nach ``path`` und misst die Renderzeit."""
+    scene = scene or bpy.context.scene
+    render = scene.render
+    scale = render.resolution_percentage / 100.0
+    size = (int(render.resolution_x * scale), int(render.resolution_y * scale))
+
+    render.filepath = str(path)
+    started = time.perf_counter()
+    bpy.ops.render.render(write_still=True)
+    seconds = time.perf_counter() - started
+    print(f"[scene_project] Render {size[0]}x{size[1]} ({render.engine}): {seconds:.2f} s -> {path}")
+    return {"output": str(path), "engine": render.engine, "resolution": list(size), "render_seconds": seconds}
@@ -0,0 +1,171 @@
+"""Vektorisierte Scatter-Generatoren mit unabhängigen, geseedeten Streams (ohne ``bpy``).
+
+Jeder Builder bekommt seinen eigenen ``numpy.random.Generator``, abgeleitet aus dem
+Scene-Seed und einem festen Stream-Namen. Dadurch bleibt jedes Layout reproduzierbar,
+egal in welcher Reihenfolge (oder ob überhaupt) die anderen Builder laufen.
+
+Für Mindestabstände gibt es ``poisson_scatter``: Dart-Throwing gegen einen
+``SpatialHash`` (uniformes Grid). Jede Prüfung sieht nur die Nachbarzellen an, daher
+skaliert das linear mit der Anzahl Platzierungen. Exclusion-Zonen (Teich, Straßen,
+Tower-Footprints) werden ebenfalls im Grid einsortiert.
+"""
+
+from __future__ import annotations
+
+import math
+import zlib
+from typing import NamedTuple
+
+import numpy as np
+
+
+def scene_stream(seed: int, name: str) -> np.random.Generator:
+    """Unabhängiger Zufalls-Stream für ``name`` innerhalb der Szene ``seed``."""
+    return np.random.default_rng(np.random.SeedSequence([seed, zlib.crc32(name.encode("utf-8"))]))
+
+
+def scatter_xy(rng: np.random.Generator, count: int, half_extent: float) -> np.ndarray:
+    """Gleichverteilte XY-Positionen im Quadrat ``[-half_extent, half_extent]²`` als ``(count, 2)``."""
+    return rng.uniform(-half_extent, half_extent, size=(count, 2))
+
+
+def uniform_vec3(rng: np.random.Generator, count: int, low, high) -> np.ndarray:
+    """``(count, 3)``-Array mit komponentenweisen Grenzen ``low``/``high``."""
+    return rng.uniform(np.asarray(low, dtype=np.float64), np.asarray(high, dtype=np.float64), size=(count, 3))
+
+
+def ring_angles(rng: np.random.Generator, count: int, jitter: float) -> np.ndarray:
+    """Gleichmäßig verteilte Winkel auf einem Ring mit zufälligem Versatz ``±jitter``."""
+    return np.arange(count) / max(count, 1) * (2.0 * np.pi) + rng.uniform(-jitter, jitter, size=count)
+
+
+class RectZone(NamedTuple):
+    """Achsenparallele Sperrfläche (Straßen, Tower-Footprints)."""
+
+    cx: float
+    cy: float
+    half_x: float
+    half_y: float
+
+    def bounds(self) -> tuple[float, float, float, float]:
+        return self.cx - self.half_x, self.cy - self.half_y, self.cx + self.half_x, self.cy + self.half_y
+
+    def contains(self, x: float, y: float, margin: float = 0.0) -> bool:
+        return abs(x - self.cx) <= self.half_x + margin and abs(y - self.cy) <= self.half_y + margin
+
+
+class EllipseZone(NamedTuple):
+    """Elliptische Sperrfläche (Teich, Spire-Sockel)."""
+
+    cx: float
+    cy: float
+    rx: float
+    ry: float
+
+    def bounds(self) -> tuple[float, float, float, float]:
+        return self.cx - self.rx, self.cy - self.ry, self.cx + self.rx, self.cy + self.ry
+
+    def contains(self, x: float, y: float, margin: float = 0.0) -> bool:
+        dx = (x - self.cx) / (self.rx + margin)
+        dy = (y - self.cy) / (self.ry + margin)
+        return dx * dx + dy * dy <= 1.0
+
+
+class SpatialHash:
+    """Uniformes 2D-Grid für Abstandsprüfungen in O(1) pro Punkt.
+
+    Punkte tragen einen Radius; zwei Punkte kollidieren, wenn ihr Abstand kleiner als die
+    Summe der Radien ist. So lassen sich mehrere Prop-Klassen mit unterschiedlichen
+    Mindestabständen in einem Hash mischen.
+    """
+
+    def __init__(self, cell_size: float):
+        if cell_size <= 0.0:
+            raise ValueError("cell_size muss größer als 0 sein.")
+        self.cell_size = cell_size
+        self.max_radius = 0.0
+        self._points: dict[tuple[int, int], list[tuple[float, float, float]]] = {}
+        self._zones: dict[tuple[int, int], list] = {}
+        self.point_count = 0
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def add_zone(self, zone):
+        """Sortiert eine Sperrzone in alle Zellen ihrer Bounding-Box ein."""
+        min_x, min_y, max_x, max_y = zone.bounds()
+        ix0, iy0 = self._cell(min_x, min_y)
+        ix1, iy1 = self._cell(max_x, max_y)
+        for ix in range(ix0, ix1 + 1):
+            for iy in range(iy0, iy1 + 1):
+                self._zones.setdefault((ix, iy), []).append(zone)
+
+    def add_zones(self, zones):
+        for zone in zones:
+            self.add_zone(zone)
+
+    def insert(self, x: float, y: float, radius: float):
+        self._points.setdefault(self._cell(x, y), []).append((x, y, radius))
+        self.max_radius = max(self.max_radius, radius)
+        self.point_count += 1
+
+    def is_free(self, x: float, y: float, radius: float) -> bool:
+        """``True``, wenn ein Punkt mit ``radius`` weder Punkte noch Zonen berührt."""
+        ix, iy = self._cell(x, y)
+
+        zone_span = math.ceil(radius / self.cell_size)
+        for dx in range(-zone_span, zone_span + 1):
+            for dy in range(-zone_span, zone_span + 1):
+                for zone in self._zones.get((ix + dx, iy + dy), ()):
+                    if zone.contains(x, y, radius):
+                        return False
+
+        span = math.ceil((radius + self.max_radius) / self.cell_size)
+        for dx in range(-span, span + 1):
+            for dy in range(-span, span + 1):
+                for px, py, pr in self._points.get((ix + dx, iy + dy), ()):
+                    reach = pr + radius
+                    if (px - x) * (px - x) + (py - y) * (py - y) < reach * reach:
+                        return False
+        return True
+
+
+def poisson_scatter(
+    rng: np.random.Generator,
+    count: int,
+    half_extent: float,
+    min_spacing: float,
+    spatial_hash: SpatialHash | None = None,
+    zones=(),
+    max_attempts: int = 30,
+) -> np.ndarray:
+    """Poisson-Disk-Scatter im Quadrat ``[-half_extent, half_extent]²``.
+
+    Kandidaten werden batchweise vektorisiert gezogen und nacheinander gegen den Hash
+    geprüft. Passen nicht alle ``count`` Punkte hinein (zu dicht, zu viele Sperrflächen),
+    endet die Suche nach ``count * max_attempts`` Kandidaten mit weniger Punkten.
+
+    Args:
+        spatial_hash: Geteilter Hash, damit mehrere Prop-Klassen sich gegenseitig meiden.
+        zones: Zusätzliche Sperrzonen (werden in den Hash eingetragen).
+
+    Returns:
+        ``(n, 2)``-Array mit ``n <= count`` Positionen.
+    """
+    radius = min_spacing * 0.5
+    grid = spatial_hash or SpatialHash(cell_size=max(min_spacing, 1.0))
+    grid.add_zones(zones)
+
+    accepted: list[tuple[float, float]] = []
+    budget = count * max_attempts
+    while len(accepted) < count and budget > 0:
+        batch = min(budget, max(2 * (count - len(accepted)), 64))
+        budget -= batch
+        for x, y in rng.uniform(-half_extent, half_extent, size=(batch, 2)).tolist():
+            if grid.is_free(x, y, radius):
+                grid.insert(x, y, radius)
+                accepted.append((x, y))
+                if len(accepted) == count:
+                    break
+
+    return np.array(accepted, dtype=np.float64).reshape(-1, 2)
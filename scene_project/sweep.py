@@ -0,0 +1,366 @@
+"""Parameter-Sweeps über ``SceneConfig``: viele Varianten als ``.blend`` in parallelen Blender-Prozessen.
+
+Eine Spec (JSON) nennt pro Feld eine Liste oder einen Bereich::
+
+    {
+      "scene": "city",
+      "overrides": {"render_profile": "preview"},
+      "parameters": {
+        "city_grid_size": [4, 8, 16],
+        "city_max_height": {"min": 8, "max": 20, "steps": 3},
+        "scene_seed": [1, 2]
+      },
+      "sampling": "grid",
+      "render": true,
+      "output_dir": "sweeps/city"
+    }
+
+``sampling`` ist ``grid`` (kartesisches Produkt, Bereiche brauchen ``steps``) oder ``lhs``
+(Latin Hypercube mit ``samples`` Varianten und ``seed``). Werte werden auf den Typ des Felds
+gebracht; Varianten mit gleicher Config (ohne ``EXECUTION_FIELDS``) laufen nur einmal. Die ID
+einer Variante ist ein Hash ihrer Config und damit über Läufe hinweg stabil.
+
+Pro Variante schreibt ein Worker ``<id>.blend``, optional ``<id>.png`` und zuletzt
+``results/<id>.json``. Ein erneuter Start überspringt Varianten mit fertigem Ergebnis, ein
+abgebrochener Sweep setzt also einfach fort. ``index.json`` fasst alle Ergebnisse zusammen.
+
+Der Treiber braucht kein ``bpy``::
+
+    python -m scene_project.sweep sweep.json --workers 4 --blender /pfad/zu/blender
+    blender --background --factory-startup --python run_in_blender.py -- --sweep sweep.json --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import itertools
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import fields, replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from scene_project.build_cache import PACKAGE_DIR
+from scene_project.config import SceneConfig
+
+SAMPLINGS = ("grid", "lhs")
+ENTRY_SCRIPT = PACKAGE_DIR.parent / "run_in_blender.py"
+WORKER_ARG = "--sweep-worker"
+INDEX_FILE = "index.json"
+RESULTS_DIR = "results"
+# Felder, die nur beeinflussen, wie gebaut wird – nicht was. Zählen nicht für Duplikate.
+EXECUTION_FIELDS = (
+    "parallel_workers",
+    "profile",
+    "profile_dir",
+    "profile_cprofile",
+    "keep_caches_on_clear",
+    "incremental_build",
+    "build_cache",
+    "build_cache_dir",
+    "build_cache_max_mb",
+    "build_cache_mode",
+)
+# Varianten pro Worker-Prozess: aufeinanderfolgende Varianten bauen inkrementell.
+CHUNK_SIZE = 8
+
+
+def load_spec(path: str | Path) -> dict:
+    """Liest eine Sweep-Spec; ``output_dir`` wird relativ zur Spec aufgelöst (Standard: Spec-Name)."""
+    path = Path(path)
+    spec = json.loads(path.read_text(encoding="utf-8"))
+    if not spec.get("parameters"):
+        raise ValueError(f"Sweep-Spec '{path}' enthält keine Parameter")
+    output_dir = Path(spec.get("output_dir") or path.stem)
+    spec["output_dir"] = str(output_dir if output_dir.is_absolute() else path.parent / output_dir)
+    return spec
+
+
+def _coerce(value, default):
+    """Bringt ``value`` auf den Typ des Standardwerts (z. B. gerundete Ints aus Bereichen)."""
+    if isinstance(default, bool):
+        return bool(value)
+    if isinstance(default, int):
+        return int(round(value))
+    if isinstance(default, float):
+        return float(value)
+    if isinstance(default, tuple):
+        return list(value)
+    return value
+
+
+def _range(name: str, spec) -> tuple[float, float, int | None]:
+    if not isinstance(spec, dict) or "min" not in spec or "max" not in spec:
+        raise ValueError(f"Ungültiger Sweep-Parameter '{name}': erwartet Liste oder {{min, max[, steps]}}")
+    return spec["min"], spec["max"], spec.get("steps")
+
+
+def _grid_values(name: str, spec) -> list:
+    if isinstance(spec, list):
+        return spec
+    low, high, steps = _range(name, spec)
+    if not steps:
+        raise ValueError(f"Sweep-Parameter '{name}' braucht 'steps' für sampling='grid'")
+    return np.linspace(low, high, int(steps)).tolist()
+
+
+def _lhs_values(name: str, spec, strata: np.ndarray) -> list:
+    """Werte für Positionen ``strata`` in ``[0, 1)`` (ein Wert pro Stratum)."""
+    if isinstance(spec, list):
+        return [spec[int(u * len(spec))] for u in strata]
+    low, high, _ = _range(name, spec)
+    return (low + strata * (high - low)).tolist()
+
+
+def _config_key(cfg: SceneConfig) -> str:
+    values = {name: value for name, value in cfg.to_dict().items() if name not in EXECUTION_FIELDS}
+    return json.dumps(values, sort_keys=True)
+
+
+def expand(spec: dict) -> tuple[list[dict], int]:
+    """Varianten ``{"id", "overrides", "config"}`` einer Spec und die Zahl verworfener Duplikate."""
+    sampling = spec.get("sampling", "grid")
+    if sampling not in SAMPLINGS:
+        supported = ", ".join(SAMPLINGS)
+        raise ValueError(f"Unbekanntes Sampling '{sampling}'. Erlaubt: {supported}")
+
+    parameters = spec["parameters"]
+    names = sorted(parameters)
+    if sampling == "grid":
+        rows = itertools.product(*(_grid_values(name, parameters[name]) for name in names))
+    else:
+        samples = int(spec.get("samples", 16))
+        rng = np.random.default_rng(spec.get("seed", 0))
+        # Pro Parameter jedes der ``samples`` Strata genau einmal, in zufälliger Reihenfolge.
+        columns = [
+            _lhs_values(name, parameters[name], (rng.permutation(samples) + rng.uniform(size=samples)) / samples)
+            for name in names
+        ]
+        rows = zip(*columns)
+
+    scene = spec.get("scene") or "forest"
+    defaults = SceneConfig(scene_name=scene)
+    known = {field.name for field in fields(SceneConfig)}
+    variants, seen, duplicates = [], set(), 0
+    for row in rows:
+        overrides = dict(spec.get("overrides", {}))
+        for name, value in zip(names, row):
+            default = getattr(defaults, name) if name in known else None
+            overrides[name] = _coerce(value, default)
+        cfg = SceneConfig.from_overrides(scene, overrides)
+        key = _config_key(cfg)
+        if key in seen:
+            duplicates += 1
+            continue
+        seen.add(key)
+        variant_id = "v_" + hashlib.sha256(key.encode("utf-8")).hexdigest()[:12]
+        swept = {name: overrides[name] for name in names}
+        variants.append({"id": variant_id, "overrides": swept, "config": cfg.to_dict()})
+    return variants, duplicates
+
+
+def _results_dir(output_dir: str | Path) -> Path:
+    return Path(output_dir) / RESULTS_DIR
+
+
+def _read_results(output_dir: str | Path) -> dict[str, dict]:
+    results = {}
+    for path in sorted(_results_dir(output_dir).glob("*.json")):
+        try:
+            result = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # Unlesbares Ergebnis: Variante gilt als offen und wird neu gebaut.
+            continue
+        results[result["id"]] = result
+    return results
+
+
+def finished_results(output_dir: str | Path) -> dict[str, dict]:
+    """Ergebnisse fertiger Varianten: ``status == "done"`` und die ``.blend`` liegt noch da."""
+    return {
+        variant_id: result
+        for variant_id, result in _read_results(output_dir).items()
+        if result.get("status") == "done" and (Path(output_dir) / result["blend"]).is_file()
+    }
+
+
+def _write_json(path: Path, data: dict):
+    # Erst temporär schreiben, dann umbenennen: ein Abbruch hinterlässt nie eine halbe Datei.
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def default_blender() -> str | None:
+    """Blender-Binary für Worker: ``$BLENDER``, laufendes Blender oder ``blender`` im PATH."""
+    if os.environ.get("BLENDER"):
+        return os.environ["BLENDER"]
+    bpy = sys.modules.get("bpy")
+    binary = getattr(getattr(bpy, "app", None), "binary_path", "")
+    if binary and Path(binary).name.lower().startswith("blender"):
+        return binary
+    return shutil.which("blender")
+
+
+def worker_command(job_path: Path, blender: str | None) -> list[str]:
+    """Kommandozeile eines Workers; ohne Blender-Binary der aktuelle Interpreter (``bpy`` als Modul)."""
+    script_args = [str(ENTRY_SCRIPT), "--", WORKER_ARG, str(job_path)]
+    if blender:
+        return [blender, "--background", "--factory-startup", "--python", *script_args]
+    return [sys.executable, *script_args]
+
+
+def _start(job: dict, job_path: Path, blender: str | None):
+    job_path.write_text(json.dumps(job), encoding="utf-8")
+    # Ausgabe in eine Datei statt Pipe: ein volles Pipe-Puffer würde den Worker blockieren.
+    with open(job_path.with_suffix(".log"), "w", encoding="utf-8") as log:
+        return subprocess.Popen(worker_command(job_path, blender), stdout=log, stderr=subprocess.STDOUT)
+
+
+def run_sweep(spec: dict, workers: int = 2, blender: str | None = None) -> dict:
+    """Führt alle offenen Varianten in bis zu ``workers`` Prozessen aus und schreibt ``index.json``."""
+    variants, duplicates = expand(spec)
+    output_dir = Path(spec["output_dir"]).resolve()
+    _results_dir(output_dir).mkdir(parents=True, exist_ok=True)
+    done = finished_results(output_dir)
+    pending = [variant for variant in variants if variant["id"] not in done]
+    print(
+        f"[scene_project] Sweep: {len(variants)} Varianten ({duplicates} Duplikate verworfen), "
+        f"{len(variants) - len(pending)} schon fertig, {len(pending)} offen.",
+        flush=True,
+    )
+
+    # Zusammenhängende Blöcke: benachbarte Varianten unterscheiden sich oft nur in wenigen Feldern.
+    chunk = max(1, min(CHUNK_SIZE, math.ceil(len(pending) / max(1, workers))))
+    queue = [pending[start : start + chunk] for start in range(0, len(pending), chunk)]
+    job = {"output_dir": str(output_dir), "render": bool(spec.get("render", False))}
+    started = time.perf_counter()
+    failed_jobs = []
+    with tempfile.TemporaryDirectory(prefix="scene_project_sweep_") as tmp:
+        running: list[tuple[Path, subprocess.Popen]] = []
+        jobs_started = 0
+        try:
+            while queue or running:
+                while queue and len(running) < max(1, workers):
+                    job_path = Path(tmp) / f"job_{jobs_started}.json"
+                    jobs_started += 1
+                    running.append((job_path, _start(dict(job, variants=queue.pop(0)), job_path, blender)))
+                time.sleep(0.1)
+                for job_path, process in list(running):
+                    if process.poll() is None:
+                        continue
+                    running.remove((job_path, process))
+                    if process.returncode != 0:
+                        log = job_path.with_suffix(".log").read_text(encoding="utf-8", errors="replace")
+                        failed_jobs.append(log[-2000:])
+                        print(f"[scene_project] Sweep-Worker fehlgeschlagen (Exit {process.returncode}).", flush=True)
+                    finished = len(finished_results(output_dir))
+                    print(f"[scene_project] Sweep: {finished}/{len(variants)} fertig.", flush=True)
+        except KeyboardInterrupt:
+            for _, process in running:
+                process.kill()
+                process.wait()
+            write_index(spec, variants, duplicates, time.perf_counter() - started)
+            print("[scene_project] Sweep unterbrochen; ein erneuter Start setzt bei offenen Varianten fort.")
+            raise
+
+    index = write_index(spec, variants, duplicates, time.perf_counter() - started)
+    if failed_jobs:
+        print(f"[scene_project] Letzte Worker-Ausgabe:\n{failed_jobs[-1]}")
+    return index
+
+
+def write_index(spec: dict, variants: list[dict], duplicates: int, wall_seconds: float) -> dict:
+    """Fasst die Ergebnisdateien aller Varianten in ``index.json`` zusammen."""
+    output_dir = Path(spec["output_dir"]).resolve()
+    results = _read_results(output_dir)
+    entries = [
+        {"overrides": variant["overrides"], **results.get(variant["id"], {"id": variant["id"], "status": "pending"})}
+        for variant in variants
+    ]
+    counts = {status: sum(entry["status"] == status for entry in entries) for status in ("done", "failed", "pending")}
+    index = {
+        "scene": spec.get("scene") or "forest",
+        "sampling": spec.get("sampling", "grid"),
+        "updated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "duplicates": duplicates,
+        "counts": counts,
+        "wall_seconds": wall_seconds,
+        "variants": entries,
+    }
+    path = output_dir / INDEX_FILE
+    _write_json(path, index)
+    print(
+        f"[scene_project] Sweep-Index: {counts['done']} fertig, {counts['failed']} fehlgeschlagen, "
+        f"{counts['pending']} offen ({wall_seconds:.1f} s) -> {path}"
+    )
+    return index
+
+
+def run_job(job_path: str | Path):
+    """Einstieg eines Worker-Prozesses (in Blender): Varianten bauen, speichern, optional rendern."""
+    # Erst hier importieren: der Treiber läuft ohne Blender.
+    import bpy
+
+    from scene_project.main import build_scene
+    from scene_project.parallel import scene_digest
+    from scene_project.profiler import count_datablocks
+    from scene_project.render import render_still
+
+    job = json.loads(Path(job_path).read_text(encoding="utf-8"))
+    output_dir = Path(job["output_dir"])
+    for variant in job["variants"]:
+        cfg = SceneConfig.from_dict(variant["config"])
+        # Ein Prozess pro Worker reicht; ".blend" muss ohne verlinkte Cache-Dateien auskommen.
+        cfg = replace(cfg, parallel_workers=0, incremental_build=True, build_cache_mode="append")
+        result = {"id": variant["id"], "status": "failed"}
+        try:
+            started = time.perf_counter()
+            build_scene(cfg)
+            result["build_seconds"] = time.perf_counter() - started
+
+            blend = output_dir / f"{variant['id']}.blend"
+            started = time.perf_counter()
+            bpy.ops.wm.save_as_mainfile(filepath=str(blend), copy=True)
+            result["save_seconds"] = time.perf_counter() - started
+            result["blend"] = blend.name
+            if job.get("render"):
+                render = render_still(output_dir / f"{variant['id']}.png")
+                result["render"] = Path(render["output"]).name
+                result["render_seconds"] = render["render_seconds"]
+            result["stats"] = count_datablocks()
+            result["digest"] = scene_digest()
+            result["status"] = "done"
+        except Exception as error:
+            # Eine kaputte Variante (z. B. unmögliche Geometrie) stoppt nicht den ganzen Sweep.
+            result["error"] = f"{type(error).__name__}: {error}"
+            print(f"[scene_project] Sweep-Variante {variant['id']} fehlgeschlagen: {result['error']}")
+        _write_json(_results_dir(output_dir) / f"{variant['id']}.json", result)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Parameter-Sweep über SceneConfig-Felder.")
+    parser.add_argument("spec", help="Sweep-Spec (JSON) mit 'parameters'")
+    parser.add_argument("--workers", type=int, default=2, help="gleichzeitige Blender-Prozesse")
+    parser.add_argument("--blender", default=None, help="Blender-Binary (Standard: $BLENDER bzw. PATH)")
+    parser.add_argument("--output-dir", default=None, help="überschreibt 'output_dir' aus der Spec")
+    args = parser.parse_args(argv)
+
+    spec = load_spec(args.spec)
+    if args.output_dir:
+        spec["output_dir"] = args.output_dir
+    index = run_sweep(spec, workers=args.workers, blender=args.blender or default_blender())
+    return 1 if index["counts"]["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())